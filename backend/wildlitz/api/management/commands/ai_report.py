@@ -0,0 +1,112 @@
+# backend/wildlitz/api/management/commands/ai_report.py
+"""
+Print the AI telemetry report of a running server.
+
+Telemetry lives in the memory of the server process, so the report is read
+from its /api/ai/metrics/ endpoint.
+
+    python manage.py ai_report
+    python manage.py ai_report --url https://example.com/api/ai/metrics/ --sort cost
+"""
+
+import json
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+
+SORT_KEYS = {
+    'cost': 'cost_usd',
+    'calls': 'calls',
+    'latency': 'p95_latency_ms',
+    'tokens': 'completion_tokens',
+}
+
+
+class Command(BaseCommand):
+    help = 'Report model calls, tokens, latency, retries, fallbacks and cost per endpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://localhost:8000/api/ai/metrics/',
+                            help='Metrics endpoint of the running server')
+        parser.add_argument('--sort', choices=sorted(SORT_KEYS), default='cost',
+                            help='Order of the call site table')
+        parser.add_argument('--json', action='store_true', help='Print the raw JSON report')
+
+    def handle(self, *args, **options):
+        try:
+            with urlopen(options['url'], timeout=10) as response:
+                report = json.loads(response.read().decode('utf-8'))
+        except (URLError, ValueError) as e:
+            raise CommandError(f"Could not read metrics from {options['url']}: {e}")
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        totals = report['totals']
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"AI usage over the last {report['uptime_seconds'] / 3600:.1f}h"
+        ))
+        self.stdout.write(
+            f"  calls={totals['calls']}  cache_hits={totals['cache_hits']}  errors={totals['errors']}  "
+            f"retries={totals['retries']}  fallbacks={totals['fallbacks']}"
+        )
+        self.stdout.write(
+            f"  tokens={totals['prompt_tokens']} prompt ({totals.get('cached_prompt_tokens', 0)} cached) / "
+            f"{totals['completion_tokens']} completion  cost=${totals['cost_usd']:.4f}"
+        )
+
+        self._table('Endpoints', report['endpoints'], [
+            ('endpoint', 'ENDPOINT', 36),
+            ('requests', 'REQS', 6),
+            ('calls_per_request', 'CALLS/REQ', 9),
+            ('retries', 'RETRIES', 7),
+            ('fallbacks', 'FALLBACKS', 9),
+            ('fallback_rate', 'FB RATE', 7),
+            ('avg_duration_ms', 'AVG MS', 9),
+        ])
+
+        calls = sorted(report['calls'], key=lambda row: row[SORT_KEYS[options['sort']]], reverse=True)
+        self._table('Call sites', calls, [
+            ('endpoint', 'ENDPOINT', 28),
+            ('template', 'TEMPLATE', 44),
+            ('model', 'MODEL', 14),
+            ('calls', 'CALLS', 6),
+            ('retries', 'RETRY', 5),
+            ('cache_hits', 'HITS', 5),
+            ('errors', 'ERR', 4),
+            ('avg_prompt_tokens', 'AVG IN', 7),
+            ('prompt_cache_rate', 'IN CACHED', 9),
+            ('completion_tokens', 'OUT TOK', 8),
+            ('p95_latency_ms', 'P95 MS', 8),
+            ('cost_usd', 'COST $', 9),
+        ])
+
+        self._table('Fallbacks', report['fallbacks'], [
+            ('endpoint', 'ENDPOINT', 36),
+            ('fallback', 'FALLBACK', 40),
+            ('count', 'COUNT', 6),
+        ])
+
+        self._table('Prompt budgets', report.get('prompt_budgets', []), [
+            ('template', 'TEMPLATE', 44),
+            ('budget_tokens', 'BUDGET', 7),
+            ('overruns', 'OVERRUNS', 8),
+            ('max_overrun_tokens', 'MAX TOK', 8),
+        ])
+
+    def _table(self, title, rows, columns):
+        self.stdout.write('')
+        self.stdout.write(self.style.MIGRATE_HEADING(title))
+        if not rows:
+            self.stdout.write('  (none)')
+            return
+        self.stdout.write('  ' + ' '.join(label.ljust(width) for _, label, width in columns))
+        for row in rows:
+            cells = []
+            for key, _, width in columns:
+                value = row.get(key, '')
+                text = f"{value:.4f}" if isinstance(value, float) and key == 'cost_usd' else str(value)
+                cells.append(text[:width].ljust(width))
+            self.stdout.write('  ' + ' '.join(cells))
@@ -0,0 +1,67 @@
+# backend/wildlitz/api/management/commands/ai_stub_server.py
+"""
+Run a local OpenAI-compatible stub for offline load testing.
+
+    # 1. record real completions while playing through the games
+    AI_RECORD_DIR=ai_fixtures python manage.py runserver
+
+    # 2. replay them (synthesizing the rest) with a 600ms median latency and 2% errors
+    python manage.py ai_stub_server --fixtures ai_fixtures --latency-ms 600 --error-rate 0.02 --seed 1
+
+    # 3. point the backend at the stub
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 python manage.py runserver
+"""
+
+from django.core.management.base import BaseCommand
+
+from utils.ai_stub import StubConfig, run_stub_server
+
+
+class Command(BaseCommand):
+    help = 'Serve recorded or synthesized chat completions through an OpenAI-compatible API'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--fixtures', default='', help='Directory written by AI_RECORD_DIR')
+        parser.add_argument('--miss', choices=['synthesize', 'error'], default='synthesize',
+                            help='What to do for prompts without a recording')
+        parser.add_argument('--latency', choices=['lognormal', 'uniform', 'fixed', 'recorded'], default='lognormal',
+                            help='Latency distribution (recorded replays the latency captured with the fixture)')
+        parser.add_argument('--latency-ms', type=float, default=800.0,
+                            help='Median (lognormal), mean (uniform) or exact (fixed) latency')
+        parser.add_argument('--latency-sigma', type=float, default=0.5, help='Lognormal tail width')
+        parser.add_argument('--stream-chunk-ms', type=float, default=15.0, help='Delay between streamed chunks')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of 500 responses')
+        parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of 429 responses')
+        parser.add_argument('--hang-rate', type=float, default=0.0, help='Fraction of requests that never answer')
+        parser.add_argument('--hang-seconds', type=float, default=120.0)
+        parser.add_argument('--seed', type=int, default=None, help='Seed for reproducible latency and errors')
+
+    def handle(self, *args, **options):
+        config = StubConfig(
+            fixture_dir=options['fixtures'],
+            latency=options['latency'],
+            latency_ms=options['latency_ms'],
+            latency_sigma=options['latency_sigma'],
+            error_rate=options['error_rate'],
+            rate_limit_rate=options['rate_limit_rate'],
+            hang_rate=options['hang_rate'],
+            hang_seconds=options['hang_seconds'],
+            stream_chunk_ms=options['stream_chunk_ms'],
+            on_miss=options['miss'],
+            seed=options['seed'],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🧪 AI stub listening on http://{options['host']}:{options['port']}/v1 "
+            f"({len(config.fixtures)} recorded prompts, {options['latency']} latency ~{options['latency_ms']:.0f}ms)"
+        ))
+        self.stdout.write(f"   Set OPENAI_BASE_URL=http://{options['host']}:{options['port']}/v1 on the backend")
+        self.stdout.write(f"   Counters: GET http://{options['host']}:{options['port']}/v1/stats")
+
+        try:
+            run_stub_server(config, options['host'], options['port'])
+        except KeyboardInterrupt:
+            self.stdout.write('')
+            self.stdout.write(f"Stopped. {config.stats}")
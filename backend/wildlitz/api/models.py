@@ -103,4 +103,24 @@ class UserSession(models.Model):
             self.save()
     
     def __str__(self):
-        return f"{self.user.email} - {self.login_time.strftime('%Y-%m-%d %H:%M')}"
\ No newline at end of file
+        return f"{self.user.email} - {self.login_time.strftime('%Y-%m-%d %H:%M')}"
+
+class AIResponseCache(models.Model):
+    """Persistent cache of AI completions keyed by a hash of the request"""
+    
+    cache_key = models.CharField(max_length=64, unique=True)  # sha256 of (model, messages, temperature, max_tokens)
+    namespace = models.CharField(max_length=100, blank=True)  # Call site that stored the entry
+    model = models.CharField(max_length=100)
+    response = models.TextField()
+    size_bytes = models.PositiveIntegerField(default=0)
+    hit_count = models.PositiveIntegerField(default=0)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_accessed = models.DateTimeField(db_index=True)  # Used for LRU eviction
+    expires_at = models.DateTimeField(db_index=True)
+    
+    class Meta:
+        db_table = 'ai_response_cache'
+    
+    def __str__(self):
+        return f"{self.namespace or self.model} - {self.cache_key[:12]} ({self.hit_count} hits)"
@@ -21,4 +21,8 @@ urlpatterns = [
     path('get-my-progress-summary/', views.get_my_progress_summary, name='get_my_progress_summary'),
     path('get-my-accuracy-over-time/', views.get_my_accuracy_over_time, name='get_my_accuracy_over_time'),
     path('get-my-most-missed-words/', views.get_my_most_missed_words, name='get_my_most_missed_words'),
+    
+    # AI service metrics
+    path('ai/cache-stats/', views.get_ai_cache_stats, name='get_ai_cache_stats'),
+    path('ai/metrics/', views.get_ai_metrics, name='get_ai_metrics'),
 ]
\ No newline at end of file
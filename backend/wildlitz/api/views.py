@@ -395,4 +395,60 @@ def get_my_most_missed_words(request):
 
     except Exception as e:
         logger.error(f"Error in get_my_most_missed_words for user {user.id}: {str(e)}")
-        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+# ==========================================
+# AI SERVICE METRICS
+# ==========================================
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_ai_cache_stats(request):
+    """
+    Get hit-rate metrics for the persistent AI response cache and
+    in-flight request coalescing.
+    Counters are per worker process; size figures come from the cache table.
+    """
+    from utils.ai_cache import get_cache_stats
+    from utils.ai_client import in_flight_completions
+
+    try:
+        stats = get_cache_stats()
+        stats['single_flight'] = in_flight_completions.stats()
+        return Response(stats)
+    except Exception as e:
+        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_ai_metrics(request):
+    """
+    Get per-endpoint model usage: calls, tokens, latency, retries,
+    fallbacks and estimated cost.
+    Collected in memory by this worker process since it started.
+    """
+    from phonics.analytics_cache import analytics_snapshots
+    from phonics.word_bank import get_word_bank_stats
+    from phonics.word_pools import word_pools
+    from utils.ai_client import provider_breaker
+    from utils.ai_routing import get_routing_stats
+    from utils.ai_scheduler import scheduler
+    from utils.ai_telemetry import get_report
+    from utils.hedging import hedger
+    from utils.prompt_budget import get_budget_stats
+
+    try:
+        report = get_report()
+        report['routing'] = get_routing_stats()
+        report['circuit_breaker'] = provider_breaker.stats()
+        report['prompt_budgets'] = get_budget_stats()
+        report['hedging'] = hedger.stats()
+        report['scheduler'] = scheduler.stats()
+        report['phonics_word_pools'] = word_pools.stats()
+        report['phonics_word_bank'] = get_word_bank_stats()
+        report['phonics_analytics_snapshots'] = analytics_snapshots.stats()
+        return Response(report)
+    except Exception as e:
+        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
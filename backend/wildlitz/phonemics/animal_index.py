@@ -0,0 +1,201 @@
+# backend/wildlitz/phonemics/animal_index.py
+"""
+In-memory index of the safari_animals catalog.
+
+The catalog is a few hundred rows that change rarely, so each worker loads
+it once and answers the Sound Safari lookups from memory. Every row is
+filed under all 16 combinations of (target_sound, sound_position,
+environment, difficulty_level) with each field either set or "any", so a
+lookup with any mix of filters is one dict access plus the exclusion
+filter. The same pass builds the feasibility matrix: the number of
+distinct animal names per (sound, position, environment, difficulty),
+wildcards included, which round planning uses to skip combinations the
+catalog cannot fill.
+
+The index is reloaded when the catalog changes: every
+SAFARI_ANIMAL_INDEX_CHECK_SECONDS a background check compares the row
+count and latest updated_at with the loaded ones, writes made through this
+backend (update_animal_images, the Django admin) invalidate it directly, and
+SAFARI_ANIMAL_INDEX_MAX_AGE_SECONDS bounds staleness if the check cannot
+tell. Lookups keep using the loaded rows while a reload runs.
+"""
+
+import logging
+import threading
+import time
+from itertools import product
+
+from django.conf import settings
+
+from utils import fanout
+from utils.supabase_client import supabase
+
+logger = logging.getLogger(__name__)
+
+INDEX_FIELDS = ('target_sound', 'sound_position', 'environment', 'difficulty_level')
+PAGE_SIZE = 1000
+
+ANY = None
+
+
+def _index_keys(animal):
+    """Every (sound, position, environment, difficulty) key a row answers, with ANY wildcards"""
+    values = [animal.get(field) for field in INDEX_FIELDS]
+    return product(*[(value, ANY) for value in values])
+
+
+class SafariAnimalIndex:
+    """safari_animals rows by any combination of sound, position, environment and difficulty"""
+
+    def __init__(self, check_interval=60, max_age=3600):
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._buckets = None
+        self._counts = {}
+        self._animals = ()
+        self._version = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._refreshing = False
+        self._stats = {'loads': 0, 'checks': 0, 'invalidations': 0, 'errors': 0}
+
+    def _fetch_rows(self):
+        rows = []
+        while True:
+            response = supabase.table('safari_animals').select('*')\
+                .order('id')\
+                .range(len(rows), len(rows) + PAGE_SIZE - 1)\
+                .execute()
+            page = response.data or []
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                return rows
+
+    def _fetch_version(self):
+        """(row count, latest updated_at) of the table, or None if it cannot be read"""
+        try:
+            response = supabase.table('safari_animals').select('updated_at', count='exact')\
+                .order('updated_at', desc=True)\
+                .limit(1)\
+                .execute()
+            latest = response.data[0]['updated_at'] if response.data else None
+            return (response.count, latest)
+        except Exception as e:
+            logger.warning(f"⚠️ Safari animal catalog version check failed: {str(e)}")
+            return None
+
+    def _build(self, rows, version):
+        buckets = {}
+        for animal in rows:
+            for key in _index_keys(animal):
+                buckets.setdefault(key, []).append(animal)
+        buckets = {key: tuple(animals) for key, animals in buckets.items()}
+        counts = {key: len({animal.get('name') for animal in animals}) for key, animals in buckets.items()}
+
+        with self._lock:
+            self._buckets = buckets
+            self._counts = counts
+            self._animals = tuple(rows)
+            self._version = version
+            self._loaded_at = self._checked_at = time.monotonic()
+            self._stats['loads'] += 1
+        logger.info(f"🦁 Indexed {len(rows)} safari animals")
+
+    def load(self):
+        """Read the whole catalog and rebuild the index"""
+        version = self._fetch_version()
+        self._build(self._fetch_rows(), version)
+
+    def _refresh(self):
+        """Reload if the catalog changed (or the index is too old to trust)"""
+        try:
+            with self._lock:
+                self._stats['checks'] += 1
+                too_old = time.monotonic() - self._loaded_at >= self.max_age
+                loaded_version = self._version
+            version = self._fetch_version()
+            if too_old or version is None or version != loaded_version:
+                self._build(self._fetch_rows(), version)
+            else:
+                with self._lock:
+                    self._checked_at = time.monotonic()
+        except Exception as e:
+            logger.warning(f"⚠️ Safari animal index refresh failed, keeping loaded rows: {str(e)}")
+            with self._lock:
+                self._stats['errors'] += 1
+                self._checked_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _ensure_loaded(self):
+        """Load on first use; afterwards check for changes in the background"""
+        if self._buckets is None:
+            with self._load_lock:
+                if self._buckets is None:
+                    self.load()
+            return
+
+        with self._lock:
+            if self._refreshing or time.monotonic() - self._checked_at < self.check_interval:
+                return
+            self._refreshing = True
+        fanout.start(self._refresh, name='safari-animal-index')
+
+    def invalidate(self):
+        """Reload on the next lookup (after a write to the catalog)"""
+        with self._lock:
+            self._checked_at = 0.0
+            self._loaded_at = 0.0
+            self._stats['invalidations'] += 1
+
+    def find(self, target_sound=ANY, sound_position=ANY, environment=ANY, difficulty=ANY,
+             exclude_ids=(), exclude_names=()):
+        """
+        Animals matching every filter given (ANY/None/'' means any value)
+
+        Args:
+            exclude_ids: Row ids to leave out (compared as strings)
+            exclude_names: Names to leave out
+
+        Returns:
+            list: Matching rows in catalog (id) order; treat them as read-only
+        """
+        self._ensure_loaded()
+        key = (target_sound or ANY, sound_position or ANY, environment or ANY, difficulty or ANY)
+        animals = self._buckets.get(key, ())
+
+        if exclude_ids or exclude_names:
+            exclude_ids = {str(animal_id) for animal_id in exclude_ids}
+            exclude_names = set(exclude_names)
+            return [
+                animal for animal in animals
+                if str(animal.get('id')) not in exclude_ids and animal.get('name') not in exclude_names
+            ]
+        return list(animals)
+
+    def candidate_count(self, target_sound=ANY, sound_position=ANY, environment=ANY, difficulty=ANY):
+        """Distinct animal names matching the filters, from the feasibility matrix"""
+        self._ensure_loaded()
+        return self._counts.get((target_sound or ANY, sound_position or ANY, environment or ANY, difficulty or ANY), 0)
+
+    def animals(self):
+        """The whole catalog"""
+        self._ensure_loaded()
+        return list(self._animals)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['animals'] = len(self._animals)
+            stats['feasibility_cells'] = len(self._counts)
+            stats['age_seconds'] = round(time.monotonic() - self._loaded_at, 1) if self._buckets is not None else None
+        return stats
+
+
+animal_index = SafariAnimalIndex(
+    check_interval=getattr(settings, 'SAFARI_ANIMAL_INDEX_CHECK_SECONDS', 60),
+    max_age=getattr(settings, 'SAFARI_ANIMAL_INDEX_MAX_AGE_SECONDS', 3600),
+)
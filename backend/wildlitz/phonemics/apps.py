@@ -1,6 +1,20 @@
 # backend/wildlitz/phonemics/apps.py
 from django.apps import AppConfig
 
+
+def _invalidate_animal_index(**kwargs):
+    from .animal_index import animal_index
+    animal_index.invalidate()
+
+
 class SoundSafariConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'phonemics'
\ No newline at end of file
+    name = 'phonemics'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from .models import SafariAnimal
+
+        # Catalog edits made through Django (e.g. the admin) reload the in-memory index
+        post_save.connect(_invalidate_animal_index, sender=SafariAnimal, dispatch_uid='safari_animal_index_save')
+        post_delete.connect(_invalidate_animal_index, sender=SafariAnimal, dispatch_uid='safari_animal_index_delete')
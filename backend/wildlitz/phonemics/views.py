@@ -14,6 +14,7 @@ import time
 from django.conf import settings
 import logging
 from utils.supabase_client import supabase
+from .animal_index import animal_index
 
 
 # Import progress tracking
@@ -21,21 +22,21 @@ from api.models import UserProgress, UserActivity
 
 logger = logging.getLogger(__name__)
 
-# ============================================================
-# EXCLUDED COMBINATIONS (Too few animals - only 2 each)
-# ============================================================
-EXCLUDED_COMBINATIONS = [
-    ('w', 'ending'),      # w-ending: only 2 animals (Cow, Sparrow)
-    ('b', 'ending'),      # b-ending: only 2 animals (Lamb, Cub)
-    ('f', 'ending'),      # f-ending: only 2 animals (Wolf, Giraffe)
-    ('z', 'beginning'),   # z-beginning: only 2 animals (Zebra, Zebu)
-    ('z', 'ending'),
-    ('c', 'ending'),
-]
+# ✅ CORE SOUNDS used for Sound Safari rounds
+CORE_SOUNDS = ['g', 'k', 'w', 'd', 'r', 'c', 'h', 's', 'm', 't', 'b', 'p', 'f', 'l', 'z']
 
-def is_combination_excluded(sound, position):
-    """Check if a sound-position combination should be excluded from game rounds"""
-    return (sound, position) in EXCLUDED_COMBINATIONS
+def is_combination_excluded(sound, position, difficulty='easy'):
+    """
+    Check if a sound-position combination should be excluded from game rounds
+    
+    A combination is excluded when the catalog has fewer animals for it than the
+    difficulty's min_correct, counted by the animal index's feasibility matrix
+    (so it follows the data as animals are added).
+    """
+    if not position or position == 'anywhere':
+        return False
+    required = get_difficulty_requirements(difficulty)['min_correct']
+    return animal_index.candidate_count(sound, position) < required
 
 # Image utility functions for the new Supabase storage structure
 SUPABASE_STORAGE_BASE_URL = "https://eixryunajxcthprajaxk.supabase.co/storage/v1/object/public/IMG/SoundSafariAnimals/"
@@ -163,6 +164,8 @@ def get_safari_animals_by_sound(request):
     """
     Get animals for a specific sound and difficulty from Supabase.
     Uses 20-level cascading fallback strategy to GUARANTEE animals are always returned.
+    The cascade runs against the in-memory catalog index (phonemics/animal_index.py),
+    so it costs no database round trips.
     """
     target_sound = request.GET.get('sound', 's')
     difficulty = request.GET.get('difficulty', 'easy')
@@ -170,352 +173,84 @@ def get_safari_animals_by_sound(request):
     sound_position = request.GET.get('position', '')
     exclude_ids = request.GET.getlist('exclude[]', [])
 
-    # ✅ Check if this combination is excluded (too few animals)
-    if sound_position and is_combination_excluded(target_sound, sound_position):
-        logger.warning(f"⚠️ Excluded combination requested: {target_sound}-{sound_position}")
-        return Response({
-            'success': False,
-            'error': f'Combination {target_sound}-{sound_position} is excluded (insufficient animals)',
-            'animals': [],
-            'excluded': True
-        }, status=status.HTTP_400_BAD_REQUEST)
-    
-    # ✅ CORE SOUNDS FILTER
-    CORE_SOUNDS = ['g', 'k', 'w', 'd', 'r', 'c', 'h', 's', 'm', 't', 'b', 'p', 'f', 'l', 'z']
-    
-    if target_sound not in CORE_SOUNDS:
-        logger.warning(f"Invalid sound requested: {target_sound}. Using 's' as fallback.")
-        target_sound = 's'
-    
     try:
+        # ✅ Check if this combination is excluded (too few animals)
+        # (reads the catalog index, which loads it on first use)
+        if sound_position and is_combination_excluded(target_sound, sound_position, difficulty):
+            logger.warning(f"⚠️ Excluded combination requested: {target_sound}-{sound_position}")
+            return Response({
+                'success': False,
+                'error': f'Combination {target_sound}-{sound_position} is excluded (insufficient animals)',
+                'animals': [],
+                'excluded': True
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # ✅ CORE SOUNDS FILTER
+        if target_sound not in CORE_SOUNDS:
+            logger.warning(f"Invalid sound requested: {target_sound}. Using 's' as fallback.")
+            target_sound = 's'
+        
         # ============================================================
-        # STRATEGY: Try 20 different queries with decreasing specificity
-        # until we find animals. This GUARANTEES we always return animals.
+        # STRATEGY: Try 20 lookups with decreasing specificity until we
+        # find animals. This GUARANTEES we always return animals.
+        # All lookups run against the in-memory catalog index.
         # ============================================================
         
+        has_position = bool(sound_position) and sound_position != 'anywhere'
+        position_filter = sound_position if has_position else None
+        environment_filter = environment or None
+        difficulty_filter = difficulty if difficulty != 'hard' else None
+        
+        # (strategy, applies, filters, apply exclude_ids)
+        attempts = [
+            ("1_exact_match", has_position and environment_filter,
+             (target_sound, position_filter, environment_filter, difficulty_filter), True),
+            ("2_no_difficulty_filter", has_position and environment_filter,
+             (target_sound, position_filter, environment_filter, None), True),
+            ("3_no_position_filter", environment_filter,
+             (target_sound, None, environment_filter, difficulty_filter), True),
+            ("4_no_environment_filter", has_position,
+             (target_sound, position_filter, None, difficulty_filter), True),
+            ("5_sound_environment_only", environment_filter,
+             (target_sound, None, environment_filter, None), True),
+            ("6_sound_position_only", has_position,
+             (target_sound, position_filter, None, None), True),
+            ("7_sound_difficulty_only", True,
+             (target_sound, None, None, difficulty_filter), True),
+            ("8_sound_jungle_only", True, (target_sound, None, 'jungle', None), True),
+            ("9_sound_savanna_only", True, (target_sound, None, 'savanna', None), True),
+            ("10_sound_ocean_only", True, (target_sound, None, 'ocean', None), True),
+            ("11_sound_arctic_only", True, (target_sound, None, 'arctic', None), True),
+            ("12_sound_beginning_only", True, (target_sound, 'beginning', None, None), True),
+            ("13_sound_middle_only", True, (target_sound, 'middle', None, None), True),
+            ("14_sound_ending_only", True, (target_sound, 'ending', None, None), True),
+            ("15_sound_easy_only", True, (target_sound, None, None, 'easy'), True),
+            ("16_sound_medium_only", True, (target_sound, None, None, 'medium'), True),
+            ("17_sound_hard_only", True, (target_sound, None, None, 'hard'), True),
+            ("18_sound_only_with_exclusions", True, (target_sound, None, None, None), True),
+            ("19_sound_only_no_exclusions", True, (target_sound, None, None, None), False),
+        ]
+        
         animals_found = []
         strategy_used = ""
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 1: Exact match (sound + position + environment + difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0 and sound_position and sound_position != 'anywhere' and environment:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('sound_position', sound_position)
-            query = query.eq('environment', environment)
-            if difficulty != 'hard':
-                query = query.eq('difficulty_level', difficulty)
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "1_exact_match"
-                logger.info(f"✅ Attempt 1 (Exact): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 2: sound + position + environment (any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0 and sound_position and sound_position != 'anywhere' and environment:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('sound_position', sound_position)
-            query = query.eq('environment', environment)
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "2_no_difficulty_filter"
-                logger.info(f"✅ Attempt 2 (No difficulty): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 3: sound + environment + difficulty (any position)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0 and environment:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('environment', environment)
-            if difficulty != 'hard':
-                query = query.eq('difficulty_level', difficulty)
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "3_no_position_filter"
-                logger.info(f"✅ Attempt 3 (No position): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 4: sound + position + difficulty (any environment)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0 and sound_position and sound_position != 'anywhere':
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('sound_position', sound_position)
-            if difficulty != 'hard':
-                query = query.eq('difficulty_level', difficulty)
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "4_no_environment_filter"
-                logger.info(f"✅ Attempt 4 (No environment): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 5: sound + environment (any position, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0 and environment:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('environment', environment)
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "5_sound_environment_only"
-                logger.info(f"✅ Attempt 5 (Sound + environment): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 6: sound + position (any environment, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0 and sound_position and sound_position != 'anywhere':
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('sound_position', sound_position)
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "6_sound_position_only"
-                logger.info(f"✅ Attempt 6 (Sound + position): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 7: sound + difficulty (any position, any environment)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            if difficulty != 'hard':
-                query = query.eq('difficulty_level', difficulty)
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "7_sound_difficulty_only"
-                logger.info(f"✅ Attempt 7 (Sound + difficulty): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 8: sound + jungle environment (any position, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('environment', 'jungle')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "8_sound_jungle_only"
-                logger.info(f"✅ Attempt 8 (Sound + jungle): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 9: sound + savanna environment (any position, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('environment', 'savanna')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "9_sound_savanna_only"
-                logger.info(f"✅ Attempt 9 (Sound + savanna): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 10: sound + ocean environment (any position, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('environment', 'ocean')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "10_sound_ocean_only"
-                logger.info(f"✅ Attempt 10 (Sound + ocean): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 11: sound + arctic environment (any position, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('environment', 'arctic')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "11_sound_arctic_only"
-                logger.info(f"✅ Attempt 11 (Sound + arctic): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 12: sound + beginning position (any environment, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('sound_position', 'beginning')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "12_sound_beginning_only"
-                logger.info(f"✅ Attempt 12 (Sound + beginning): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 13: sound + middle position (any environment, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('sound_position', 'middle')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "13_sound_middle_only"
-                logger.info(f"✅ Attempt 13 (Sound + middle): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 14: sound + ending position (any environment, any difficulty)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('sound_position', 'ending')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "14_sound_ending_only"
-                logger.info(f"✅ Attempt 14 (Sound + ending): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 15: sound + easy difficulty (any position, any environment)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('difficulty_level', 'easy')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "15_sound_easy_only"
-                logger.info(f"✅ Attempt 15 (Sound + easy): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 16: sound + medium difficulty (any position, any environment)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('difficulty_level', 'medium')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "16_sound_medium_only"
-                logger.info(f"✅ Attempt 16 (Sound + medium): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 17: sound + hard difficulty (any position, any environment)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            query = query.eq('difficulty_level', 'hard')
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "17_sound_hard_only"
-                logger.info(f"✅ Attempt 17 (Sound + hard): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 18: sound only with exclude_ids applied
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            if exclude_ids:
-                query = query.not_.in_('id', exclude_ids)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "18_sound_only_with_exclusions"
-                logger.info(f"✅ Attempt 18 (Sound only + exclusions): Found {len(animals_found)} animals")
-        
-        # ----------------------------------------------------------
-        # ATTEMPT 19: sound only (ignore exclude_ids)
-        # ----------------------------------------------------------
-        if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            query = query.eq('target_sound', target_sound)
-            
-            response = query.execute()
-            animals_found = response.data or []
-            if len(animals_found) > 0:
-                strategy_used = "19_sound_only_no_exclusions"
-                logger.warning(f"⚠️ Attempt 19 (Sound only, no exclusions): Found {len(animals_found)} animals")
+        strategy_filters = (None, None, None, None)
+        
+        for strategy, applies, filters, use_exclusions in attempts:
+            if not applies:
+                continue
+            animals_found = animal_index.find(*filters, exclude_ids=exclude_ids if use_exclusions else ())
+            if animals_found:
+                strategy_used = strategy
+                strategy_filters = filters
+                log = logger.info if use_exclusions else logger.warning
+                log(f"✅ Attempt {strategy}: Found {len(animals_found)} animals")
+                break
         
         # ----------------------------------------------------------
         # ATTEMPT 20: ABSOLUTE FINAL FALLBACK - Get ANY animals (even different sound)
         # ----------------------------------------------------------
         if len(animals_found) == 0:
-            query = supabase.table('safari_animals').select('*')
-            if environment:
-                query = query.eq('environment', environment)
-            query = query.limit(10)
-            
-            response = query.execute()
-            animals_found = response.data or []
+            animals_found = animal_index.find(environment=environment_filter)[:10]
             if len(animals_found) > 0:
                 strategy_used = "20_any_animals_absolute_fallback"
                 logger.error(f"🚨 Attempt 20 (ABSOLUTE FALLBACK - ANY ANIMALS): Found {len(animals_found)} animals")
@@ -535,25 +270,13 @@ def get_safari_animals_by_sound(request):
         if len(animals_found) < min_correct:
             logger.warning(f"⚠️ Only found {len(animals_found)} correct animals, need {min_correct}")
             
-            # Try to get more correct animals by relaxing filters progressively
-            additional_query = supabase.table('safari_animals').select('*')
-            additional_query = additional_query.eq('target_sound', target_sound)
-            
-            # If position was specified and we don't have enough, try ANY position
-            if sound_position and sound_position != 'anywhere':
+            # Try to get more correct animals by relaxing filters (any position)
+            if has_position:
                 logger.info(f"🔄 Relaxing position filter to get more animals")
-                # Don't filter by position
             
             # Exclude animals we already have
-            if animals_found and len(animals_found) > 0:
-                already_found_ids = [animal['id'] for animal in animals_found]
-                additional_query = additional_query.not_.in_('id', already_found_ids)
-            
-            if exclude_ids:
-                additional_query = additional_query.not_.in_('id', exclude_ids)
-            
-            additional_response = additional_query.execute()
-            additional_animals = additional_response.data or []
+            already_found_ids = [animal['id'] for animal in animals_found]
+            additional_animals = animal_index.find(target_sound, exclude_ids=already_found_ids + exclude_ids)
             
             logger.info(f"🔄 Found {len(additional_animals)} additional animals")
             
@@ -571,7 +294,7 @@ def get_safari_animals_by_sound(request):
         # ✅ CRITICAL FIX: Validate position match for non-"anywhere" positions
         # This ensures backend and frontend agree on what's "correct"
         # ============================================================
-        if sound_position and sound_position != 'anywhere':
+        if has_position:
             # Filter animals_found to ONLY include exact position matches
             position_matched_animals = [
                 animal for animal in animals_found 
@@ -618,20 +341,9 @@ def get_safari_animals_by_sound(request):
             logger.info(f"🔄 Attempting fallback to 'anywhere' position for sound='{target_sound}'")
             
             # Try to get animals with target sound at ANY position
-            fallback_query = supabase.table('safari_animals').select('*')
-            fallback_query = fallback_query.eq('target_sound', target_sound)
-            
-            if environment:
-                fallback_query = fallback_query.eq('environment', environment)
-            
-            if difficulty != 'hard':
-                fallback_query = fallback_query.eq('difficulty_level', difficulty)
-            
-            if exclude_ids:
-                fallback_query = fallback_query.not_.in_('id', exclude_ids)
-            
-            fallback_response = fallback_query.execute()
-            fallback_animals = fallback_response.data or []
+            fallback_animals = animal_index.find(
+                target_sound, None, environment_filter, difficulty_filter, exclude_ids=exclude_ids
+            )
             
             if len(fallback_animals) >= min_correct:
                 logger.info(
@@ -679,69 +391,42 @@ def get_safari_animals_by_sound(request):
 
         logger.info(f"📊 Composition: {num_correct} correct + {num_incorrect_needed} incorrect = {total_animals} total")
 
-        try:
-            all_phonemically_valid_query = supabase.table('safari_animals')\
-                .select('name')\
-                .eq('target_sound', target_sound)
-            
-            # Only apply position filter if not 'anywhere'
-            if sound_position and sound_position != 'anywhere':
-                all_phonemically_valid_query = all_phonemically_valid_query.eq('sound_position', sound_position)
-            
-            all_phonemically_valid_response = all_phonemically_valid_query.execute()
-            
-            if all_phonemically_valid_response.data:
-                phonemically_valid_names = list(set([animal['name'] for animal in all_phonemically_valid_response.data]))
-                logger.info(f"🚫 Excluding phonemically valid animal names from incorrect choices: {phonemically_valid_names}")
-            else:
-                phonemically_valid_names = []
-                logger.warning("⚠️ No phonemically valid animals found in database")
-                
-        except Exception as e:
-            logger.error(f"❌ Error fetching phonemically valid names: {str(e)}")
-            phonemically_valid_names = []
-
-        incorrect_query = supabase.table('safari_animals').select('*')
-        incorrect_query = incorrect_query.neq('target_sound', target_sound)
-
         # ✅ FIX: Exclude phonemically valid animals (prevents confusion)
+        phonemically_valid_names = {animal['name'] for animal in animal_index.find(target_sound, position_filter)}
         if phonemically_valid_names:
-            incorrect_query = incorrect_query.not_.in_('name', phonemically_valid_names)
+            logger.info(f"🚫 Excluding phonemically valid animal names from incorrect choices: {sorted(phonemically_valid_names)}")
+        else:
+            logger.warning("⚠️ No phonemically valid animals found in database")
 
         # Apply same filters based on which strategy worked for correct animals
+        incorrect_environment = None
+        incorrect_difficulty = None
         if strategy_used.startswith('1_') or strategy_used.startswith('2_'):
             # Attempts 1-2 had environment
-            if environment:
-                incorrect_query = incorrect_query.eq('environment', environment)
+            incorrect_environment = environment_filter
         elif strategy_used.startswith('3_') or strategy_used.startswith('7_'):
             # Attempts 3, 7 had difficulty
-            if difficulty != 'hard':
-                incorrect_query = incorrect_query.eq('difficulty_level', difficulty)
-        elif strategy_used.startswith('8_'):
-            incorrect_query = incorrect_query.eq('environment', 'jungle')
-        elif strategy_used.startswith('9_'):
-            incorrect_query = incorrect_query.eq('environment', 'savanna')
-        elif strategy_used.startswith('10_'):
-            incorrect_query = incorrect_query.eq('environment', 'ocean')
-        elif strategy_used.startswith('11_'):
-            incorrect_query = incorrect_query.eq('environment', 'arctic')
+            incorrect_difficulty = difficulty_filter
+        elif strategy_used.startswith(('8_', '9_', '10_', '11_')):
+            # Attempts 8-11 had a fixed environment
+            incorrect_environment = strategy_filters[2]
         
         # Exclude the correct animals we already have (by NAME to avoid duplicates)
-        if animals_found:
-            correct_animal_names = [animal['name'] for animal in animals_found]
-            incorrect_query = incorrect_query.not_.in_('name', correct_animal_names)
-        
-        if exclude_ids and not strategy_used.startswith('19_'):
-            incorrect_query = incorrect_query.not_.in_('id', exclude_ids)
-        
-        incorrect_response = incorrect_query.execute()
-        incorrect_animals = incorrect_response.data or []
+        correct_animal_names = {animal['name'] for animal in animals_found}
+        incorrect_animals = [
+            animal for animal in animal_index.find(
+                environment=incorrect_environment,
+                difficulty=incorrect_difficulty,
+                exclude_ids=exclude_ids if not strategy_used.startswith('19_') else (),
+                exclude_names=phonemically_valid_names | correct_animal_names
+            )
+            if animal.get('target_sound') != target_sound
+        ]
         
         logger.info(f"🔍 Found {len(incorrect_animals)} incorrect animals")
         
         # ✅ Select the exact number of incorrect animals needed
         if len(incorrect_animals) > num_incorrect_needed:
-            import random
             incorrect_animals = random.sample(incorrect_animals, num_incorrect_needed)
             logger.info(f"✂️ Trimmed to {num_incorrect_needed} incorrect animals")
         elif len(incorrect_animals) < num_incorrect_needed:
@@ -761,13 +446,12 @@ def get_safari_animals_by_sound(request):
                 deduplicated_animals.append(animal)
                 seen_names.add(animal['name'])
 
-        # Use deduplicated list
-        all_animals = deduplicated_animals
+        # Use deduplicated list (copies, the index rows are shared)
+        all_animals = [dict(animal) for animal in deduplicated_animals]
 
         logger.info(f"🔍 Deduplication: {len(all_animals)} unique animals after removing name duplicates")
 
         # Shuffle to mix correct and incorrect
-        import random
         random.shuffle(all_animals)
         
         # Calculate actual counts after deduplication
@@ -802,46 +486,44 @@ def get_safari_animals_by_sound(request):
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_random_sound(request):
-    """Get a random sound for the game - only core sounds, excluding thin combinations"""
-    # ✅ CORE SOUNDS ONLY
-    CORE_SOUNDS = ['g', 'k', 'w', 'd', 'r', 'c', 'h', 's', 'm', 't', 'b', 'p', 'f', 'l', 'z']
+    """
+    Get a random sound for the game - only core sounds, excluding thin combinations
     
+    Sounds come from the animal index's feasibility matrix instead of reading the
+    target_sound column on every call.
+    """
     # Get the requested position (if specified by frontend)
     requested_position = request.GET.get('position', None)
+    difficulty = request.GET.get('difficulty', 'easy')
     
     try:
-        # Get all unique sounds from the database that are core sounds
-        response = supabase.table('safari_animals').select('target_sound').execute()
-        
-        if response.data:
-            unique_sounds = list(set([animal['target_sound'] for animal in response.data]))
-            # ✅ Filter to only core sounds
-            core_sounds_in_db = [s for s in unique_sounds if s in CORE_SOUNDS]
-            
-            # ✅ NEW: Filter out sounds that form excluded combinations
-            if requested_position:
-                valid_sounds = [
-                    sound for sound in core_sounds_in_db 
-                    if not is_combination_excluded(sound, requested_position)
-                ]
-                
-                if valid_sounds:
-                    random_sound = random.choice(valid_sounds)
-                    logger.info(f"✅ Selected sound '{random_sound}' for position '{requested_position}' (excluded thin combinations)")
-                    return JsonResponse({
-                        'sound': random_sound,
-                        'available_sounds': valid_sounds,
-                        'excluded_combinations': len(core_sounds_in_db) - len(valid_sounds)
-                    })
+        # ✅ Core sounds that have animals in the catalog
+        core_sounds_in_db = [sound for sound in CORE_SOUNDS if animal_index.candidate_count(sound) > 0]
+        
+        # ✅ NEW: Filter out sounds that form excluded combinations
+        if requested_position and core_sounds_in_db:
+            valid_sounds = [
+                sound for sound in core_sounds_in_db 
+                if not is_combination_excluded(sound, requested_position, difficulty)
+            ]
             
-            # If no position specified or all sounds excluded, return any core sound
-            if core_sounds_in_db:
-                random_sound = random.choice(core_sounds_in_db)
+            if valid_sounds:
+                random_sound = random.choice(valid_sounds)
+                logger.info(f"✅ Selected sound '{random_sound}' for position '{requested_position}' (excluded thin combinations)")
                 return JsonResponse({
                     'sound': random_sound,
-                    'available_sounds': core_sounds_in_db
+                    'available_sounds': valid_sounds,
+                    'excluded_combinations': len(core_sounds_in_db) - len(valid_sounds)
                 })
         
+        # If no position specified or all sounds excluded, return any core sound
+        if core_sounds_in_db:
+            random_sound = random.choice(core_sounds_in_db)
+            return JsonResponse({
+                'sound': random_sound,
+                'available_sounds': core_sounds_in_db
+            })
+        
         # ✅ Fallback to core sounds only
         return JsonResponse({
             'sound': random.choice(CORE_SOUNDS),
@@ -855,10 +537,6 @@ def get_random_sound(request):
             'sound': random.choice(CORE_SOUNDS),
             'available_sounds': CORE_SOUNDS
         })
-            
-    except Exception as e:
-        logger.error(f"Error getting random sound: {str(e)}")
-        return JsonResponse({'error': str(e)}, status=500)
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -1027,6 +705,9 @@ def update_animal_images(request):
                 failed_updates.append(f"{animal['name']} (Error: {str(e)})")
                 logger.error(f"Failed to update {animal['name']}: {str(e)}")
         
+        if updated_count:
+            animal_index.invalidate()
+        
         return Response({
             'success': True,
             'message': f'Updated {updated_count} animal image URLs',
@@ -1,3 +1,13 @@
+# backend/wildlitz/phonics/admin.py
 from django.contrib import admin
+from .models import PhonicsWordBankEntry
 
-# Register your models here.
+@admin.register(PhonicsWordBankEntry)
+class PhonicsWordBankEntryAdmin(admin.ModelAdmin):
+    list_display = ('word_key', 'challenge_level', 'learning_focus', 'difficulty', 'pattern',
+                    'times_served', 'times_attempted', 'times_recognized', 'created_at')
+    list_filter = ('challenge_level', 'learning_focus', 'difficulty', 'pattern')
+    search_fields = ('word_key',)
+    ordering = ('challenge_level', 'learning_focus', 'word_key')
+    readonly_fields = ('pattern_tags', 'times_served', 'times_attempted', 'times_recognized',
+                       'total_response_time', 'created_at', 'last_served')
@@ -0,0 +1,128 @@
+# backend/wildlitz/phonics/analytics_cache.py
+"""
+Per-user snapshots of the phonics analytics dashboard.
+
+get_user_analytics stores its combined sessions + pattern response here and
+serves repeated dashboard opens from memory. save_game_session invalidates
+the user's snapshots, so a new game shows up on the next load.
+
+Snapshots are per worker process: a game saved through another worker is
+picked up once the snapshot expires (PHONICS_ANALYTICS_SNAPSHOT_SECONDS).
+Both maps are bounded: a few query variants per user, max_users users,
+and expired users are swept out along with their invalidation counters.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+MAX_KEYS_PER_USER = 8  # limit/pattern variants kept per user
+
+
+class AnalyticsSnapshots:
+    """Dashboard responses per user and query, dropped when the user saves a game"""
+
+    def __init__(self, ttl=300, max_users=1000, max_keys_per_user=MAX_KEYS_PER_USER):
+        self.ttl = ttl
+        self.max_users = max_users
+        self.max_keys_per_user = max_keys_per_user
+        self._lock = threading.Lock()
+        self._snapshots = {}  # user -> {query key: (expires_at, payload)}
+        self._generations = {}  # user -> generation of their last invalidation
+        self._last_generation = 0
+        self._floor = 0  # generation of users not in _generations
+        self._swept_at = time.monotonic()
+        self._stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def get(self, user, key):
+        """Snapshot for the user's query, or None"""
+        with self._lock:
+            snapshots = self._snapshots.get(user, {})
+            entry = snapshots.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del snapshots[key]
+                self._stats['misses'] += 1
+                return None
+            self._stats['hits'] += 1
+            return entry[1]
+
+    def generation(self, user):
+        """Token to pass to put(), taken before reading the data"""
+        with self._lock:
+            return self._generations.get(user, self._floor)
+
+    def put(self, user, key, payload, generation):
+        """
+        Store a snapshot unless the user saved a game while it was being read
+
+        Keeps at most max_keys_per_user queries per user and max_users users,
+        dropping the ones stored first.
+
+        Args:
+            generation (int): generation(user) from before the reads started
+        """
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._generations.get(user, self._floor) != generation:
+                return
+            if now - self._swept_at >= self.ttl:
+                self._sweep(now)
+
+            snapshots = self._snapshots.get(user)
+            if snapshots is None:
+                if len(self._snapshots) >= self.max_users:
+                    self._drop_user(next(iter(self._snapshots)))
+                snapshots = self._snapshots[user] = {}
+            snapshots.pop(key, None)
+            if len(snapshots) >= self.max_keys_per_user:
+                snapshots.pop(next(iter(snapshots)))
+            snapshots[key] = (now + self.ttl, payload)
+
+    def invalidate(self, user):
+        with self._lock:
+            self._snapshots.pop(user, None)
+            self._last_generation += 1
+            self._generations.pop(user, None)
+            self._generations[user] = self._last_generation
+            while len(self._generations) > self.max_users:
+                self._forget_generation(next(iter(self._generations)))
+            self._stats['invalidations'] += 1
+
+    def _forget_generation(self, user):
+        generation = self._generations.pop(user, None)
+        if generation is not None:
+            # Reads of the user still in flight hold an older token, so they cannot store
+            self._floor = max(self._floor, generation)
+
+    def _drop_user(self, user):
+        self._snapshots.pop(user, None)
+        self._forget_generation(user)
+
+    def _sweep(self, now):
+        """Drop the users whose snapshots have all expired"""
+        expired = [
+            user for user, snapshots in self._snapshots.items()
+            if all(expires_at <= now for expires_at, _ in snapshots.values())
+        ]
+        for user in expired:
+            self._drop_user(user)
+        self._swept_at = now
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['users'] = len(self._snapshots)
+            stats['snapshots'] = sum(len(snapshots) for snapshots in self._snapshots.values())
+            stats['generations'] = len(self._generations)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+
+analytics_snapshots = AnalyticsSnapshots(
+    ttl=getattr(settings, 'PHONICS_ANALYTICS_SNAPSHOT_SECONDS', 300),
+)
@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class PhonicsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'phonics'
+
+    def ready(self):
+        from django.conf import settings
+
+        prewarm = getattr(settings, 'PHONICS_WORD_POOL_PREWARM', [])
+        if prewarm:
+            # Importing the views registers how pools are refilled
+            from . import views  # noqa: F401
+            from .word_pools import word_pools
+            word_pools.prewarm(prewarm)
@@ -0,0 +1,168 @@
+# backend/wildlitz/phonics/compounds.py
+"""
+Compound word splitting for the compound_words challenge level.
+
+A compound is a word that splits entirely into words from the bundled
+kid-vocabulary lexicon (data/kid_lexicon.txt), e.g. "toothbrush" =
+"tooth" + "brush". The lexicon is loaded once into a trie; splitting walks
+the trie from each position, so a word is checked in one pass over its
+letters per split point, and results are memoized per word.
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+LEXICON_PATH = Path(__file__).resolve().parent / 'data' / 'kid_lexicon.txt'
+
+MIN_PART_LENGTH = 2
+MAX_PARTS = 3
+
+_END = ''  # trie key marking the end of a word
+
+# Single words that happen to split into lexicon words
+NOT_COMPOUNDS = frozenset({
+    # Common single words with blends
+    'sled', 'street', 'trick', 'brave', 'crisp', 'black', 'blue', 'class',
+    'clock', 'close', 'cloud', 'club', 'flag', 'flame', 'flash', 'flat',
+    'floor', 'flower', 'frame', 'fresh', 'friend', 'front', 'frost',
+    'glad', 'glass', 'globe', 'glove', 'grade', 'grand', 'grape', 'grass',
+    'great', 'green', 'ground', 'group', 'plan', 'plane', 'plant', 'plate',
+    'play', 'please', 'pride', 'print', 'price', 'prize', 'prove',
+    'scale', 'scare', 'slide', 'slope', 'small', 'smart', 'smile', 'smoke',
+    'snake', 'space', 'speak', 'speed', 'spell', 'spend', 'spill', 'sport',
+    'spread', 'spring', 'square', 'stage', 'stamp', 'stand', 'star', 'start',
+    'state', 'stick', 'still', 'stone', 'store', 'story', 'strange', 'strap',
+    'stream', 'stress', 'strike', 'string', 'strong', 'trace', 'track', 'trade',
+    'train', 'trash', 'treat', 'tree', 'trial', 'tribe', 'truck',
+
+    # Common single words with digraphs
+    'chair', 'chain', 'change', 'charge', 'cheap', 'cheat', 'check', 'cheek',
+    'cheer', 'cheese', 'cherry', 'chest', 'chick', 'chicken', 'child', 'choice',
+    'phone', 'photo', 'phrase', 'graph', 'dolphin', 'elephant', 'alphabet',
+    'shell', 'ship', 'shirt', 'shock', 'shoot', 'shop', 'shore', 'short',
+    'should', 'shout', 'show', 'shut', 'fish', 'dish', 'wish', 'rush', 'push',
+    'brush', 'crash', 'thank', 'thick', 'thing', 'think', 'third', 'thirsty',
+    'thorn', 'those', 'thought', 'three', 'throw', 'thumb', 'thunder', 'path',
+    'bath', 'math', 'whale', 'wheat', 'wheel', 'when', 'where', 'which', 'while',
+    'whip', 'white',
+
+    # Other common single words
+    'another', 'together', 'nothing', 'something', 'anything', 'everything',
+    'mother', 'father', 'brother', 'sister', 'weather', 'whether', 'water',
+    'butter', 'letter', 'better', 'other', 'either',
+    'apple', 'orange', 'banana', 'purple', 'yellow', 'number', 'little',
+    'middle', 'people', 'animal', 'family', 'happy', 'ready', 'study',
+    'carpet', 'season', 'begin', 'became', 'become', 'before', 'behind', 'below',
+    'beside', 'carton', 'cartoon', 'handsome', 'into', 'mango', 'napkin', 'office',
+    'onto', 'today', 'tonight',
+})
+
+
+class WordTrie:
+    """Lexicon as nested dicts, one level per letter"""
+
+    def __init__(self, words=()):
+        self._root = {}
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+        if _END not in node:
+            node[_END] = True
+            self._size += 1
+
+    def prefix_ends(self, text, start=0):
+        """
+        End indexes of every lexicon word that starts at text[start]
+
+        Returns:
+            list: ends e such that text[start:e] is a word, shortest first
+        """
+        ends = []
+        node = self._root
+        for index in range(start, len(text)):
+            node = node.get(text[index])
+            if node is None:
+                break
+            if _END in node:
+                ends.append(index + 1)
+        return ends
+
+    def __contains__(self, word):
+        node = self._root
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                return False
+        return _END in node
+
+    def __len__(self):
+        return self._size
+
+
+class CompoundSplitter:
+    """Splits words into lexicon parts, memoized per word"""
+
+    def __init__(self, words, not_compounds=NOT_COMPOUNDS, min_part=MIN_PART_LENGTH, max_parts=MAX_PARTS):
+        self.trie = WordTrie(word for word in words if len(word) >= min_part)
+        self.not_compounds = frozenset(not_compounds)
+        self.max_parts = max_parts
+
+    @lru_cache(maxsize=8192)
+    def split(self, word):
+        """
+        Split a word into lexicon words
+
+        Prefers the fewest parts, then the longest first part. Hyphens are
+        ignored ("sun-set" splits like "sunset").
+
+        Returns:
+            tuple: The parts, or None if the word is not a compound
+        """
+        text = (word or '').lower().replace('-', '').strip()
+        if not text.isalpha() or text in self.not_compounds:
+            return None
+
+        @lru_cache(maxsize=None)
+        def parts_from(start, parts_left):
+            if start == len(text):
+                return ()
+            if parts_left == 0:
+                return None
+            best = None
+            for end in reversed(self.trie.prefix_ends(text, start)):
+                rest = parts_from(end, parts_left - 1)
+                if rest is not None and (best is None or len(rest) + 1 < len(best)):
+                    best = (text[start:end],) + rest
+            return best
+
+        parts = parts_from(0, self.max_parts)
+        if parts is None or len(parts) < 2:
+            return None
+        return parts
+
+    def is_compound(self, word):
+        return self.split(word) is not None
+
+
+def read_lexicon(path=LEXICON_PATH):
+    """Words of the lexicon file (one word per line, # comments)"""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip().lower() for line in f if line.strip() and not line.startswith('#')]
+
+
+def load_compound_splitter(path=LEXICON_PATH):
+    """Read the lexicon file into a splitter"""
+    splitter = CompoundSplitter(read_lexicon(path))
+    logger.info(f"📚 Loaded {len(splitter.trie)} lexicon words for compound splitting")
+    return splitter
+
+
+compound_splitter = load_compound_splitter()
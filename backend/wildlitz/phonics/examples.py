@@ -0,0 +1,143 @@
+# backend/wildlitz/phonics/examples.py
+"""
+Example words for the pattern help in the vanishing game.
+
+ExampleIndex maps (pattern, challenge_level, learning_focus) to example
+words. It is built once at import from the curated fallback word data only:
+each entry is filed under the pattern its data declares (plus, for long
+vowels, the spellings in it that make the declared sound). Entries with a
+word that does not make a vowel pattern's sound (r-controlled vowels,
+irregular words like "some" or "great", "w" + a, ow as in "cow") are left
+out. Patterns the data does not cover are answered by the model.
+
+Patterns are matched in any of the spellings the frontend and the word data
+use: 'a' / 'short_a', 'a_e' / 'long_a', 'sh' / 'digraph_sh' / 'sh_digraph',
+'bl' / 'blend_bl' / 'bl_blend'.
+"""
+
+import logging
+import random
+import re
+from collections import defaultdict
+
+from .fallback_words import fallback_word_bank
+from .patterns import VOWELS, analyzer as pattern_analyzer, long_vowel_sound
+
+logger = logging.getLogger(__name__)
+
+# Words whose vowels do not make the sound their spelling suggests
+_IRREGULAR_VOWEL_WORDS = frozenset({
+    'above', 'come', 'done', 'dove', 'give', 'glove', 'gone', 'have', 'live', 'lose',
+    'love', 'move', 'none', 'once', 'one', 'prove', 'shove', 'some', 'there', 'were',
+    'where', 'break', 'great', 'steak',
+    # ow as in "cow"
+    'brown', 'clown', 'cow', 'crown', 'down', 'flower', 'gown', 'how', 'now', 'owl',
+    'power', 'shower', 'tower', 'town',
+})
+_R_CONTROLLED = re.compile(r'[aeiou]+r(?:e\b|[^aeiouy]|$)')  # car, more, bird, airmail
+_NOT_SHORT_A = re.compile(r'(?:wa|qua)[^aeiouy]|al[mkl]')  # swan, wash, squash, palm, walk, ball
+
+
+def canonical_pattern(pattern):
+    """
+    One spelling per pattern: 'short_a', 'long_a', 'a_e', 'sh', 'bl', ...
+
+    Returns:
+        str: Canonical pattern, or '' for an empty pattern
+    """
+    pattern = str(pattern or '').strip().lower()
+    for prefix in ('digraph_', 'blend_'):
+        if pattern.startswith(prefix):
+            return pattern[len(prefix):]
+    for suffix in ('_digraph', '_blend'):
+        if pattern.endswith(suffix):
+            return pattern[:-len(suffix)]
+    if pattern in VOWELS:
+        return f'short_{pattern}'
+    return pattern
+
+
+def misleading_example(text, pattern):
+    """Whether text has a word that does not make the sound of a vowel pattern"""
+    if not pattern.startswith(('short_', 'long_')):
+        return False
+    for token in re.findall(r'[a-z]+', text.lower()):
+        if token in _IRREGULAR_VOWEL_WORDS or _R_CONTROLLED.search(token):
+            return True
+        if pattern == 'short_a' and _NOT_SHORT_A.search(token):
+            return True
+    return False
+
+
+def example_patterns(text, declared):
+    """
+    Patterns a curated entry illustrates: its declared pattern, plus the long
+    vowel spellings in it that make the declared sound
+
+    Returns:
+        set: Canonical patterns, empty if the entry would mislead
+    """
+    pattern = canonical_pattern(declared)
+    if not pattern or pattern == 'simple_sentence' or misleading_example(text, pattern):
+        return set()
+    if not pattern.startswith('long_'):
+        return {pattern}
+
+    spellings = {
+        spelling for spelling in pattern_analyzer.analyze(text.lower()).patterns
+        if long_vowel_sound(spelling) == pattern
+    }
+    # A long vowel entry with no spelling of its sound is mislabelled (moonlight as long_o)
+    return {pattern} | spellings if spellings else set()
+
+
+class ExampleIndex:
+    """Example words per (pattern, challenge_level, learning_focus)"""
+
+    def __init__(self):
+        self._examples = defaultdict(list)
+        self._seen = set()
+
+    def add(self, text, challenge_level, learning_focus, patterns):
+        """File text under each pattern for its level, both for its focus and for any focus"""
+        for pattern in patterns:
+            for key in ((pattern, challenge_level, learning_focus), (pattern, challenge_level, None)):
+                if (key, text) not in self._seen:
+                    self._seen.add((key, text))
+                    self._examples[key].append(text)
+
+    def examples(self, pattern, challenge_level, learning_focus, count):
+        """
+        Random examples of a pattern for a challenge level
+
+        Falls back from the learning focus to any focus of the level.
+
+        Returns:
+            list: count examples, or None if the index has fewer
+        """
+        pattern = canonical_pattern(pattern)
+        for key in ((pattern, challenge_level, learning_focus), (pattern, challenge_level, None)):
+            candidates = self._examples.get(key, ())
+            if len(candidates) >= count:
+                return random.sample(candidates, count)
+        return None
+
+    def __len__(self):
+        return len(self._examples)
+
+
+def build_example_index():
+    """Index the curated fallback word data of every level"""
+    index = ExampleIndex()
+
+    for challenge_level, learning_focus, words in fallback_word_bank.buckets():
+        for word_obj in words:
+            text = str(word_obj.get('word', '')).strip()
+            if text:
+                index.add(text, challenge_level, learning_focus, example_patterns(text, word_obj.get('pattern')))
+
+    logger.info(f"📚 Indexed phonics examples for {len(index)} pattern/level/focus combinations")
+    return index
+
+
+example_index = build_example_index()
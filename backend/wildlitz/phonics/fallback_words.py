@@ -0,0 +1,140 @@
+# backend/wildlitz/phonics/fallback_words.py
+"""
+Static phonics words served when the AI comes up short or fails.
+
+The words live in data/fallback_words.json ({challenge_level: {learning_focus:
+[word, ...]}}) so they can be edited without touching code. The file is read
+once at import and bucketed by (challenge_level, learning_focus) and
+(challenge_level, learning_focus, pattern); picking words is then a random
+sample of k entries from a prebuilt tuple.
+"""
+
+import json
+import logging
+import random
+from pathlib import Path
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_WORDS_PATH = Path(__file__).resolve().parent / 'data' / 'fallback_words.json'
+
+DEFAULT_LEVEL = 'simple_words'
+DEFAULT_FOCUS = 'short_vowels'
+
+
+def _sample(words, count):
+    """
+    Pick count words in random order without copying the bucket
+
+    Cycles through the bucket (each pass in a fresh order) when more words
+    are asked for than it holds, like the original shuffle-and-repeat did.
+    """
+    size = len(words)
+    full_passes, rest = divmod(count, size)
+    picked = []
+    for _ in range(full_passes):
+        picked.extend(words[i] for i in random.sample(range(size), size))
+    if rest * 2 <= size:
+        # Few words from a larger bucket: draw distinct indexes, O(rest)
+        indexes = {}
+        while len(indexes) < rest:
+            indexes.setdefault(random.randrange(size))
+        picked.extend(words[i] for i in indexes)
+    else:
+        picked.extend(words[i] for i in random.sample(range(size), rest))
+    return picked
+
+
+class FallbackWordBank:
+    """Read-only fallback words bucketed for constant-time lookup"""
+
+    def __init__(self, word_sets):
+        """
+        Args:
+            word_sets (dict): {challenge_level: {learning_focus: [word dicts]}}
+        """
+        self._by_focus = {}
+        self._by_pattern = {}
+        self._focuses = {}
+        self._texts = set()
+
+        for challenge_level, focus_sets in word_sets.items():
+            self._focuses[challenge_level] = tuple(focus_sets)
+            for learning_focus, words in focus_sets.items():
+                frozen = tuple(MappingProxyType(dict(word)) for word in words)
+                self._by_focus[(challenge_level, learning_focus)] = frozen
+                self._texts.update(str(word.get('word', '')).lower() for word in frozen)
+
+                by_pattern = {}
+                for word in frozen:
+                    by_pattern.setdefault(word.get('pattern'), []).append(word)
+                for pattern, pattern_words in by_pattern.items():
+                    self._by_pattern[(challenge_level, learning_focus, pattern)] = tuple(pattern_words)
+
+        if not self._by_focus.get((DEFAULT_LEVEL, DEFAULT_FOCUS)):
+            raise ValueError(f"Fallback word bank needs words for {DEFAULT_LEVEL}/{DEFAULT_FOCUS}")
+
+    def words(self, challenge_level, learning_focus, pattern=None):
+        """
+        Bucket for a combination
+
+        An unknown level uses simple_words, an unknown focus uses the level's
+        short_vowels, and an empty result uses simple_words/short_vowels. A
+        pattern without words of its own is ignored.
+
+        Returns:
+            tuple: Read-only word mappings
+        """
+        if challenge_level not in self._focuses:
+            challenge_level = DEFAULT_LEVEL
+        if (challenge_level, learning_focus) not in self._by_focus:
+            learning_focus = DEFAULT_FOCUS
+
+        if pattern:
+            pattern_words = self._by_pattern.get((challenge_level, learning_focus, pattern))
+            if pattern_words:
+                return pattern_words
+
+        return self._by_focus.get((challenge_level, learning_focus)) or self._by_focus[(DEFAULT_LEVEL, DEFAULT_FOCUS)]
+
+    def patterns(self, challenge_level, learning_focus):
+        """Patterns that have their own bucket for a combination"""
+        return sorted(
+            pattern for level, focus, pattern in self._by_pattern
+            if level == challenge_level and focus == learning_focus
+        )
+
+    def sample(self, challenge_level, learning_focus, count, pattern=None):
+        """
+        Random fallback words for a combination
+
+        Returns:
+            list: count word dicts (fresh copies the caller may modify)
+        """
+        if count <= 0:
+            return []
+        words = self.words(challenge_level, learning_focus, pattern)
+        return [dict(word) for word in _sample(words, count)]
+
+    def buckets(self):
+        """(challenge_level, learning_focus, words) for every bucket in the file"""
+        return [(level, focus, words) for (level, focus), words in self._by_focus.items()]
+
+    def __contains__(self, text):
+        """True if text is one of the bank's words (e.g. to tell AI words from padding)"""
+        return str(text).lower() in self._texts
+
+    def __len__(self):
+        return sum(len(words) for words in self._by_focus.values())
+
+
+def load_fallback_word_bank(path=FALLBACK_WORDS_PATH):
+    """Read and bucket the fallback word file"""
+    with open(path, encoding='utf-8') as f:
+        bank = FallbackWordBank(json.load(f))
+    logger.info(f"📚 Loaded {len(bank)} phonics fallback words from {Path(path).name}")
+    return bank
+
+
+fallback_word_bank = load_fallback_word_bank()
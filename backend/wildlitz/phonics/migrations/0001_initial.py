@@ -0,0 +1,38 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PhonicsWordBankEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word_key', models.CharField(max_length=200)),
+                ('challenge_level', models.CharField(max_length=30)),
+                ('learning_focus', models.CharField(max_length=30)),
+                ('difficulty', models.CharField(max_length=10)),
+                ('pattern', models.CharField(blank=True, max_length=20)),
+                ('pattern_tags', models.JSONField(default=list)),
+                ('word_data', models.JSONField()),
+                ('times_served', models.PositiveIntegerField(default=0)),
+                ('times_attempted', models.PositiveIntegerField(default=0)),
+                ('times_recognized', models.PositiveIntegerField(default=0)),
+                ('total_response_time', models.FloatField(default=0.0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_served', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'phonics_word_bank',
+                'indexes': [models.Index(fields=['challenge_level', 'learning_focus', 'pattern'], name='phonics_wb_level_focus_pat'), models.Index(fields=['challenge_level', 'learning_focus', 'difficulty'], name='phonics_wb_level_focus_diff')],
+                'constraints': [models.UniqueConstraint(fields=('word_key', 'challenge_level', 'learning_focus', 'difficulty'), name='phonics_wb_unique_word')],
+            },
+        ),
+    ]
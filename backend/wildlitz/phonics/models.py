@@ -1,3 +1,43 @@
+# phonics/models.py
 from django.db import models
 
-# Create your models here.
+
+class PhonicsWordBankEntry(models.Model):
+    """An AI-generated word that passed validation, kept for reuse by later games"""
+    
+    word_key = models.CharField(max_length=200)  # Lowercased word text, for deduplication
+    challenge_level = models.CharField(max_length=30)
+    learning_focus = models.CharField(max_length=30)
+    difficulty = models.CharField(max_length=10)
+    pattern = models.CharField(max_length=20, blank=True)  # Target pattern from the word object
+    pattern_tags = models.JSONField(default=list)  # Every phonics pattern found in the word
+    word_data = models.JSONField()  # Word object as served to the game
+    
+    # Quality counters
+    times_served = models.PositiveIntegerField(default=0)
+    times_attempted = models.PositiveIntegerField(default=0)  # From phonics_word_performance records
+    times_recognized = models.PositiveIntegerField(default=0)
+    total_response_time = models.FloatField(default=0.0)  # ms, over attempts with a response time
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_served = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'phonics_word_bank'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['word_key', 'challenge_level', 'learning_focus', 'difficulty'],
+                name='phonics_wb_unique_word',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['challenge_level', 'learning_focus', 'pattern'], name='phonics_wb_level_focus_pat'),
+            models.Index(fields=['challenge_level', 'learning_focus', 'difficulty'], name='phonics_wb_level_focus_diff'),
+        ]
+    
+    @property
+    def recognition_rate(self):
+        return self.times_recognized / self.times_attempted if self.times_attempted else None
+    
+    def __str__(self):
+        return f"{self.word_key} ({self.challenge_level}/{self.learning_focus}/{self.difficulty})"
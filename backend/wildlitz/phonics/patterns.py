@@ -0,0 +1,217 @@
+# backend/wildlitz/phonics/patterns.py
+"""
+Single-pass phonics pattern analysis.
+
+PhonicsPatternAnalyzer compiles every vowel team, digraph and blend into one
+Aho-Corasick automaton and spots magic-e (vowel + consonant + e) in the same
+scan, so a word is read once and tagged with all of its patterns and where
+they sit. Results are cached per text, so the validators that look at the
+same AI word one after another share one scan.
+
+The pattern tables here are the single source for the phonics validators in
+views.py.
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import NamedTuple
+
+VOWELS = frozenset('aeiou')
+
+# Detection order matters: longer teams first, and teams before magic-e, so
+# "suitcase" is a 'ui' word rather than 'u_e'
+VOWEL_TEAMS = ('eigh', 'augh', 'ough', 'igh', 'ai', 'ay', 'ee', 'ea', 'ie', 'oa', 'ow', 'ue', 'ui', 'ey', 'ew', 'oo')
+MAGIC_E = ('a_e', 'i_e', 'o_e', 'u_e', 'e_e')
+LONG_VOWEL_PRIORITY = VOWEL_TEAMS + MAGIC_E
+
+# Patterns that make a word wrong for a short-vowel round
+LONG_VOWEL_PATTERNS = frozenset(('ai', 'ay', 'ee', 'ea', 'ie', 'igh', 'oa', 'ow', 'ue', 'ui', 'ew', 'oo') + MAGIC_E)
+
+DIGRAPHS = ('sh', 'ch', 'th', 'wh', 'ph', 'ng', 'ck')
+BLENDS = ('bl', 'cl', 'fl', 'fr', 'gr', 'pl', 'pr', 'sl', 'sp', 'st', 'tr', 'dr', 'br', 'cr',
+          'sc', 'sk', 'sm', 'sn', 'sw', 'tw', 'str', 'spr', 'spl')
+
+SHORT_VOWEL_TARGETS = frozenset(('a', 'e', 'i', 'o', 'u', 'short_a', 'short_e', 'short_i', 'short_o', 'short_u'))
+
+LONG_VOWEL_SOUNDS = {
+    'a_e': 'long_a', 'ai': 'long_a', 'ay': 'long_a', 'eigh': 'long_a',
+    'e_e': 'long_e', 'ee': 'long_e', 'ea': 'long_e', 'ey': 'long_e',
+    'i_e': 'long_i', 'ie': 'long_i', 'igh': 'long_i',
+    'o_e': 'long_o', 'oa': 'long_o', 'ow': 'long_o', 'ough': 'long_o',
+    'u_e': 'long_u', 'ue': 'long_u', 'ui': 'long_u', 'ew': 'long_u', 'oo': 'long_u',
+}
+
+VOWEL_TEAM = 'vowel_team'
+DIGRAPH = 'digraph'
+BLEND = 'blend'
+MAGIC_E_KIND = 'magic_e'
+
+
+class PatternMatch(NamedTuple):
+    pattern: str
+    kind: str
+    start: int
+    end: int  # exclusive
+    position: str  # 'beginning', 'middle' or 'end' of the word it sits in
+    word_final: bool  # True if the pattern closes its word
+
+
+class WordPatterns:
+    """All phonics patterns found in one text"""
+
+    __slots__ = ('text', 'matches', 'patterns')
+
+    def __init__(self, text, matches):
+        self.text = text
+        self.matches = tuple(matches)
+        self.patterns = frozenset(match.pattern for match in self.matches)
+
+    def has(self, pattern, word_final=False):
+        """
+        True if the text contains the pattern
+
+        Patterns the analyzer does not know (e.g. 'oy') fall back to a plain
+        substring check.
+
+        Args:
+            word_final (bool): Only count the pattern where it ends a word
+        """
+        pattern = pattern.lower()
+        if word_final:
+            return any(match.pattern == pattern and match.word_final for match in self.matches)
+        if pattern in self.patterns:
+            return True
+        return pattern not in KNOWN_PATTERNS and '_' not in pattern and pattern in self.text
+
+    def first(self, priority):
+        """First pattern of the priority list present in the text, or None"""
+        for pattern in priority:
+            if pattern in self.patterns:
+                return pattern
+        return None
+
+    def of_kind(self, kind):
+        return [match for match in self.matches if match.kind == kind]
+
+    def __repr__(self):
+        return f"WordPatterns({self.text!r}, {sorted(self.patterns)})"
+
+
+def _position(text, start, end):
+    """Where [start, end) sits within the word that contains it"""
+    at_start = start == 0 or not text[start - 1].isalnum()
+    at_end = end == len(text) or not text[end].isalnum()
+    if at_start:
+        return 'beginning', at_end
+    if at_end:
+        return 'end', True
+    return 'middle', False
+
+
+class PhonicsPatternAnalyzer:
+    """Aho-Corasick automaton over the phonics letter patterns plus magic-e detection"""
+
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns (dict): Letter pattern -> kind (VOWEL_TEAM, DIGRAPH or BLEND)
+        """
+        self.kinds = dict(patterns)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for pattern in self.kinds:
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state] += (pattern,)
+
+        # Breadth-first failure links; each state's output includes its suffixes' outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] += self._output[self._fail[child]]
+
+    def scan(self, text):
+        """
+        Find every pattern occurrence in one pass
+
+        Args:
+            text (str): Lowercase text
+
+        Returns:
+            list: PatternMatch tuples in order of their end position
+        """
+        goto, fail, output, kinds = self._goto, self._fail, self._output, self.kinds
+        matches = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in output[state]:
+                start = index - len(pattern) + 1
+                matches.append(PatternMatch(pattern, kinds[pattern], start, index + 1,
+                                            *_position(text, start, index + 1)))
+
+            # Magic-e: vowel + consonant + e
+            if (char == 'e' and index >= 2 and text[index - 2] in VOWELS
+                    and text[index - 1].isalpha() and text[index - 1] not in VOWELS and text[index - 1] != 'y'):
+                start = index - 2
+                matches.append(PatternMatch(f'{text[start]}_e', MAGIC_E_KIND, start, index + 1,
+                                            *_position(text, start, index + 1)))
+        return matches
+
+    @lru_cache(maxsize=4096)
+    def analyze(self, text):
+        """
+        Tag a word, phrase or sentence with every phonics pattern in it
+
+        Returns:
+            WordPatterns
+        """
+        text = (text or '').lower()
+        return WordPatterns(text, self.scan(text))
+
+    def analyze_batch(self, word_objects):
+        """
+        Analyze a whole AI response
+
+        Args:
+            word_objects (list): Word dicts with a 'word' field
+
+        Returns:
+            list: (word_object, WordPatterns) pairs in input order
+        """
+        return [(word_obj, self.analyze(word_obj.get('word', ''))) for word_obj in word_objects]
+
+
+KNOWN_PATTERNS = frozenset(VOWEL_TEAMS + DIGRAPHS + BLENDS + MAGIC_E)
+
+analyzer = PhonicsPatternAnalyzer({
+    **{pattern: BLEND for pattern in BLENDS},
+    **{pattern: DIGRAPH for pattern in DIGRAPHS},
+    **{pattern: VOWEL_TEAM for pattern in VOWEL_TEAMS},
+})
+
+
+def detect_long_vowel(text):
+    """First long vowel pattern in the text by LONG_VOWEL_PRIORITY, or None"""
+    return analyzer.analyze(text).first(LONG_VOWEL_PRIORITY)
+
+
+def long_vowel_sound(pattern):
+    """'long_x' pattern name for a long vowel spelling"""
+    return LONG_VOWEL_SOUNDS.get(pattern, f'long_{pattern[0]}' if pattern and pattern[0] in VOWELS else None)
@@ -0,0 +1,19 @@
+# backend/wildlitz/phonics/schemas.py
+"""
+Pydantic schemas for the JSON the model returns in phonics.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class PhonicsWord(BaseModel):
+    """One word object from generate_single_batch (content rules live in validate_word_structure)"""
+    model_config = ConfigDict(extra='allow')
+
+    word: str
+    syllableBreakdown: str = ''
+    targetLetter: str = ''
+    definition: str = ''
+    pattern: str = ''
+    patternPosition: str = ''
+    phonicsRule: str = ''
@@ -0,0 +1,44 @@
+-- backend/wildlitz/phonics/sql/phonics_pattern_performance.sql
+--
+-- Per-(user, pattern, difficulty) rollups read by get_user_analytics and
+-- get_pattern_performance. save_phonics_game_session adds each saved
+-- game's word rows to them in the same transaction, so the pattern
+-- dashboards read one row per pattern and never rescan
+-- phonics_word_performance.
+--
+-- Apply before save_phonics_game_session.sql; safe to re-run, and brings
+-- an existing phonics_pattern_performance table up to these columns.
+
+create table if not exists public.phonics_pattern_performance (
+    id bigint generated by default as identity primary key,
+    user_email text not null,
+    pattern text not null,
+    difficulty text not null default '',
+    total_attempts integer not null default 0,
+    total_recognized integer not null default 0,
+    response_time_sum double precision not null default 0,  -- ms, over attempts with a response time
+    response_time_count integer not null default 0,
+    success_rate numeric(5, 2) not null default 0,  -- percent
+    average_response_time double precision not null default 0,  -- ms
+    last_played timestamptz not null default now()
+);
+
+alter table public.phonics_pattern_performance
+    add column if not exists difficulty text not null default '',
+    add column if not exists total_attempts integer not null default 0,
+    add column if not exists total_recognized integer not null default 0,
+    add column if not exists response_time_sum double precision not null default 0,
+    add column if not exists response_time_count integer not null default 0,
+    add column if not exists success_rate numeric(5, 2) not null default 0,
+    add column if not exists average_response_time double precision not null default 0,
+    add column if not exists last_played timestamptz not null default now();
+
+-- Upsert target; also serves per-pattern lookups of a user
+create unique index if not exists phonics_pattern_performance_user_pattern_difficulty
+    on public.phonics_pattern_performance (user_email, pattern, difficulty);
+
+-- Dashboard orderings
+create index if not exists phonics_pattern_performance_user_success_rate
+    on public.phonics_pattern_performance (user_email, success_rate desc);
+create index if not exists phonics_pattern_performance_user_total_attempts
+    on public.phonics_pattern_performance (user_email, total_attempts desc);
@@ -0,0 +1,93 @@
+-- backend/wildlitz/phonics/sql/save_phonics_game_session.sql
+--
+-- One-call, all-or-nothing write of a finished vanishing game: the session
+-- row, its word performance rows and the player's pattern rollups
+-- (phonics_pattern_performance) change in a single transaction, so a game is
+-- never stored without its words and the rollups never drift from them.
+-- Called by phonics.views.save_game_session through
+-- supabase.rpc('save_phonics_game_session', ...).
+--
+-- Apply in the Supabase SQL editor (or psql) after the phonics tables and
+-- phonics_pattern_performance.sql; safe to re-run.
+--
+-- p_session: phonics_game_sessions columns as a JSON object
+-- p_words:   phonics_word_performance rows as a JSON array (session_id is
+--            filled in here)
+-- Returns the new session_id.
+
+create or replace function public.save_phonics_game_session(
+    p_session jsonb,
+    p_words jsonb default '[]'::jsonb
+)
+returns public.phonics_game_sessions.session_id%type
+language plpgsql
+as $$
+declare
+    v_session_id public.phonics_game_sessions.session_id%type;
+begin
+    insert into public.phonics_game_sessions (
+        user_id, user_email, "timestamp", challenge_level, learning_focus, difficulty,
+        words_attempted, words_recognized, success_rate, average_response_time,
+        max_streak, time_spent, pattern_stats, word_list, difficulty_progression,
+        team_play, team_scores, team_names, completion_rate, words_per_minute,
+        learning_efficiency
+    )
+    select
+        user_id, user_email, "timestamp", challenge_level, learning_focus, difficulty,
+        words_attempted, words_recognized, success_rate, average_response_time,
+        max_streak, time_spent, pattern_stats, word_list, difficulty_progression,
+        team_play, team_scores, team_names, completion_rate, words_per_minute,
+        learning_efficiency
+    from jsonb_populate_record(null::public.phonics_game_sessions, p_session)
+    returning session_id into v_session_id;
+
+    with inserted as (
+        insert into public.phonics_word_performance (
+            session_id, user_email, word, pattern, difficulty, recognized,
+            response_time, attempt_number
+        )
+        select
+            v_session_id, user_email, word, pattern, difficulty, recognized,
+            response_time, attempt_number
+        from jsonb_populate_recordset(null::public.phonics_word_performance, coalesce(p_words, '[]'::jsonb))
+        returning user_email, pattern, difficulty, recognized, response_time
+    )
+    -- Add this game's words to the player's per-pattern rollups
+    insert into public.phonics_pattern_performance as rollup (
+        user_email, pattern, difficulty, total_attempts, total_recognized,
+        response_time_sum, response_time_count, success_rate,
+        average_response_time, last_played
+    )
+    select
+        user_email,
+        pattern,
+        coalesce(difficulty, ''),
+        count(*),
+        count(*) filter (where recognized),
+        coalesce(sum(response_time), 0),
+        count(response_time),
+        round(100.0 * count(*) filter (where recognized) / count(*), 2),
+        coalesce(avg(response_time), 0),
+        now()
+    from inserted
+    where user_email is not null and pattern is not null
+    group by user_email, pattern, coalesce(difficulty, '')
+    on conflict (user_email, pattern, difficulty) do update set
+        total_attempts = rollup.total_attempts + excluded.total_attempts,
+        total_recognized = rollup.total_recognized + excluded.total_recognized,
+        response_time_sum = rollup.response_time_sum + excluded.response_time_sum,
+        response_time_count = rollup.response_time_count + excluded.response_time_count,
+        success_rate = round(
+            100.0 * (rollup.total_recognized + excluded.total_recognized)
+            / (rollup.total_attempts + excluded.total_attempts), 2),
+        average_response_time = case
+            when rollup.response_time_count + excluded.response_time_count > 0
+            then (rollup.response_time_sum + excluded.response_time_sum)
+                 / (rollup.response_time_count + excluded.response_time_count)
+            else 0
+        end,
+        last_played = excluded.last_played;
+
+    return v_session_id;
+end;
+$$;
@@ -1,3 +1,25 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from .compounds import compound_splitter
+
+
+class CompoundSplitterTests(SimpleTestCase):
+    """Words the compound_words level accepts and rejects"""
+
+    def test_accepts_compounds(self):
+        for word, parts in [
+            ('toothbrush', ('tooth', 'brush')),
+            ('sunset', ('sun', 'set')),
+            ('cupcake', ('cup', 'cake')),
+            ('sun-set', ('sun', 'set')),
+            ('upstairs', ('up', 'stairs')),
+            ('tadpole', ('tad', 'pole')),
+        ]:
+            with self.subTest(word=word):
+                self.assertEqual(compound_splitter.split(word), parts)
+
+    def test_rejects_single_words(self):
+        for word in ['office', 'mango', 'napkin', 'into', 'onto', 'carton', 'cartoon',
+                     'today', 'pumpkin', 'sled', 'flower', 'butter', 'cat', 'sun set']:
+            with self.subTest(word=word):
+                self.assertIsNone(compound_splitter.split(word))
@@ -0,0 +1,245 @@
+# backend/wildlitz/phonics/word_bank.py
+"""
+Self-growing bank of validated AI phonics words.
+
+Every AI word that passes validation is stored in the phonics_word_bank
+table, deduplicated per (word, challenge_level, learning_focus, difficulty)
+and tagged with the phonics patterns found in it. Once a configuration has
+PHONICS_WORD_BANK_MIN_WORDS usable words, the configuration's word pool
+(word_pools.py) is refilled from the bank instead of the model, and games
+the pool cannot cover are served from it directly, so AI calls per game fall
+as the bank grows. Words drawn recently for a configuration are held back
+from the next draws, so consecutive games do not repeat words.
+
+Game results (the rows saved to phonics_word_performance) update each
+word's quality counters. Words that students rarely recognize, measured
+over at least PHONICS_WORD_BANK_MIN_ATTEMPTS attempts, stop being served;
+they can be reviewed and removed in the admin.
+"""
+
+import logging
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .fallback_words import fallback_word_bank
+from .models import PhonicsWordBankEntry
+from .patterns import analyzer as pattern_analyzer
+
+logger = logging.getLogger(__name__)
+
+RECENT_WORDS = 200  # drawn words per configuration held back from the next draws
+
+_recent_lock = threading.Lock()
+_recent = {}  # (challenge_level, learning_focus, difficulty) -> deque of word keys
+
+_stats_lock = threading.Lock()
+_stats = {
+    'hits': 0,
+    'misses': 0,
+    'harvested': 0,
+    'performance_updates': 0,
+    'errors': 0,
+}
+
+
+def _record(event, amount=1):
+    with _stats_lock:
+        _stats[event] += amount
+
+
+def _word_key(word):
+    if isinstance(word, dict):
+        word = word.get('word', '')
+    return str(word or '').strip().lower()
+
+
+def _enabled():
+    return getattr(settings, 'PHONICS_WORD_BANK_ENABLED', True)
+
+
+def _usable_entries(challenge_level, learning_focus, difficulty):
+    """Bank entries for a configuration, minus the ones students rarely recognize"""
+    min_attempts = getattr(settings, 'PHONICS_WORD_BANK_MIN_ATTEMPTS', 5)
+    min_recognition = getattr(settings, 'PHONICS_WORD_BANK_MIN_RECOGNITION', 0.2)
+    return PhonicsWordBankEntry.objects.filter(
+        challenge_level=challenge_level,
+        learning_focus=learning_focus,
+        difficulty=difficulty,
+    ).exclude(
+        Q(times_attempted__gte=min_attempts) & Q(times_recognized__lt=F('times_attempted') * min_recognition)
+    )
+
+
+def _held_back(key, available, count):
+    """Most recently drawn words of a configuration, leaving at least count of available words drawable"""
+    with _recent_lock:
+        recent = list(_recent.get(key, ()))
+    hold = min(len(recent), max(0, available - count))
+    return recent[len(recent) - hold:]
+
+
+def _remember_drawn(key, word_keys):
+    with _recent_lock:
+        _recent.setdefault(key, deque(maxlen=RECENT_WORDS)).extend(word_keys)
+
+
+def harvest(challenge_level, learning_focus, difficulty, word_objects):
+    """
+    Store validated AI words in the bank
+
+    Static fallback words (which pad short AI batches) and words already in
+    the bank for the configuration are skipped.
+
+    Returns:
+        int: Number of words offered to the bank
+    """
+    if not _enabled() or not word_objects:
+        return 0
+
+    entries = []
+    seen = set()
+    for word_obj in word_objects:
+        word_key = _word_key(word_obj)
+        if not word_key or word_key in seen or word_key in fallback_word_bank:
+            continue
+        seen.add(word_key)
+        entries.append(PhonicsWordBankEntry(
+            word_key=word_key[:200],
+            challenge_level=challenge_level,
+            learning_focus=learning_focus,
+            difficulty=difficulty,
+            pattern=str(word_obj.get('pattern') or '')[:20],
+            pattern_tags=sorted(pattern_analyzer.analyze(word_key).patterns),
+            word_data=dict(word_obj),
+        ))
+
+    if not entries:
+        return 0
+
+    try:
+        # The unique constraint drops words the bank already has
+        PhonicsWordBankEntry.objects.bulk_create(entries, ignore_conflicts=True)
+        _record('harvested', len(entries))
+        return len(entries)
+    except Exception as e:
+        # Banking words must never break the game request
+        logger.warning(f"⚠️ Word bank harvest failed: {str(e)}")
+        _record('errors')
+        return 0
+
+
+def draw(challenge_level, learning_focus, difficulty, count):
+    """
+    Draw words from the bank, skipping the configuration's recently drawn ones
+
+    Only draws once the configuration has PHONICS_WORD_BANK_MIN_WORDS usable
+    words (and at least count). The random pick runs in the database, so only
+    the drawn rows are read.
+
+    Returns:
+        list: count word dicts in random order, or None if the bank is too small
+    """
+    if not _enabled():
+        return None
+    try:
+        count = int(count)
+    except (TypeError, ValueError):
+        return None
+    if count <= 0:
+        return None
+
+    key = (challenge_level, learning_focus, difficulty)
+    try:
+        entries = _usable_entries(challenge_level, learning_focus, difficulty)
+        available = entries.count()
+        if available < max(getattr(settings, 'PHONICS_WORD_BANK_MIN_WORDS', 40), count):
+            _record('misses')
+            return None
+
+        picked = list(entries.exclude(word_key__in=_held_back(key, available, count))
+                      .order_by('?')
+                      .values_list('id', 'word_key', 'word_data')[:count])
+        if len(picked) < count:
+            _record('misses')
+            return None
+
+        PhonicsWordBankEntry.objects.filter(id__in=[entry_id for entry_id, _, _ in picked]).update(
+            times_served=F('times_served') + 1,
+            last_served=timezone.now()
+        )
+        _remember_drawn(key, [word_key for _, word_key, _ in picked])
+        _record('hits')
+        return [dict(word_data) for _, _, word_data in picked]
+
+    except Exception as e:
+        logger.warning(f"⚠️ Word bank draw failed: {str(e)}")
+        _record('errors')
+        return None
+
+
+def record_performance(challenge_level, learning_focus, difficulty, word_records):
+    """
+    Add game results to the quality counters of the banked words
+
+    Args:
+        word_records (list): Rows as saved to phonics_word_performance
+            ('word', 'recognized', 'response_time')
+    """
+    if not _enabled() or not word_records:
+        return
+
+    totals = {}
+    for record in word_records:
+        word_key = _word_key(record.get('word'))
+        if not word_key:
+            continue
+        attempts, recognized, response_time = totals.get(word_key, (0, 0, 0.0))
+        try:
+            response_time += float(record.get('response_time') or 0)
+        except (TypeError, ValueError):
+            pass
+        totals[word_key] = (attempts + 1, recognized + (1 if record.get('recognized') else 0), response_time)
+
+    try:
+        updated = 0
+        for word_key, (attempts, recognized, response_time) in totals.items():
+            updated += PhonicsWordBankEntry.objects.filter(
+                word_key=word_key,
+                challenge_level=challenge_level,
+                learning_focus=learning_focus,
+                difficulty=difficulty,
+            ).update(
+                times_attempted=F('times_attempted') + attempts,
+                times_recognized=F('times_recognized') + recognized,
+                total_response_time=F('total_response_time') + response_time
+            )
+        _record('performance_updates', updated)
+    except Exception as e:
+        logger.warning(f"⚠️ Word bank performance update failed: {str(e)}")
+        _record('errors')
+
+
+def get_word_bank_stats():
+    """Bank hit rate for this process plus words banked per configuration"""
+    with _stats_lock:
+        counters = dict(_stats)
+
+    draws = counters['hits'] + counters['misses']
+    counters['hit_rate'] = round(counters['hits'] / draws, 4) if draws else 0.0
+
+    try:
+        rows = PhonicsWordBankEntry.objects.values('challenge_level', 'learning_focus', 'difficulty')\
+            .annotate(total=Count('id'))\
+            .order_by('challenge_level', 'learning_focus', 'difficulty')
+        counters['configurations'] = {
+            f"{row['challenge_level']}/{row['learning_focus']}/{row['difficulty']}": row['total'] for row in rows
+        }
+        counters['entries'] = sum(counters['configurations'].values())
+    except Exception as e:
+        logger.warning(f"Word bank size lookup failed: {str(e)}")
+
+    return counters
@@ -0,0 +1,244 @@
+# backend/wildlitz/phonics/word_pools.py
+"""
+Pools of pre-validated vanishing-game words, one per configuration.
+
+A pool holds AI words that already passed validation for one
+(challenge_level, learning_focus, difficulty). generate_vanishing_words draws
+a game's words from the pool and only runs the generate-validate loop when
+the pool is short; words validated beyond what a game needed go back in.
+
+Whenever a pool drops below PHONICS_WORD_POOL_LOW_WATER a background thread
+tops it up to PHONICS_WORD_POOL_TARGET at background AI priority, so
+refilling never competes with students waiting on a response. The views
+refill from the word bank when it has enough words for the configuration and
+fall back to generating new ones.
+
+Drawn words leave the pool, and recently served words are not taken back
+in, so two games in a row do not repeat words. Pools are in memory and per
+worker process.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+
+from utils import ai_scheduler, ai_telemetry, deadline, fanout
+from .fallback_words import fallback_word_bank
+
+logger = logging.getLogger(__name__)
+
+CHALLENGE_LEVELS = ('simple_words', 'compound_words', 'phrases', 'simple_sentences')
+LEARNING_FOCUSES = ('short_vowels', 'long_vowels', 'blends', 'digraphs')
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+RECENT_WORDS = 200  # served words per pool kept out of the pool again
+REFILL_BACKOFF_SECONDS = 60  # wait after a refill that produced no words
+
+
+def _word_text(word_obj):
+    return str(word_obj.get('word', '')).strip().lower()
+
+
+def _new_pool_stats():
+    return {'hits': 0, 'misses': 0, 'served': 0, 'added': 0, 'refills': 0, 'refill_errors': 0}
+
+
+class _Pool:
+    __slots__ = ('words', 'texts', 'recent', 'stats', 'refilling', 'retry_after')
+
+    def __init__(self):
+        self.words = []
+        self.texts = set()
+        self.recent = deque(maxlen=RECENT_WORDS)
+        self.stats = _new_pool_stats()
+        self.refilling = False
+        self.retry_after = 0.0
+
+
+class WordPools:
+    """Validated words per (challenge_level, learning_focus, difficulty), refilled in the background"""
+
+    def __init__(self, enabled=True, target=40, low_water=15, refill_seconds=120):
+        self.enabled = enabled
+        self.target = target
+        self.low_water = min(low_water, target)
+        self.refill_seconds = refill_seconds
+        self._refill_fn = None
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def refill_with(self, fn):
+        """
+        Set how pools are refilled
+
+        Args:
+            fn (callable): fn(challenge_level, learning_focus, difficulty, word_count)
+                returning (validated words, attempts)
+        """
+        self._refill_fn = fn
+
+    def _pool(self, key):
+        """Pool for a known configuration (created on first use), else None"""
+        level, focus, difficulty = key
+        if level not in CHALLENGE_LEVELS or focus not in LEARNING_FOCUSES or difficulty not in DIFFICULTIES:
+            return None
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools.setdefault(key, _Pool())
+        return pool
+
+    def take(self, challenge_level, learning_focus, difficulty, count):
+        """
+        Draw count random words from the configuration's pool
+
+        Starts a background refill if the pool is (or ends up) below the low-water mark.
+
+        Returns:
+            list: count word dicts (copies), or None if the pool holds fewer
+        """
+        if not self.enabled:
+            return None
+        try:
+            count = int(count)
+        except (TypeError, ValueError):
+            return None
+
+        key = (challenge_level, learning_focus, difficulty)
+        with self._lock:
+            pool = self._pool(key)
+            if pool is None or count <= 0:
+                return None
+
+            if len(pool.words) < count:
+                pool.stats['misses'] += 1
+                taken = None
+            else:
+                taken = []
+                # Swap-remove random entries: O(count), order is random already
+                for _ in range(count):
+                    index = random.randrange(len(pool.words))
+                    pool.words[index], pool.words[-1] = pool.words[-1], pool.words[index]
+                    word_obj = pool.words.pop()
+                    text = _word_text(word_obj)
+                    pool.texts.discard(text)
+                    pool.recent.append(text)
+                    taken.append(dict(word_obj))
+                pool.stats['hits'] += 1
+                pool.stats['served'] += count
+
+        self._maybe_refill(key, wanted=count)
+        return taken
+
+    def add(self, challenge_level, learning_focus, difficulty, word_objects):
+        """
+        Put validated words into the configuration's pool
+
+        Skips duplicates, recently served words and static fallback words
+        (which only pad short AI batches). Stops at the pool target.
+
+        Returns:
+            int: Number of words added
+        """
+        if not self.enabled or not word_objects:
+            return 0
+
+        added = 0
+        with self._lock:
+            pool = self._pool((challenge_level, learning_focus, difficulty))
+            if pool is None:
+                return 0
+            for word_obj in word_objects:
+                if len(pool.words) >= self.target:
+                    break
+                text = _word_text(word_obj)
+                if not text or text in pool.texts or text in pool.recent or text in fallback_word_bank:
+                    continue
+                pool.words.append(dict(word_obj))
+                pool.texts.add(text)
+                added += 1
+            pool.stats['added'] += added
+        return added
+
+    def _maybe_refill(self, key, wanted=0):
+        """Start one background refill if the pool is low (or short of wanted words) and none is running"""
+        if self._refill_fn is None:
+            return
+        with self._lock:
+            pool = self._pool(key)
+            if (pool is None or pool.refilling or len(pool.words) >= max(self.low_water, wanted)
+                    or time.monotonic() < pool.retry_after):
+                return
+            pool.refilling = True
+        fanout.start(lambda: self._refill(key, pool), name=f"phonics-pool-{'-'.join(key)}")
+
+    def _refill(self, key, pool):
+        label = '/'.join(key)
+        added = 0
+        try:
+            needed = self.target - len(pool.words)
+            print(f"🏊 POOL: Refilling {label} with {needed} words in the background")
+            with ai_telemetry.track_request('phonics_word_pool_refill'), \
+                    ai_scheduler.priority_class(ai_scheduler.BACKGROUND), \
+                    deadline.request_deadline(self.refill_seconds):
+                words, _ = self._refill_fn(*key, needed)
+            added = self.add(*key, words)
+            print(f"🏊 POOL: {label} now holds {len(pool.words)} words (+{added})")
+        except Exception as e:
+            logger.warning(f"⚠️ Word pool refill for {label} failed: {str(e)}")
+            with self._lock:
+                pool.stats['refill_errors'] += 1
+        finally:
+            with self._lock:
+                pool.refilling = False
+                pool.stats['refills'] += 1
+                if not added:
+                    pool.retry_after = time.monotonic() + REFILL_BACKOFF_SECONDS
+
+    def prewarm(self, keys):
+        """
+        Start filling pools ahead of the first game
+
+        Args:
+            keys (list): 'challenge_level/learning_focus/difficulty' strings
+        """
+        if not self.enabled:
+            return
+        for entry in keys:
+            key = tuple(entry.split('/'))
+            if len(key) != 3 or self._pool(key) is None:
+                logger.warning(f"⚠️ Unknown phonics word pool '{entry}', not prewarming")
+                continue
+            self._maybe_refill(key)
+
+    def size(self, challenge_level, learning_focus, difficulty):
+        pool = self._pools.get((challenge_level, learning_focus, difficulty))
+        return len(pool.words) if pool else 0
+
+    def stats(self):
+        """Size and counters per pool for the metrics report"""
+        with self._lock:
+            pools = {
+                '/'.join(key): {'size': len(pool.words), 'refilling': pool.refilling, **pool.stats}
+                for key, pool in sorted(self._pools.items())
+            }
+        hits = sum(pool['hits'] for pool in pools.values())
+        misses = sum(pool['misses'] for pool in pools.values())
+        return {
+            'enabled': self.enabled,
+            'target': self.target,
+            'low_water': self.low_water,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            'pools': pools,
+        }
+
+
+word_pools = WordPools(
+    enabled=getattr(settings, 'PHONICS_WORD_POOL_ENABLED', True),
+    target=getattr(settings, 'PHONICS_WORD_POOL_TARGET', 40),
+    low_water=getattr(settings, 'PHONICS_WORD_POOL_LOW_WATER', 15),
+    refill_seconds=getattr(settings, 'PHONICS_WORD_POOL_REFILL_SECONDS', 120),
+)
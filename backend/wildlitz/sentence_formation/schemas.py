@@ -0,0 +1,61 @@
+# backend/wildlitz/sentence_formation/schemas.py
+"""
+Pydantic schemas for the JSON the model returns in sentence formation.
+Unknown keys are kept so the views see the model output unchanged.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, ConfigDict
+
+
+class VocabularyWord(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    word: str
+    clue: str = ''
+    definition: str = ''
+
+
+class EpisodeContent(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    title: str
+    text: str
+    recap: str = ''
+    discussionQuestions: List[str] = []
+    vocabularyWords: List[VocabularyWord] = []
+    vocabularyFocus: List[str] = []
+
+
+class StoryEpisode(EpisodeContent):
+    episodeNumber: int = 1
+
+
+class GeneratedStory(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    title: str
+    description: str = ''
+    episodes: List[StoryEpisode]
+
+
+class StoryOutput(BaseModel):
+    """generate_story: {"story": {...}}"""
+    story: GeneratedStory
+
+
+class NextEpisodeOutput(BaseModel):
+    """generate_next_episode: {"episode": {...}}"""
+    episode: EpisodeContent
+
+
+class WordExplanation(BaseModel):
+    """explain_word Reading Helper response"""
+    model_config = ConfigDict(extra='allow')
+
+    definition: str
+    example: str
+    part_of_speech: str
+    syllables: str
+    synonyms: List[str] = []
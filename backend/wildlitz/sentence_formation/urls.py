@@ -9,6 +9,10 @@ urlpatterns = [
 
     # ✅ NEW: Progressive episode generation endpoint
     path('generate-next-episode/', views.generate_next_episode, name='generate_next_episode'),
+
+    # Streaming (Server-Sent Events) variants of story / episode generation
+    path('generate-story/stream/', views.generate_story_stream, name='generate_story_stream'),
+    path('generate-next-episode/stream/', views.generate_next_episode_stream, name='generate_next_episode_stream'),
     
  
 
@@ -1,5 +1,5 @@
 # sentence_formation/views.py
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from rest_framework.decorators import api_view, permission_classes
@@ -19,15 +19,30 @@ from datetime import datetime, timedelta
 import traceback
 # Import progress tracking
 from api.models import UserProgress, UserActivity
+from utils import ai_telemetry, deadline
+from utils.ai_client import chat_completion, contains_json, stream_chat_completion
+from utils.ai_routing import JSON_GENERATION, LONG_STORY
+from utils.circuit_breaker import CircuitOpenError
+from utils.deadline import DeadlineExceeded, bind_supabase
+from utils.json_stream import StreamingJSONScanner
+from utils.ai_structured import (
+    JSON_OBJECT_FORMAT,
+    StructuredOutputError,
+    parse_structured,
+    structured_completion,
+)
+from .schemas import NextEpisodeOutput, StoryOutput, WordExplanation
 import json as json_module
 # Configure logger
 logger = logging.getLogger(__name__)
 
 # Configure OpenAI API key from settings
 openai.api_key = settings.OPENAI_API_KEY
+if settings.OPENAI_BASE_URL:
+    openai.base_url = settings.OPENAI_BASE_URL
 
 
-supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+supabase = bind_supabase(create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY))
 
 def log_sentence_formation_activity(user, activity_type, question_data, user_answer, correct_answer, is_correct, time_spent, difficulty='medium', challenge_level='', learning_focus=''):
     """Helper function to log sentence formation activities"""
@@ -105,152 +120,20 @@ def validate_vocabulary_matches_skills(vocabularyFocus, focus_skills):
     return True, "All skills represented", skill_matches
 
 
-def call_openai_for_story(prompt, max_tokens):
-    """Make OpenAI API call with proper error handling"""
-    try:
-        response = openai.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {
-                    "role": "system", 
-                    "content": f"You are an expert educational content creator for elementary students. CRITICAL REQUIREMENTS: 1) You MUST create AT LEAST 5 vocabulary words per episode AND AT LEAST 5 crossword puzzle entries per episode. 2) When multiple focus skills are selected, you MUST include words from EVERY SINGLE skill in EACH episode. For example, if the skills are phonics-ch, phonics-sh, and phonics-th, then EACH episode must have at least 1-2 words with CH, at least 1-2 words with SH, and at least 1-2 words with TH. 3) Do NOT use random words that don't match the selected skills. 4) You MUST return ONLY valid JSON without any markdown formatting or code blocks."
-                },
-                {
-                    "role": "user", 
-                    "content": prompt
-                }
-            ],
-            max_tokens=max_tokens,
-            temperature=0.7
-        )
-        
-        response_content = response.choices[0].message.content.strip()
-        
-        # Clean the response - remove markdown code blocks if present
-        import re
-        cleaned_content = response_content
-        cleaned_content = re.sub(r'^```json\s*', '', cleaned_content, flags=re.MULTILINE)
-        cleaned_content = re.sub(r'^```\s*$', '', cleaned_content, flags=re.MULTILINE)
-        cleaned_content = re.sub(r'```', '', cleaned_content)
-        cleaned_content = cleaned_content.strip()
-        
-        return cleaned_content
-        
-    except Exception as e:
-        logger.error(f"OpenAI API call failed: {e}")
-        return None
+STORY_SYSTEM_MESSAGE = "You are an expert educational content creator for elementary students. CRITICAL REQUIREMENTS: 1) You MUST create AT LEAST 5 vocabulary words per episode AND AT LEAST 5 crossword puzzle entries per episode. 2) When multiple focus skills are selected, you MUST include words from EVERY SINGLE skill in EACH episode. For example, if the skills are phonics-ch, phonics-sh, and phonics-th, then EACH episode must have at least 1-2 words with CH, at least 1-2 words with SH, and at least 1-2 words with TH. 3) Do NOT use random words that don't match the selected skills. 4) You MUST return ONLY valid JSON without any markdown formatting or code blocks."
 
-# ============================================
-# UPDATED generate_next_episode FUNCTION
-# ============================================
-# This replaces the existing function in backend/wildlitz/sentence_formation/views.py
-# 
-# KEY CHANGES:
-# 1. Enforces 80% new words minimum (max 20% repetition)
-# 2. Adds retry logic if too many words are repeated
-# 3. Strengthens the AI prompt to avoid repetition
-# 4. Adds validation that rejects episodes with excessive repetition
-# ============================================
+# ⭐ List of words that are too hard for grade 3
+TOO_HARD_FOR_GRADE3 = {
+    'explore', 'discover', 'treasure', 'ancient', 'journey', 'merchant', 'purchase',
+    'orchard', 'champion', 'fortress', 'expedition', 'navigate', 'territory', 'abundant',
+    'massive', 'adventure', 'quest', 'mystery', 'legend', 'kingdom', 'palace', 'temple',
+    'expedition', 'investigate', 'research', 'observe', 'examine', 'construct', 'design'
+}
 
-@csrf_exempt
-@api_view(['POST'])
-@permission_classes([AllowAny])
-def generate_next_episode(request):
-    """
-    Generate the next episode on-demand when user clicks 'Continue'
-    ✅ UPDATED: Ensures simple grade 3 vocabulary + 80% new words
-    """
-    try:
-        data = request.data
-        story_id = data.get('storyId')
-        episode_number = int(data.get('episodeNumber', 1))
-        theme = data.get('theme', 'adventure')
-        focus_skills = data.get('focusSkills', ['action-verbs'])
-        character_names = data.get('characterNames', '')
-        grade_level = data.get('gradeLevel', 3)
-        previous_episodes = data.get('previousEpisodes', [])
-        
-        # LIMIT TO MAX 2 SKILLS
-        if len(focus_skills) > 2:
-            focus_skills = focus_skills[:2]
-            logger.warning(f"⚠️ Too many skills selected, limiting to first 2: {focus_skills}")
-        
-        logger.info(f"📚 Generating episode {episode_number} for story {story_id}")
-        logger.info(f"   Theme: {theme}")
-        logger.info(f"   Focus Skills: {focus_skills}")
-        logger.info(f"   Grade Level: {grade_level}")
-        logger.info(f"   Previous episodes: {len(previous_episodes)}")
-        
-        if not settings.OPENAI_API_KEY:
-            logger.error("OpenAI API key is missing")
-            return Response({'error': 'API key not configured'}, 
-                          status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
-        # ⭐ Track previously used words
-        previously_used_words = set()
-        
-        for prev_ep in previous_episodes:
-            # From vocabularyWords array
-            prev_words = prev_ep.get('vocabularyWords', [])
-            if isinstance(prev_words, list):
-                for word_item in prev_words:
-                    if isinstance(word_item, dict):
-                        word = word_item.get('word', '').strip().lower()
-                        if word:
-                            previously_used_words.add(word)
-                    elif isinstance(word_item, str):
-                        word = word_item.strip().lower()
-                        if word:
-                            previously_used_words.add(word)
-            
-            # From vocabularyFocus array
-            vocab_focus = prev_ep.get('vocabularyFocus', [])
-            if isinstance(vocab_focus, list):
-                for word in vocab_focus:
-                    if isinstance(word, str):
-                        word = word.strip().lower()
-                        if word:
-                            previously_used_words.add(word)
-        
-        logger.info(f"🔍 Previously used words: {len(previously_used_words)} unique words")
-        if previously_used_words:
-            logger.info(f"   Used words: {', '.join(sorted(list(previously_used_words)[:15]))}{'...' if len(previously_used_words) > 15 else ''}")
-        
-        # Build story context
-        if previous_episodes:
-            recent_context = "\n\n".join([
-                f"Episode {ep.get('episodeNumber', i+1)}: {ep.get('recap', ep.get('text', '')[:150])}"
-                for i, ep in enumerate(previous_episodes[-2:])
-            ])
-        else:
-            recent_context = "This is the first episode."
-        
-        skills_text = ', '.join(focus_skills)
-        
-        # ⭐ SIMPLE GRADE 3 VOCABULARY EXAMPLES
-        simple_word_examples = {
-            'action-verbs': 'run, jump, walk, swim, hop, skip, climb, play, look, help, eat, sleep, talk, sing, dance, sit, stand',
-            'phonics-ch': 'chip, chat, chop, much, such, rich, beach, lunch, bench, chin, chest, check',
-            'phonics-sh': 'shop, ship, fish, dish, wish, rush, cash, wash, brush, shell, shed, shin',
-            'phonics-th': 'this, that, with, bath, math, path, cloth, moth, both, tooth, thin',
-            'default': 'run, big, red, cat, dog, sun, fun, box, hat, pen, cup, bed, yes, not, get'
-        }
-        
-        # Get examples for the focus skills
-        example_words = []
-        for skill in focus_skills:
-            if skill in simple_word_examples:
-                example_words.append(f"{skill}: {simple_word_examples[skill]}")
-            else:
-                example_words.append(f"{skill}: {simple_word_examples['default']}")
-        
-        examples_text = '\n   '.join(example_words)
-        
-        # ⭐ ENHANCED PROMPT - Simple vocabulary + No repetition
-        prompt = f"""You are creating Episode {episode_number} for Grade {grade_level} students (8-9 year olds).
 
-Theme: {theme}
-Previous story: {recent_context}
+# Static part of every next-episode prompt; the per-request details are appended after it
+NEXT_EPISODE_INSTRUCTIONS = """You are creating the next episode of a story for Grade 3 students (8-9 year olds).
+The episode number, theme, story so far, focus skills and previously used words are given at the end.
 
 CRITICAL REQUIREMENTS:
 
@@ -259,21 +142,17 @@ CRITICAL REQUIREMENTS:
    - Words should be 3-7 letters (mostly 4-5 letters)
    - Words kids use in daily conversation
    - NO advanced/fancy words
-   
-   ✅ GOOD simple words for grade 3:
-   {examples_text}
-   
+   - Use the GOOD simple word examples given for the focus skills
+
    ❌ BAD (too hard): explore, discover, treasure, ancient, journey, merchant, purchase, orchard, champion
 
 2. WORDS MUST BE COMPLETELY NEW:
-   - Do NOT use ANY of these previously used words:
-     {', '.join(sorted(list(previously_used_words))) if previously_used_words else 'None yet'}
-   
+   - Do NOT use ANY of the previously used words listed at the end
    - Do NOT use similar forms (e.g., if "run" used, don't use "runs", "running")
    - Each word must be DIFFERENT from all previous words
 
 3. SKILL REQUIREMENTS:
-   - Match focus skills: {skills_text}
+   - Match the focus skills listed at the end
    - Use the SIMPLEST words for these skills
    - Pick words kids already know
 
@@ -283,14 +162,12 @@ CRITICAL REQUIREMENTS:
    - All COMPLETELY NEW
    - All match the skills
 
-CHARACTER NAMES: {character_names if character_names else 'Use simple names like Max, Emma, Sam, Lily'}
-
 STORY FORMAT:
 - 2-3 short paragraphs (80-120 words total)
 - Simple sentences grade 3 kids can read
 - Use all 5 vocabulary words naturally
 - Make it fun and engaging
-- Continue from Episode {episode_number - 1}
+- Continue from the previous episode
 
 CLUES:
 - Write simple clues grade 3 kids understand
@@ -298,9 +175,9 @@ CLUES:
 - Make clues helpful, not tricky
 
 Return ONLY valid JSON (no markdown, no code blocks):
-{{
-  "episode": {{
-    "title": "Episode {episode_number}: [Simple Title]",
+{
+  "episode": {
+    "title": "Episode [episode number]: [Simple Title]",
     "text": "Story with 2-3 short paragraphs using the 5 simple words...",
     "recap": "One simple sentence summary",
     "discussionQuestions": [
@@ -309,153 +186,422 @@ Return ONLY valid JSON (no markdown, no code blocks):
       "What happens next?"
     ],
     "vocabularyWords": [
-      {{"word": "simple_word1", "clue": "Easy kid-friendly clue", "definition": "Simple definition"}},
-      {{"word": "simple_word2", "clue": "Easy kid-friendly clue", "definition": "Simple definition"}},
-      {{"word": "simple_word3", "clue": "Easy kid-friendly clue", "definition": "Simple definition"}},
-      {{"word": "simple_word4", "clue": "Easy kid-friendly clue", "definition": "Simple definition"}},
-      {{"word": "simple_word5", "clue": "Easy kid-friendly clue", "definition": "Simple definition"}}
+      {"word": "simple_word1", "clue": "Easy kid-friendly clue", "definition": "Simple definition"},
+      {"word": "simple_word2", "clue": "Easy kid-friendly clue", "definition": "Simple definition"},
+      {"word": "simple_word3", "clue": "Easy kid-friendly clue", "definition": "Simple definition"},
+      {"word": "simple_word4", "clue": "Easy kid-friendly clue", "definition": "Simple definition"},
+      {"word": "simple_word5", "clue": "Easy kid-friendly clue", "definition": "Simple definition"}
     ],
     "vocabularyFocus": ["simple_word1", "simple_word2", "simple_word3", "simple_word4", "simple_word5"]
-  }}
-}}
+  }
+}
 
 REMEMBER: Words MUST be simple for 8-9 year olds AND completely new!"""
 
-        # ⭐ List of words that are too hard for grade 3
-        TOO_HARD_FOR_GRADE3 = {
-            'explore', 'discover', 'treasure', 'ancient', 'journey', 'merchant', 'purchase', 
-            'orchard', 'champion', 'fortress', 'expedition', 'navigate', 'territory', 'abundant',
-            'massive', 'adventure', 'quest', 'mystery', 'legend', 'kingdom', 'palace', 'temple',
-            'expedition', 'investigate', 'research', 'observe', 'examine', 'construct', 'design'
+# Static part of every Episode 1 prompt; the per-request details are appended after it
+STORY_INSTRUCTIONS = """Create Episode 1 of a new multi-episode story for elementary students.
+Make it engaging and leave room for continuation in future episodes.
+The theme, grade, focus skills and vocabulary for this story are given at the end.
+
+VOCABULARY SELECTION RULES:
+1. Episode must have AT LEAST the required number of words from EACH selected skill
+2. Select MINIMUM 5 vocabulary words (you can use up to 8)
+3. ONLY use words that actually match the focus skills
+4. Words must be 3-8 letters long (grade 3 appropriate)
+5. Each vocabulary word MUST appear naturally in the story text
+6. ONLY use the vocabulary words listed at the end (DO NOT USE OTHER WORDS)
+
+STORY REQUIREMENTS:
+- 150-200 words total
+- Engaging narrative with vocabulary words used naturally
+- Follow the mixing rule given at the end
+
+Return ONLY valid JSON (NO markdown) in this exact format:
+{
+  "story": {
+    "title": "Story Title",
+    "description": "Brief description",
+    "episodes": [
+      {
+        "episodeNumber": 1,
+        "title": "Episode 1 Title",
+        "text": "Episode text with 2-3 paragraphs...",
+        "recap": "Brief 1-sentence summary",
+        "discussionQuestions": ["Question 1?", "Question 2?", "Question 3?"],
+        "vocabularyWords": [
+          {"word": "word1", "clue": "crossword clue", "definition": "kid-friendly definition"},
+          {"word": "word2", "clue": "crossword clue", "definition": "kid-friendly definition"},
+          {"word": "word3", "clue": "crossword clue", "definition": "kid-friendly definition"},
+          {"word": "word4", "clue": "crossword clue", "definition": "kid-friendly definition"},
+          {"word": "word5", "clue": "crossword clue", "definition": "kid-friendly definition"}
+        ],
+        "vocabularyFocus": ["word1", "word2", "word3", "word4", "word5"]
+      }
+    ]
+  }
+}"""
+
+
+def build_story_messages(prompt):
+    """Chat messages shared by every story / episode generation call"""
+    return [
+        {
+            "role": "system",
+            "content": STORY_SYSTEM_MESSAGE
+        },
+        {
+            "role": "user",
+            "content": prompt
         }
-        
-        # ⭐ Retry logic with validation
+    ]
+
+
+def request_story_json(prompt, max_tokens, schema, template, max_attempts=1):
+    """
+    Ask the model for a story / episode in JSON mode and validate it against schema.
+    Near-miss JSON is repaired locally; only irreparable output costs another call.
+
+    Raises:
+        StructuredOutputError: If the output could not be repaired into the schema
+    """
+    return structured_completion(
+        build_story_messages(prompt),
+        schema,
+        task=LONG_STORY,
+        client=openai,
+        max_tokens=max_tokens,
+        temperature=0.7,
+        template=template,
+        max_attempts=max_attempts
+    )
+
+# ============================================
+# UPDATED generate_next_episode FUNCTION
+# ============================================
+# This replaces the existing function in backend/wildlitz/sentence_formation/views.py
+#
+# KEY CHANGES:
+# 1. Enforces 80% new words minimum (max 20% repetition)
+# 2. Adds retry logic if too many words are repeated
+# 3. Strengthens the AI prompt to avoid repetition
+# 4. Adds validation that rejects episodes with excessive repetition
+# ============================================
+
+def prepare_next_episode(data):
+    """
+    Read a next-episode request and build its generation prompt
+
+    Returns:
+        dict: Request parameters plus 'previously_used_words' and 'prompt'
+    """
+    story_id = data.get('storyId')
+    episode_number = int(data.get('episodeNumber', 1))
+    theme = data.get('theme', 'adventure')
+    focus_skills = data.get('focusSkills', ['action-verbs'])
+    character_names = data.get('characterNames', '')
+    grade_level = data.get('gradeLevel', 3)
+    previous_episodes = data.get('previousEpisodes', [])
+
+    # LIMIT TO MAX 2 SKILLS
+    if len(focus_skills) > 2:
+        focus_skills = focus_skills[:2]
+        logger.warning(f"⚠️ Too many skills selected, limiting to first 2: {focus_skills}")
+
+    logger.info(f"📚 Generating episode {episode_number} for story {story_id}")
+    logger.info(f"   Theme: {theme}")
+    logger.info(f"   Focus Skills: {focus_skills}")
+    logger.info(f"   Grade Level: {grade_level}")
+    logger.info(f"   Previous episodes: {len(previous_episodes)}")
+
+    # ⭐ Track previously used words
+    previously_used_words = set()
+
+    for prev_ep in previous_episodes:
+        # From vocabularyWords array
+        prev_words = prev_ep.get('vocabularyWords', [])
+        if isinstance(prev_words, list):
+            for word_item in prev_words:
+                if isinstance(word_item, dict):
+                    word = word_item.get('word', '').strip().lower()
+                    if word:
+                        previously_used_words.add(word)
+                elif isinstance(word_item, str):
+                    word = word_item.strip().lower()
+                    if word:
+                        previously_used_words.add(word)
+
+        # From vocabularyFocus array
+        vocab_focus = prev_ep.get('vocabularyFocus', [])
+        if isinstance(vocab_focus, list):
+            for word in vocab_focus:
+                if isinstance(word, str):
+                    word = word.strip().lower()
+                    if word:
+                        previously_used_words.add(word)
+
+    logger.info(f"🔍 Previously used words: {len(previously_used_words)} unique words")
+    if previously_used_words:
+        logger.info(f"   Used words: {', '.join(sorted(list(previously_used_words)[:15]))}{'...' if len(previously_used_words) > 15 else ''}")
+
+    # Build story context
+    if previous_episodes:
+        recent_context = "\n\n".join([
+            f"Episode {ep.get('episodeNumber', i+1)}: {ep.get('recap', ep.get('text', '')[:150])}"
+            for i, ep in enumerate(previous_episodes[-2:])
+        ])
+    else:
+        recent_context = "This is the first episode."
+
+    skills_text = ', '.join(focus_skills)
+
+    # ⭐ SIMPLE GRADE 3 VOCABULARY EXAMPLES
+    simple_word_examples = {
+        'action-verbs': 'run, jump, walk, swim, hop, skip, climb, play, look, help, eat, sleep, talk, sing, dance, sit, stand',
+        'phonics-ch': 'chip, chat, chop, much, such, rich, beach, lunch, bench, chin, chest, check',
+        'phonics-sh': 'shop, ship, fish, dish, wish, rush, cash, wash, brush, shell, shed, shin',
+        'phonics-th': 'this, that, with, bath, math, path, cloth, moth, both, tooth, thin',
+        'default': 'run, big, red, cat, dog, sun, fun, box, hat, pen, cup, bed, yes, not, get'
+    }
+
+    # Get examples for the focus skills
+    example_words = []
+    for skill in focus_skills:
+        if skill in simple_word_examples:
+            example_words.append(f"{skill}: {simple_word_examples[skill]}")
+        else:
+            example_words.append(f"{skill}: {simple_word_examples['default']}")
+
+    examples_text = '\n   '.join(example_words)
+
+    # ⭐ ENHANCED PROMPT - Simple vocabulary + No repetition
+    # Shared instructions first, this request's details last (keeps a cacheable prefix)
+    used_words_text = ', '.join(sorted(list(previously_used_words))) if previously_used_words else 'None yet'
+    prompt = NEXT_EPISODE_INSTRUCTIONS + f"""
+
+================================
+THIS EPISODE:
+================================
+Episode number: {episode_number} (continue from Episode {episode_number - 1})
+Grade level: Grade {grade_level}
+Theme: {theme}
+Previous story: {recent_context}
+
+Focus skills: {skills_text}
+
+GOOD simple words for these skills:
+   {examples_text}
+
+PREVIOUSLY USED WORDS (do NOT use any of these):
+   {used_words_text}
+
+CHARACTER NAMES: {character_names if character_names else 'Use simple names like Max, Emma, Sam, Lily'}"""
+
+    return {
+        'story_id': story_id,
+        'episode_number': episode_number,
+        'theme': theme,
+        'focus_skills': focus_skills,
+        'grade_level': grade_level,
+        'previously_used_words': previously_used_words,
+        'prompt': prompt,
+        'max_tokens': 1800
+    }
+
+
+def review_episode_vocabulary(vocab_focus, previously_used_words, episode_number):
+    """Check a generated episode's vocabulary for repetition and grade-3 difficulty"""
+    MAX_REPETITION_RATE = 0.20  # Max 20% repetition
+
+    # ⭐ VALIDATE: Check repetition
+    repeated_words = [w for w in vocab_focus if w.lower() in previously_used_words]
+    new_words = [w for w in vocab_focus if w.lower() not in previously_used_words]
+    repetition_rate = len(repeated_words) / len(vocab_focus) if vocab_focus else 1.0
+
+    # ⭐ VALIDATE: Check difficulty
+    too_hard_words = [w for w in vocab_focus if w.lower() in TOO_HARD_FOR_GRADE3 or len(w) > 8]
+
+    logger.info(f"📊 Word Analysis for Episode {episode_number}:")
+    logger.info(f"   Total: {len(vocab_focus)}")
+    logger.info(f"   New: {len(new_words)} - {new_words}")
+    logger.info(f"   Repeated: {len(repeated_words)} - {repeated_words}")
+    logger.info(f"   Too hard: {len(too_hard_words)} - {too_hard_words}")
+    logger.info(f"   Repetition rate: {repetition_rate * 100:.1f}%")
+
+    return {
+        'new_words': new_words,
+        'repeated_words': repeated_words,
+        'too_hard_words': too_hard_words,
+        'repetition_rate': repetition_rate,
+        'has_issues': repetition_rate > MAX_REPETITION_RATE or len(too_hard_words) > 0
+    }
+
+
+def episode_retry_feedback(review):
+    """Prompt suffix telling the model which words to avoid on the next attempt"""
+    feedback_parts = []
+
+    if review['repeated_words']:
+        feedback_parts.append(f"REPEATED words (DON'T use): {', '.join(review['repeated_words'])}")
+
+    if review['too_hard_words']:
+        feedback_parts.append(f"TOO HARD for grade 3 (use SIMPLER): {', '.join(review['too_hard_words'])}")
+
+    return f"\n\n⚠️ IMPORTANT: {' AND '.join(feedback_parts)}. Use SIMPLE, NEW words only!"
+
+
+def can_retry_episode(attempt, max_retries):
+    """True while another attempt is allowed and the request still has time for it"""
+    return attempt < max_retries - 1 and not deadline.expired()
+
+
+def format_next_episode(episode, vocab_focus, review, episode_context):
+    """Build the generate_next_episode response payload for a parsed episode"""
+    story_id = episode_context['story_id']
+    episode_number = episode_context['episode_number']
+
+    # Validate skill matching (existing code)
+    is_valid, message, skill_matches = validate_vocabulary_matches_skills(vocab_focus, episode_context['focus_skills'])
+    if not is_valid:
+        logger.warning(f"⚠️ Skill validation: {message}")
+
+    # Create episode and puzzle IDs
+    episode_id = f"{story_id}_ep{episode_number}"
+    puzzle_id = f"{episode_id}_puzzle"
+
+    # Create crossword puzzle
+    puzzle = create_crossword_from_vocabulary(
+        episode['vocabularyWords'],
+        f"Episode {episode_number} Vocabulary"
+    )
+
+    logger.info(f"✅ Episode {episode_number} generated successfully!")
+    logger.info(f"   Title: {episode.get('title', 'Unknown')}")
+    logger.info(f"   Final vocabulary: {', '.join(vocab_focus)}")
+
+    # Format response
+    return {
+        'success': True,
+        'episode': {
+            'id': episode_id,
+            'episodeNumber': episode_number,
+            'title': episode['title'],
+            'text': episode['text'],
+            'recap': episode.get('recap', ''),
+            'discussionQuestions': episode.get('discussionQuestions', []),
+            'crosswordPuzzleId': puzzle_id,
+            'vocabularyFocus': vocab_focus,
+            'vocabularyWords': episode.get('vocabularyWords', [])
+        },
+        'puzzle': {puzzle_id: puzzle},
+        'wordStats': {
+            'newWords': len(review['new_words']),
+            'repeatedWords': len(review['repeated_words']),
+            'tooHardWords': len(review['too_hard_words']),
+            'repetitionRate': round(review['repetition_rate'] * 100, 1)
+        }
+    }
+
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def generate_next_episode(request):
+    """
+    Generate the next episode on-demand when user clicks 'Continue'
+    ✅ UPDATED: Ensures simple grade 3 vocabulary + 80% new words
+    """
+    episode_number = request.data.get('episodeNumber', 1)
+    try:
+        episode_context = prepare_next_episode(request.data)
+        episode_number = episode_context['episode_number']
+        previously_used_words = episode_context['previously_used_words']
+        prompt = episode_context['prompt']
+
+        if not settings.OPENAI_API_KEY:
+            logger.error("OpenAI API key is missing")
+            return Response({'error': 'API key not configured'},
+                          status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # ⭐ Retry logic with validation (no new attempt once the time budget is spent)
         max_retries = 3
-        MAX_REPETITION_RATE = 0.20  # Max 20% repetition
-        
+        best_attempt = None  # Last usable episode with issues, served if time runs out
+
         for attempt in range(max_retries):
             try:
                 logger.info(f"🤖 Attempt {attempt + 1}/{max_retries} - Generating Episode {episode_number}")
-                
-                max_tokens = 1800
-                cleaned_content = call_openai_for_story(prompt, max_tokens)
-                
-                if not cleaned_content:
-                    logger.error(f"❌ Empty response from OpenAI")
-                    if attempt < max_retries - 1:
-                        continue
-                    return Response({'error': 'Failed to generate episode'}, 
-                                  status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-                
-                # Parse response
-                episode_data = json.loads(cleaned_content)
+                ai_telemetry.mark_attempt(attempt + 1)
+
+                # Parsed, repaired and schema-validated response
+                episode_data = request_story_json(prompt, episode_context['max_tokens'], NextEpisodeOutput, 'sentence_formation.next_episode')
                 episode = episode_data.get('episode', {})
                 vocab_focus = episode.get('vocabularyFocus', [])
-                
+
                 if not vocab_focus or len(vocab_focus) < 5:
                     logger.warning(f"⚠️ Insufficient vocabulary ({len(vocab_focus)} words)")
-                    if attempt < max_retries - 1:
+                    if can_retry_episode(attempt, max_retries):
                         continue
-                
-                # ⭐ VALIDATE: Check repetition
-                repeated_words = [w for w in vocab_focus if w.lower() in previously_used_words]
-                new_words = [w for w in vocab_focus if w.lower() not in previously_used_words]
-                repetition_rate = len(repeated_words) / len(vocab_focus) if vocab_focus else 1.0
-                
-                # ⭐ VALIDATE: Check difficulty
-                too_hard_words = [w for w in vocab_focus if w.lower() in TOO_HARD_FOR_GRADE3 or len(w) > 8]
-                
-                logger.info(f"📊 Word Analysis for Episode {episode_number}:")
-                logger.info(f"   Total: {len(vocab_focus)}")
-                logger.info(f"   New: {len(new_words)} - {new_words}")
-                logger.info(f"   Repeated: {len(repeated_words)} - {repeated_words}")
-                logger.info(f"   Too hard: {len(too_hard_words)} - {too_hard_words}")
-                logger.info(f"   Repetition rate: {repetition_rate * 100:.1f}%")
-                
-                # Check if acceptable
-                has_issues = repetition_rate > MAX_REPETITION_RATE or len(too_hard_words) > 0
-                
-                if has_issues and attempt < max_retries - 1:
+
+                review = review_episode_vocabulary(vocab_focus, previously_used_words, episode_number)
+
+                if review['has_issues'] and can_retry_episode(attempt, max_retries):
                     logger.warning(f"⚠️ Issues found, retrying...")
-                    feedback_parts = []
-                    
-                    if repeated_words:
-                        feedback_parts.append(f"REPEATED words (DON'T use): {', '.join(repeated_words)}")
-                    
-                    if too_hard_words:
-                        feedback_parts.append(f"TOO HARD for grade 3 (use SIMPLER): {', '.join(too_hard_words)}")
-                    
-                    prompt += f"\n\n⚠️ IMPORTANT: {' AND '.join(feedback_parts)}. Use SIMPLE, NEW words only!"
+                    if len(vocab_focus) >= 5:
+                        best_attempt = (episode, vocab_focus, review)
+                    prompt += episode_retry_feedback(review)
                     continue
-                
-                if has_issues:
-                    logger.warning(f"⚠️ Accepting after {max_retries} attempts with issues")
+
+                if review['has_issues']:
+                    logger.warning(f"⚠️ Accepting after {attempt + 1} attempts with issues")
                 else:
                     logger.info(f"✅ Perfect! Simple words + No repetition")
-                
-                # Validate skill matching (existing code)
-                is_valid, message, skill_matches = validate_vocabulary_matches_skills(vocab_focus, focus_skills)
-                if not is_valid:
-                    logger.warning(f"⚠️ Skill validation: {message}")
-                
-                # Create episode and puzzle IDs
-                episode_id = f"{story_id}_ep{episode_number}"
-                puzzle_id = f"{episode_id}_puzzle"
-                
-                # Create crossword puzzle
-                puzzle = create_crossword_from_vocabulary(
-                    episode['vocabularyWords'],
-                    f"Episode {episode_number} Vocabulary"
-                )
-                
-                logger.info(f"✅ Episode {episode_number} generated successfully!")
-                logger.info(f"   Title: {episode.get('title', 'Unknown')}")
-                logger.info(f"   Final vocabulary: {', '.join(vocab_focus)}")
-                
-                # Format response
-                response_data = {
-                    'success': True,
-                    'episode': {
-                        'id': episode_id,
-                        'episodeNumber': episode_number,
-                        'title': episode['title'],
-                        'text': episode['text'],
-                        'recap': episode.get('recap', ''),
-                        'discussionQuestions': episode.get('discussionQuestions', []),
-                        'crosswordPuzzleId': puzzle_id,
-                        'vocabularyFocus': vocab_focus,
-                        'vocabularyWords': episode.get('vocabularyWords', [])
-                    },
-                    'puzzle': {puzzle_id: puzzle},
-                    'wordStats': {
-                        'newWords': len(new_words),
-                        'repeatedWords': len(repeated_words),
-                        'tooHardWords': len(too_hard_words),
-                        'repetitionRate': round(repetition_rate * 100, 1)
-                    }
-                }
-                
+
+                response_data = format_next_episode(episode, vocab_focus, review, episode_context)
+
                 return Response(response_data, status=status.HTTP_200_OK)
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ JSON parsing error (attempt {attempt + 1}): {str(e)}")
-                if attempt < max_retries - 1:
+
+            except StructuredOutputError as e:
+                logger.error(f"❌ Unusable episode JSON (attempt {attempt + 1}): {str(e)}")
+                if can_retry_episode(attempt, max_retries):
                     continue
-                return Response({'error': 'Invalid response format'}, 
+                if best_attempt:
+                    break
+                return Response({'error': 'Invalid response format'},
                               status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            except CircuitOpenError:
+                # Provider is down; retrying would only fail again
+                logger.warning(f"⚡ AI provider unavailable, not retrying Episode {episode_number}")
+                if best_attempt:
+                    break
+                return Response({'error': 'AI service temporarily unavailable'},
+                              status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            except DeadlineExceeded:
+                logger.warning(f"⏱️ Time budget spent on attempt {attempt + 1} - Episode {episode_number}")
+                if best_attempt:
+                    break
+                return Response({'error': 'Episode generation took too long, please try again'},
+                              status=status.HTTP_504_GATEWAY_TIMEOUT)
             except Exception as e:
                 logger.error(f"❌ Error in attempt {attempt + 1}: {str(e)}")
-                if attempt < max_retries - 1:
+                if can_retry_episode(attempt, max_retries):
                     continue
+                if best_attempt:
+                    break
                 raise
-        
-        return Response({'error': 'Failed after multiple attempts'}, 
+
+        if best_attempt:
+            # Out of time (or attempts) after a usable episode: serve it with its issues
+            logger.warning(f"⚠️ Serving the best earlier attempt for Episode {episode_number}")
+            episode, vocab_focus, review = best_attempt
+            return Response(format_next_episode(episode, vocab_focus, review, episode_context),
+                            status=status.HTTP_200_OK)
+
+        return Response({'error': 'Failed after multiple attempts'},
                       status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        
+
     except Exception as e:
         logger.error(f"❌ Error generating Episode {episode_number}: {str(e)}")
         logger.error(f"   Traceback: {traceback.format_exc()}")
-        return Response({'error': str(e)}, 
+        return Response({'error': str(e)},
                       status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
@@ -463,7 +609,7 @@ REMEMBER: Words MUST be simple for 8-9 year olds AND completely new!"""
 def create_crossword_from_vocabulary(vocab_words, title="Vocabulary Puzzle"):
     """Helper function to create a crossword puzzle from vocabulary words"""
     puzzle_words = []
-    
+
     for i, word_data in enumerate(vocab_words):
         puzzle_words.append({
             "direction": "across" if i % 2 == 0 else "down",
@@ -473,7 +619,7 @@ def create_crossword_from_vocabulary(vocab_words, title="Vocabulary Puzzle"):
             "definition": word_data.get('definition', ''),
             "example": f"Example sentence using {word_data['word']}."
         })
-    
+
     return {
         "title": title,
         "size": {"width": 10, "height": 10},
@@ -482,66 +628,51 @@ def create_crossword_from_vocabulary(vocab_words, title="Vocabulary Puzzle"):
     }
 
 
-
-@csrf_exempt
-@api_view(['POST'])
-@permission_classes([AllowAny])
-def generate_story(request):
+def prepare_story(data):
     """
-    MODIFIED: Now only generates the FIRST episode
-    Additional episodes are generated on-demand via generate_next_episode endpoint
+    Read a generate_story request and build the Episode 1 prompt
+
+    Returns:
+        dict: Request parameters plus 'story_id', 'max_tokens' and 'prompt'
     """
-    try:
-        data = request.data
-        theme = data.get('theme', 'jungle')
-        focus_skills = data.get('focusSkills', ['action-verbs'])
-        character_names = data.get('characterNames', '')
-        total_episodes = min(int(data.get('totalEpisodes', 3)), 5)
-        grade_level = data.get('gradeLevel', 3)
-        
-        # ALWAYS generate only 1 episode initially
-        episode_count = 1
-        
-        # LIMIT TO MAX 2 SKILLS
-        if len(focus_skills) > 2:
-            focus_skills = focus_skills[:2]
-            logger.warning(f"⚠️ Too many skills selected, limiting to first 2: {focus_skills}")
-        
-        logger.info(f"📚 Initial story generation: theme={theme}, skills={focus_skills}, total_episodes={total_episodes}")
-        logger.info(f"⭐ Generating ONLY episode 1, remaining episodes will be generated on-demand")
-        
-        if not settings.OPENAI_API_KEY:
-            logger.error("OpenAI API key is missing")
-            return Response(
-                {'error': 'OpenAI API key is not configured'}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-            
-        story_id = f"{theme}_generated_{int(datetime.now().timestamp())}"
-        max_tokens = 1800
-        
-        # Get vocabulary guidance (without exclude_words for first episode)
-        vocab_guidance = get_vocabulary_guidance(focus_skills)
-        
-        logger.info(f"📝 Generating with focus skills: {focus_skills}")
-        
-        # Create skill requirements
-        skill_requirements = []
-        words_per_skill = 3 if len(focus_skills) == 1 else 2
-        
-        for skill in focus_skills:
-            if skill in FOCUS_SKILL_VOCABULARY:
-                examples = ', '.join(FOCUS_SKILL_VOCABULARY[skill]['examples'][:5])
-                skill_requirements.append(f"   - {skill}: Include at least {words_per_skill} words like: {examples}")
-        
-        # BUILD EMPHATIC MIXING INSTRUCTION
-        if len(focus_skills) == 1:
-            mixing_instruction = f"""Focus on the {focus_skills[0]} skill.
+    theme = data.get('theme', 'jungle')
+    focus_skills = data.get('focusSkills', ['action-verbs'])
+    character_names = data.get('characterNames', '')
+    total_episodes = min(int(data.get('totalEpisodes', 3)), 5)
+    grade_level = data.get('gradeLevel', 3)
+
+    # LIMIT TO MAX 2 SKILLS
+    if len(focus_skills) > 2:
+        focus_skills = focus_skills[:2]
+        logger.warning(f"⚠️ Too many skills selected, limiting to first 2: {focus_skills}")
+
+    logger.info(f"📚 Initial story generation: theme={theme}, skills={focus_skills}, total_episodes={total_episodes}")
+    logger.info(f"⭐ Generating ONLY episode 1, remaining episodes will be generated on-demand")
+
+    story_id = f"{theme}_generated_{int(datetime.now().timestamp())}"
+
+    # Get vocabulary guidance (without exclude_words for first episode)
+    vocab_guidance = get_vocabulary_guidance(focus_skills)
+
+    logger.info(f"📝 Generating with focus skills: {focus_skills}")
+
+    # Create skill requirements
+    skill_requirements = []
+    words_per_skill = 3 if len(focus_skills) == 1 else 2
+
+    for skill in focus_skills:
+        if skill in FOCUS_SKILL_VOCABULARY:
+            examples = ', '.join(FOCUS_SKILL_VOCABULARY[skill]['examples'][:5])
+            skill_requirements.append(f"   - {skill}: Include at least {words_per_skill} words like: {examples}")
+
+    # BUILD EMPHATIC MIXING INSTRUCTION
+    if len(focus_skills) == 1:
+        mixing_instruction = f"""Focus on the {focus_skills[0]} skill.
 This episode should have 5-7 words from this skill."""
-            validation_rule = f"VALIDATION: Episode MUST have at least 5 words from {focus_skills[0]}"
-        else:
-            skill1, skill2 = focus_skills[0], focus_skills[1]
-            mixing_instruction = f"""
+        validation_rule = f"VALIDATION: Episode MUST have at least 5 words from {focus_skills[0]}"
+    else:
+        skill1, skill2 = focus_skills[0], focus_skills[1]
+        mixing_instruction = f"""
 CRITICAL MIXING RULE - THIS IS MANDATORY FOR THIS EPISODE:
 - Skill 1 ({skill1}): MUST have at least 2 words. Examples: {', '.join(FOCUS_SKILL_VOCABULARY[skill1]['examples'][:5])}
 - Skill 2 ({skill2}): MUST have at least 2 words. Examples: {', '.join(FOCUS_SKILL_VOCABULARY[skill2]['examples'][:5])}
@@ -549,19 +680,24 @@ CRITICAL MIXING RULE - THIS IS MANDATORY FOR THIS EPISODE:
 This episode needs words from BOTH skills.
 The episode MUST be a MIX of BOTH {skill1} AND {skill2}.
 """
-            validation_rule = f"VALIDATION: Episode 1 needs {skill1}+{skill2}"
-        
-        # Build character context
-        character_context = ""
-        if character_names:
-            character_context = f"\nUse these character names: {character_names}"
-        
-        # CREATE THE AI PROMPT
-        prompt = f"""Create Episode 1 for a new story about {theme} theme for grade {grade_level} students.
-{character_context}
+        validation_rule = f"VALIDATION: Episode 1 needs {skill1}+{skill2}"
+
+    # Build character context
+    character_context = ""
+    if character_names:
+        character_context = f"\nUse these character names: {character_names}"
 
+    # CREATE THE AI PROMPT
+    # Shared instructions first, this request's details last (keeps a cacheable prefix)
+    prompt = STORY_INSTRUCTIONS + f"""
+
+================================
+THIS STORY:
+================================
+Theme: {theme}
+Grade level: Grade {grade_level}
 This will be a {total_episodes}-episode story, but you're creating ONLY Episode 1 now.
-Make it engaging and leave room for continuation in future episodes.
+{character_context}
 
 ================================
 MANDATORY VOCABULARY MIXING (READ THIS CAREFULLY):
@@ -576,152 +712,157 @@ Selected skills: {', '.join(focus_skills)}
 REQUIREMENTS FOR THIS EPISODE:
 ================================
 {chr(10).join(skill_requirements)}
+- Episode must have AT LEAST {words_per_skill} words from EACH selected skill
+- {"Focus on " + focus_skills[0] + " words" if len(focus_skills) == 1 else "Mix words from BOTH " + " and ".join(focus_skills) + " skills"}
 
 ================================
 FOCUS SKILLS VOCABULARY REQUIREMENTS:
 ================================
 {vocab_guidance.get('detailed_guidance', '')}
 
-VOCABULARY SELECTION RULES:
-1. Episode must have AT LEAST {words_per_skill} words from EACH selected skill
-2. Select MINIMUM 5 vocabulary words (you can use up to 8)
-3. ONLY use words that actually match the focus skills
-4. Words must be 3-8 letters long (grade 3 appropriate)
-5. Each vocabulary word MUST appear naturally in the story text
-
 USE THESE VOCABULARY WORDS (DO NOT USE OTHER WORDS):
-{', '.join(vocab_guidance.get('example_words', [])[:30])}
+{', '.join(vocab_guidance.get('example_words', [])[:30])}"""
 
-================================
-STORY REQUIREMENTS:
-================================
-- 150-200 words total
-- Engaging narrative with vocabulary words used naturally
-- {"Focus on " + focus_skills[0] + " words" if len(focus_skills) == 1 else "Mix words from BOTH " + " and ".join(focus_skills) + " skills"}
+    return {
+        'story_id': story_id,
+        'theme': theme,
+        'focus_skills': focus_skills,
+        'character_names': character_names,
+        'total_episodes': total_episodes,
+        'grade_level': grade_level,
+        'max_tokens': 1800,
+        'prompt': prompt
+    }
 
-Return ONLY valid JSON (NO markdown) in this exact format:
-{{
-  "story": {{
-    "title": "Story Title",
-    "description": "Brief description",
-    "episodes": [
-      {{
-        "episodeNumber": 1,
-        "title": "Episode 1 Title",
-        "text": "Episode text with 2-3 paragraphs...",
-        "recap": "Brief 1-sentence summary",
-        "discussionQuestions": ["Question 1?", "Question 2?", "Question 3?"],
-        "vocabularyWords": [
-          {{"word": "word1", "clue": "crossword clue", "definition": "kid-friendly definition"}},
-          {{"word": "word2", "clue": "crossword clue", "definition": "kid-friendly definition"}},
-          {{"word": "word3", "clue": "crossword clue", "definition": "kid-friendly definition"}},
-          {{"word": "word4", "clue": "crossword clue", "definition": "kid-friendly definition"}},
-          {{"word": "word5", "clue": "crossword clue", "definition": "kid-friendly definition"}}
-        ],
-        "vocabularyFocus": ["word1", "word2", "word3", "word4", "word5"]
-      }}
-    ]
-  }}
-}}"""
 
-        # Call OpenAI
-        logger.info(f"🤖 Calling OpenAI with {max_tokens} tokens for Episode 1")
-        cleaned_content = call_openai_for_story(prompt, max_tokens)
-        
-        if not cleaned_content:
-            logger.error(f"❌ OpenAI returned empty response")
+def format_generated_story(story_data, story_context):
+    """
+    Build the generate_story response payload from the parsed model JSON
+
+    Raises:
+        ValueError: If the story has no episode or too little vocabulary
+    """
+    story_id = story_context['story_id']
+    theme = story_context['theme']
+    focus_skills = story_context['focus_skills']
+
+    logger.info("🔍 FULL OPENAI RESPONSE:")
+    logger.info(json_module.dumps(story_data, indent=2)[:1000])
+
+    # Validate the story
+    episodes = story_data.get('story', {}).get('episodes', [])
+    if episodes:
+        vocab_words = episodes[0].get('vocabularyWords', [])
+        logger.info(f"📚 Vocabulary check: {len(vocab_words)} words found")
+        logger.info(f"   Words: {vocab_words}")
+
+    if not episodes or len(episodes) == 0:
+        raise ValueError("No episodes generated")
+
+    episode = episodes[0]
+
+    # VALIDATE VOCABULARY MATCHES SKILLS
+    vocab_focus = episode.get('vocabularyFocus', [])
+    is_valid, message, skill_matches = validate_vocabulary_matches_skills(vocab_focus, focus_skills)
+
+    if not is_valid:
+        logger.warning(f"⚠️ Episode 1 validation failed: {message}")
+        logger.warning(f"   Vocabulary: {', '.join(vocab_focus)}")
+        logger.warning(f"   Skill distribution: {skill_matches}")
+
+    # Format the response
+    formatted_story = {
+        "id": story_id,
+        "title": story_data['story']['title'],
+        "description": story_data['story'].get('description', f"An adventure about {theme}"),
+        "theme": theme,
+        "gradeLevel": f"Grade {story_context['grade_level']}",
+        "totalEpisodes": story_context['total_episodes'],
+        "generatedEpisodes": 1,
+        "focusSkills": focus_skills,
+        "characterNames": story_context['character_names'],
+        "episodes": []
+    }
+
+    # Create puzzles dictionary
+    puzzles = {}
+
+    # Process the single episode
+    episode_id = f"{story_id}_ep1"
+    puzzle_id = f"{episode_id}_puzzle"
+
+    # Validate vocabulary words exist
+    if not episode.get('vocabularyWords') or len(episode['vocabularyWords']) < 5:
+        logger.error(f"❌ Insufficient vocabulary words in episode 1")
+        raise ValueError("Generated episode has insufficient vocabulary")
+
+    # Create crossword puzzle
+    puzzle = create_crossword_from_vocabulary(
+        episode['vocabularyWords'],
+        "Episode 1 Vocabulary"
+    )
+
+    puzzles[puzzle_id] = puzzle
+
+    # Add episode to story
+    formatted_episode = {
+        'id': episode_id,
+        'episodeNumber': 1,
+        'title': episode['title'],
+        'text': episode['text'],
+        'recap': episode.get('recap', ''),
+        'discussionQuestions': episode.get('discussionQuestions', []),
+        'crosswordPuzzleId': puzzle_id,
+        'vocabularyFocus': vocab_focus
+    }
+
+    formatted_story['episodes'].append(formatted_episode)
+
+    logger.info(f"✅ Story generated successfully: {formatted_story['title']}")
+
+    return {
+        'story': formatted_story,
+        'puzzles': puzzles
+    }
+
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def generate_story(request):
+    """
+    MODIFIED: Now only generates the FIRST episode
+    Additional episodes are generated on-demand via generate_next_episode endpoint
+    """
+    try:
+        story_context = prepare_story(request.data)
+        theme = story_context['theme']
+        grade_level = story_context['grade_level']
+        focus_skills = story_context['focus_skills']
+        max_tokens = story_context['max_tokens']
+
+        if not settings.OPENAI_API_KEY:
+            logger.error("OpenAI API key is missing")
             return Response(
-                create_improved_fallback_story(theme, 1, grade_level, focus_skills)
+                {'error': 'OpenAI API key is not configured'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        
-        logger.info(f"✅ Received response (length: {len(cleaned_content)})")
-        
+
+        # Call OpenAI
+        logger.info(f"🤖 Calling OpenAI with {max_tokens} tokens for Episode 1")
         try:
-            story_data = json.loads(cleaned_content)
+            # One regeneration is allowed here since there is no outer retry loop
+            story_data = request_story_json(story_context['prompt'], max_tokens, StoryOutput, 'sentence_formation.story', max_attempts=2)
+            logger.info(f"✅ Received story: {story_data['story'].get('title', 'Untitled')}")
 
-            logger.info("🔍 FULL OPENAI RESPONSE:")
-            logger.info(json_module.dumps(story_data, indent=2)[:1000]) 
-            
-            # Validate the story
-            episodes = story_data.get('story', {}).get('episodes', [])
-            if episodes:
-                vocab_words = episodes[0].get('vocabularyWords', [])
-                logger.info(f"📚 Vocabulary check: {len(vocab_words)} words found")
-                logger.info(f"   Words: {vocab_words}")
-            
-            if not episodes or len(episodes) == 0:
-                raise ValueError("No episodes generated")
-            
-            episode = episodes[0]
-            
-            # VALIDATE VOCABULARY MATCHES SKILLS
-            vocab_focus = episode.get('vocabularyFocus', [])
-            is_valid, message, skill_matches = validate_vocabulary_matches_skills(vocab_focus, focus_skills)
-            
-            if not is_valid:
-                logger.warning(f"⚠️ Episode 1 validation failed: {message}")
-                logger.warning(f"   Vocabulary: {', '.join(vocab_focus)}")
-                logger.warning(f"   Skill distribution: {skill_matches}")
-            
-            # Format the response
-            formatted_story = {
-                "id": story_id,
-                "title": story_data['story']['title'],
-                "description": story_data['story'].get('description', f"An adventure about {theme}"),
-                "theme": theme,
-                "gradeLevel": f"Grade {grade_level}",
-                "totalEpisodes": total_episodes,
-                "generatedEpisodes": 1,
-                "focusSkills": focus_skills,
-                "characterNames": character_names,
-                "episodes": []
-            }
-            
-            # Create puzzles dictionary
-            puzzles = {}
-            
-            # Process the single episode
-            episode_id = f"{story_id}_ep1"
-            puzzle_id = f"{episode_id}_puzzle"
-            
-            # Validate vocabulary words exist
-            if not episode.get('vocabularyWords') or len(episode['vocabularyWords']) < 5:
-                logger.error(f"❌ Insufficient vocabulary words in episode 1")
-                raise ValueError("Generated episode has insufficient vocabulary")
-            
-            # Create crossword puzzle
-            puzzle = create_crossword_from_vocabulary(
-                episode['vocabularyWords'],
-                "Episode 1 Vocabulary"
-            )
-            
-            puzzles[puzzle_id] = puzzle
-            
-            # Add episode to story
-            formatted_episode = {
-                'id': episode_id,
-                'episodeNumber': 1,
-                'title': episode['title'],
-                'text': episode['text'],
-                'recap': episode.get('recap', ''),
-                'discussionQuestions': episode.get('discussionQuestions', []),
-                'crosswordPuzzleId': puzzle_id,
-                'vocabularyFocus': vocab_focus
-            }
-            
-            formatted_story['episodes'].append(formatted_episode)
-            
-            logger.info(f"✅ Story generated successfully: {formatted_story['title']}")
-            
             # Return the complete response
-            return Response({
-                'story': formatted_story,
-                'puzzles': puzzles
-            }, status=status.HTTP_200_OK)
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ JSON parsing error: {str(e)}")
-            logger.error(f"   Response content: {cleaned_content[:500]}")
+            return Response(
+                format_generated_story(story_data, story_context),
+                status=status.HTTP_200_OK
+            )
+
+        except StructuredOutputError as e:
+            logger.error(f"❌ Unusable story JSON: {str(e)}")
             return Response(
                 create_improved_fallback_story(theme, 1, grade_level, focus_skills)
             )
@@ -730,21 +871,241 @@ Return ONLY valid JSON (NO markdown) in this exact format:
             return Response(
                 create_improved_fallback_story(theme, 1, grade_level, focus_skills)
             )
-        
+        except Exception as e:
+            logger.error(f"❌ OpenAI API call failed: {str(e)}")
+            return Response(
+                create_improved_fallback_story(theme, 1, grade_level, focus_skills)
+            )
+
     except Exception as e:
         logger.error(f"❌ Error generating story: {str(e)}")
         logger.error(f"   Traceback: {traceback.format_exc()}")
         return Response(
-            {'error': str(e)}, 
+            {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
-    
-    
 
 
+# ============================================
+# STREAMING (SERVER-SENT EVENTS) STORY GENERATION
+# ============================================
+# Same payloads as generate_story / generate_next_episode, but the model
+# output is streamed: the title and each paragraph are sent as soon as they
+# are written, and the vocabulary + puzzle follow in the final 'complete' event.
+#
+# Events: meta, title, paragraph, retry (discard partial text), complete, done
+# ============================================
+
+def sse_event(event, payload):
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+def sse_response(event_stream):
+    """Wrap an event generator in an unbuffered text/event-stream response"""
+    response = StreamingHttpResponse(event_stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # Disable proxy buffering (nginx)
+    return response
+
+
+def stream_story_completion(prompt, max_tokens, title_path, text_path, template):
+    """
+    Stream a story completion and report content as soon as it is complete
+
+    Yields:
+        ('title', title), ('paragraph', index, text) while streaming,
+        then ('complete', cleaned_json_text) once the model is done
+    """
+    scanner = StreamingJSONScanner(paragraph_paths=lambda path: path == text_path)
+
+    for delta in stream_chat_completion(
+        client=openai,
+        task=LONG_STORY,
+        messages=build_story_messages(prompt),
+        max_tokens=max_tokens,
+        temperature=0.7,
+        response_format=JSON_OBJECT_FORMAT,
+        template=template
+    ):
+        for event in scanner.feed(delta):
+            if event[0] == 'string' and event[1] == title_path:
+                yield ('title', event[2])
+            elif event[0] == 'line':
+                yield ('paragraph', event[2], event[3])
+
+        if scanner.finished:
+            break
+
+    yield ('complete', scanner.text())
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def generate_story_stream(request):
+    """
+    Streaming variant of generate_story (Server-Sent Events)
+    The final 'complete' event carries the same {story, puzzles} payload
+    """
+    try:
+        data = json.loads(request.body)
+        story_context = prepare_story(data)
+    except Exception as e:
+        logger.error(f"❌ Invalid story stream request: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=400)
+
+    if not settings.OPENAI_API_KEY:
+        logger.error("OpenAI API key is missing")
+        return JsonResponse({'error': 'OpenAI API key is not configured'}, status=500)
+
+    theme = story_context['theme']
+    grade_level = story_context['grade_level']
+    focus_skills = story_context['focus_skills']
+
+    def event_stream():
+        yield sse_event('meta', {'storyId': story_context['story_id'], 'episodeNumber': 1})
+
+        streamed_content = ''
+        try:
+            logger.info(f"🤖 Streaming OpenAI story with {story_context['max_tokens']} tokens for Episode 1")
+            for event in stream_story_completion(
+                story_context['prompt'],
+                story_context['max_tokens'],
+                title_path=('story', 'episodes', 0, 'title'),
+                text_path=('story', 'episodes', 0, 'text'),
+                template='sentence_formation.story'
+            ):
+                if event[0] == 'title':
+                    yield sse_event('title', {'title': event[1]})
+                elif event[0] == 'paragraph':
+                    yield sse_event('paragraph', {'index': event[1], 'text': event[2]})
+                else:
+                    streamed_content = event[1]
+
+            story_data = parse_structured(streamed_content, StoryOutput)
+            payload = format_generated_story(story_data, story_context)
+            yield sse_event('complete', payload)
+
+        except ValueError as e:
+            # StructuredOutputError or a story that failed format validation
+            logger.error(f"❌ Streamed story unusable: {str(e)}")
+            logger.error(f"   Response content: {streamed_content[:500]}")
+            yield sse_event('retry', {'reason': 'fallback'})
+            yield sse_event('complete', create_improved_fallback_story(theme, 1, grade_level, focus_skills))
+        except Exception as e:
+            logger.error(f"❌ Error streaming story: {str(e)}")
+            logger.error(f"   Traceback: {traceback.format_exc()}")
+            yield sse_event('retry', {'reason': 'fallback'})
+            yield sse_event('complete', create_improved_fallback_story(theme, 1, grade_level, focus_skills))
+
+        yield sse_event('done', {})
+
+    return sse_response(event_stream())
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def generate_next_episode_stream(request):
+    """
+    Streaming variant of generate_next_episode (Server-Sent Events)
+    Follows the same retry rules; a 'retry' event tells the client to discard
+    the partial text it received from the rejected attempt.
+    """
+    try:
+        data = json.loads(request.body)
+        episode_context = prepare_next_episode(data)
+    except Exception as e:
+        logger.error(f"❌ Invalid episode stream request: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=400)
+
+    if not settings.OPENAI_API_KEY:
+        logger.error("OpenAI API key is missing")
+        return JsonResponse({'error': 'API key not configured'}, status=500)
+
+    episode_number = episode_context['episode_number']
+    previously_used_words = episode_context['previously_used_words']
+
+    def event_stream():
+        yield sse_event('meta', {'storyId': episode_context['story_id'], 'episodeNumber': episode_number})
+
+        prompt = episode_context['prompt']
+        max_retries = 3
+        best_attempt = None  # Last usable episode with issues, served if time runs out
+
+        for attempt in range(max_retries):
+            streamed_content = ''
+            try:
+                logger.info(f"🤖 Streaming attempt {attempt + 1}/{max_retries} - Episode {episode_number}")
+                ai_telemetry.mark_attempt(attempt + 1)
+
+                for event in stream_story_completion(
+                    prompt,
+                    episode_context['max_tokens'],
+                    title_path=('episode', 'title'),
+                    text_path=('episode', 'text'),
+                    template='sentence_formation.next_episode'
+                ):
+                    if event[0] == 'title':
+                        yield sse_event('title', {'title': event[1]})
+                    elif event[0] == 'paragraph':
+                        yield sse_event('paragraph', {'index': event[1], 'text': event[2]})
+                    else:
+                        streamed_content = event[1]
+
+                episode = parse_structured(streamed_content, NextEpisodeOutput).get('episode', {})
+                vocab_focus = episode.get('vocabularyFocus', [])
+
+                if (not vocab_focus or len(vocab_focus) < 5) and can_retry_episode(attempt, max_retries):
+                    logger.warning(f"⚠️ Insufficient vocabulary ({len(vocab_focus)} words)")
+                    yield sse_event('retry', {'attempt': attempt + 2})
+                    continue
+
+                review = review_episode_vocabulary(vocab_focus, previously_used_words, episode_number)
+
+                if review['has_issues'] and can_retry_episode(attempt, max_retries):
+                    logger.warning(f"⚠️ Issues found, retrying...")
+                    if len(vocab_focus) >= 5:
+                        best_attempt = (episode, vocab_focus, review)
+                    prompt += episode_retry_feedback(review)
+                    yield sse_event('retry', {'attempt': attempt + 2})
+                    continue
+
+                yield sse_event('complete', format_next_episode(episode, vocab_focus, review, episode_context))
+                best_attempt = None
+                break
+
+            except CircuitOpenError:
+                logger.warning(f"⚡ AI provider unavailable, not retrying Episode {episode_number}")
+                if not best_attempt:
+                    yield sse_event('error', {'error': 'AI service temporarily unavailable'})
+                break
+            except DeadlineExceeded:
+                logger.warning(f"⏱️ Time budget spent on streaming attempt {attempt + 1} - Episode {episode_number}")
+                if not best_attempt:
+                    yield sse_event('error', {'error': 'Episode generation took too long, please try again'})
+                break
+            except Exception as e:
+                logger.error(f"❌ Error in streaming attempt {attempt + 1}: {str(e)}")
+                if can_retry_episode(attempt, max_retries):
+                    yield sse_event('retry', {'attempt': attempt + 2})
+                    continue
+                if not best_attempt:
+                    yield sse_event('error', {'error': 'Failed to generate episode'})
+                break
+
+        if best_attempt:
+            # Out of time (or attempts) after a usable episode: serve it with its issues
+            logger.warning(f"⚠️ Serving the best earlier attempt for Episode {episode_number}")
+            yield sse_event('complete', format_next_episode(*best_attempt, episode_context))
+
+        yield sse_event('done', {})
+
+    return sse_response(event_stream())
+
 
 def create_improved_fallback_story(theme, episode_count, grade_level, focus_skills):
     """Create a fallback story with vocabulary matching the focus skills - MIXED in each episode"""
+    ai_telemetry.record_fallback('sentence_formation.create_improved_fallback_story')
     
     story_id = f"{theme}_fallback_{int(datetime.now().timestamp())}"
     
@@ -937,18 +1298,29 @@ def generate_crossword_clues(request):
         Example: {{"ocean": "Vast body of salt water that covers most of Earth", "shell": "Hard protective covering of sea creatures"}}
         """
         
-        # Call OpenAI API
-        response = openai.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are an educational assistant creating age-appropriate crossword puzzles for elementary school students."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=800
-        )
-        
-        content = response.choices[0].message.content
+        # Call OpenAI API (clues for the same word list are served from the AI cache)
+        try:
+            content = chat_completion(
+                client=openai,
+                task=JSON_GENERATION,
+                messages=[
+                    {"role": "system", "content": "You are an educational assistant creating age-appropriate crossword puzzles for elementary school students."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=800,
+                cache=True,
+                cache_namespace='sentence_formation.generate_crossword_clues',
+                coalesce=True,
+                cache_if=contains_json
+            )
+        except (CircuitOpenError, DeadlineExceeded, openai.OpenAIError) as e:
+            # Provider down or too slow: serve the template clues right away
+            logger.warning(f"⚡ AI unavailable for crossword clues, using templates: {str(e)}")
+            ai_telemetry.record_fallback('sentence_formation.crossword_clue_templates')
+            return Response({
+                'clues': template_crossword_clues(words, theme)
+            })
         
         # Try to parse JSON from the response
         try:
@@ -962,9 +1334,8 @@ def generate_crossword_clues(request):
                 clues = json.loads(content)
         except json.JSONDecodeError:
             # Fallback: Create better clues than just "A theme word"
-            clues = {}
-            for word in words:
-                clues[word] = f"This {theme} word has {len(word)} letters and helps on adventures"
+            ai_telemetry.record_fallback('sentence_formation.crossword_clue_templates')
+            clues = template_crossword_clues(words, theme)
             
         return Response({
             'clues': clues
@@ -975,6 +1346,13 @@ def generate_crossword_clues(request):
             'error': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+def template_crossword_clues(words, theme):
+    """Clues built from the word length and theme, for when the AI clues are unusable"""
+    clues = {}
+    for word in words:
+        clues[word] = f"This {theme} word has {len(word)} letters and helps on adventures"
+    return clues
+
 @csrf_exempt
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -1021,17 +1399,26 @@ def generate_answer_choices(request):
         """
         
         # Call OpenAI API
-        response = openai.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are an educational assistant creating age-appropriate crossword puzzles for elementary school students."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=400
-        )
-        
-        content = response.choices[0].message.content
+        try:
+            content = chat_completion(
+                client=openai,
+                task=JSON_GENERATION,
+                messages=[
+                    {"role": "system", "content": "You are an educational assistant creating age-appropriate crossword puzzles for elementary school students."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=400,
+                template='sentence_formation.generate_answer_choices'
+            )
+        except (CircuitOpenError, DeadlineExceeded, openai.OpenAIError) as e:
+            # Provider down or too slow: serve the pattern-based choices right away
+            logger.warning(f"⚡ AI unavailable for answer choices, using fallback choices: {str(e)}")
+            ai_telemetry.record_fallback('sentence_formation.generate_fallback_choices')
+            return Response({
+                'choices': generate_fallback_choices(correct_answer, theme, num_choices)[:num_choices],
+                'correct_answer': correct_answer
+            })
         
         # Try to parse JSON from the response
         try:
@@ -1045,6 +1432,7 @@ def generate_answer_choices(request):
                 wrong_answers = json.loads(content)
         except json.JSONDecodeError:
             # Fallback: Create better wrong answers based on patterns
+            ai_telemetry.record_fallback('sentence_formation.generate_fallback_choices')
             wrong_answers = generate_fallback_choices(correct_answer, theme, num_choices)
         
         # Include the correct answer in the shuffled array
@@ -1972,45 +2360,33 @@ Rules:
 - Make it engaging and fun!"""
 
         try:
-            # Call OpenAI API
-            response = openai.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert elementary school reading teacher who explains vocabulary in simple, engaging ways for children."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=300
-            )
-            
-            # Parse the GPT response
-            gpt_response = response.choices[0].message.content.strip()
-            logger.info(f"GPT response for '{word}': {gpt_response[:100]}...")
-            
-            # Try to extract JSON from the response
+            # Call OpenAI API (repeat lookups of the same word are served from the AI cache)
             try:
-                # Remove markdown code blocks if present
-                if '```json' in gpt_response:
-                    gpt_response = gpt_response.split('```json')[1].split('```')[0].strip()
-                elif '```' in gpt_response:
-                    gpt_response = gpt_response.split('```')[1].split('```')[0].strip()
-                
-                word_data = json.loads(gpt_response)
-                
-                # Validate required fields
-                required_fields = ['definition', 'example', 'part_of_speech', 'syllables']
-                for field in required_fields:
-                    if field not in word_data:
-                        raise ValueError(f'Missing required field: {field}')
+                word_data = structured_completion(
+                    [
+                        {
+                            "role": "system",
+                            "content": "You are an expert elementary school reading teacher who explains vocabulary in simple, engaging ways for children."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    WordExplanation,
+                    task=JSON_GENERATION,
+                    client=openai,
+                    temperature=0.7,
+                    max_tokens=300,
+                    cache=True,
+                    cache_namespace='sentence_formation.explain_word',
+                    coalesce=True,
+                    hedge=True,  # Student is waiting on the word card
+                    max_attempts=1
+                )
                 
                 # Ensure synonyms is a list
-                if 'synonyms' not in word_data or not isinstance(word_data['synonyms'], list):
+                if not isinstance(word_data.get('synonyms'), list):
                     word_data['synonyms'] = []
                 
                 logger.info(f"Successfully explained word '{word}'")
@@ -2024,11 +2400,11 @@ Rules:
                     'synonyms': word_data['synonyms']
                 })
                 
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse GPT JSON response: {gpt_response}")
-                logger.error(f"JSON Error: {str(e)}")
+            except StructuredOutputError as e:
+                logger.error(f"Failed to parse GPT JSON response for '{word}': {str(e)}")
                 
                 # Fallback: Create a basic response from the text
+                ai_telemetry.record_fallback('sentence_formation.explain_word_template')
                 return JsonResponse({
                     'success': True,
                     'definition': f"{word.capitalize()} is a word used in the story.",
@@ -2043,6 +2419,7 @@ Rules:
             logger.error(traceback.format_exc())
             
             # Return a basic fallback response
+            ai_telemetry.record_fallback('sentence_formation.explain_word_template')
             return JsonResponse({
                 'success': True,
                 'definition': f"The word '{word}' appears in the story and has special meaning.",
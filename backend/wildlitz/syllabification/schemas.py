@@ -0,0 +1,32 @@
+# backend/wildlitz/syllabification/schemas.py
+"""
+Pydantic schemas for the JSON the model returns in syllabification.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SyllableValidation(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    is_correct: bool = True
+    confidence: float = 0.5
+    suggestion: str = "Syllable structure looks reasonable."
+    alternative_breakdown: Optional[str] = None
+
+
+class SoundExplanation(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    sound: str
+    explanation: str
+
+
+class PhoneticGuide(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    phonetic_breakdown: str
+    rhyming_words: List[str] = []
+    sound_explanations: List[SoundExplanation] = []
@@ -1,9 +1,13 @@
 # backend/wildlitz/syllabification/services_ai.py
 from openai import OpenAI
 from django.conf import settings
-import json
 import random
 import logging
+from utils import ai_telemetry
+from utils.ai_client import chat_completion
+from utils.ai_routing import JSON_GENERATION, SHORT_MESSAGE, VALIDATION
+from utils.ai_structured import StructuredOutputError, structured_completion
+from .schemas import PhoneticGuide, SyllableValidation
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +15,8 @@ class AIContentGenerator:
     """Service for generating AI content for syllabification game"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        self.model = "gpt-4o"  # You can use gpt-4 for better results if available
+        self.client = OpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL or None)
+        # Models are picked per task by utils.ai_routing
     
     def generate_fun_fact(self, word, category):
         """Generate a fun, educational fact about a word"""
@@ -26,17 +30,18 @@ class AIContentGenerator:
             
             prompt = random.choice(templates)
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            fun_fact = chat_completion(
+                client=self.client,
+                task=SHORT_MESSAGE,
                 messages=[
                     {"role": "system", "content": "You are an educational assistant creating fun, brief facts for elementary school children."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=100,
-                temperature=0.7
-            )
+                temperature=0.7,
+                template='syllabification.generate_fun_fact'
+            ).strip()
             
-            fun_fact = response.choices[0].message.content.strip()
             # Remove quotes if present
             fun_fact = fun_fact.strip('"\'')
             
@@ -44,6 +49,7 @@ class AIContentGenerator:
             
         except Exception as e:
             logger.error(f"Error generating fun fact: {str(e)}")
+            ai_telemetry.record_fallback('syllabification.generate_fun_fact')
             # Return a default fact if API call fails
             return f"Fun fact: {word} is in the category of {category}!"
     
@@ -84,17 +90,19 @@ class AIContentGenerator:
             else:
                 system_message = "You are a friendly, encouraging educational character speaking to elementary school children."
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            message = chat_completion(
+                client=self.client,
+                task=SHORT_MESSAGE,
                 messages=[
                     {"role": "system", "content": system_message},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=60,
-                temperature=0.7
-            )
+                temperature=0.7,
+                template='syllabification.generate_character_message',
+                hedge=True  # Speech bubble the student is waiting on
+            ).strip()
             
-            message = response.choices[0].message.content.strip()
             # Remove quotes if present
             message = message.strip('"\'')
             
@@ -102,6 +110,7 @@ class AIContentGenerator:
             
         except Exception as e:
             logger.error(f"Error generating character message: {str(e)}")
+            ai_telemetry.record_fallback('syllabification.generate_character_message')
             # Return default messages based on context
             default_messages = {
                 'intro': f"Listen to '{word}' and count the syllables!",
@@ -134,17 +143,18 @@ class AIContentGenerator:
             selected_prompts = tip_prompts.get(difficulty.lower(), tip_prompts['medium'])
             prompt = random.choice(selected_prompts)
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            tip = chat_completion(
+                client=self.client,
+                task=SHORT_MESSAGE,
                 messages=[
                     {"role": "system", "content": "You are an educational expert helping children learn about syllables."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=60,
-                temperature=0.7
-            )
+                temperature=0.7,
+                template='syllabification.generate_syllable_tip'
+            ).strip()
             
-            tip = response.choices[0].message.content.strip()
             # Remove quotes if present
             tip = tip.strip('"\'')
             
@@ -152,6 +162,7 @@ class AIContentGenerator:
             
         except Exception as e:
             logger.error(f"Error generating syllable tip: {str(e)}")
+            ai_telemetry.record_fallback('syllabification.generate_syllable_tip')
             # Return a default tip if API call fails
             default_tips = {
                 'easy': "Listen for the beat in each word - every beat is a syllable!",
@@ -203,54 +214,52 @@ class AIContentGenerator:
             }}
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in English phonetics and syllable structure. Validate syllable breakdowns accurately."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.3  # Low temperature for consistency
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
+            # Parse and validate the JSON response (repaired locally if malformed)
             try:
-                # Extract JSON if embedded in other text
-                start_idx = response_text.find('{')
-                end_idx = response_text.rfind('}') + 1
-                if start_idx >= 0 and end_idx > 0:
-                    json_str = response_text[start_idx:end_idx]
-                    result = json.loads(json_str)
-                    
-                    # ==========================================================
-                    # Sanity Check to correct the AI's mistake
-                    # If the AI says it's incorrect, but its suggestion is identical 
-                    # to the user's input, we override the AI's judgment.
-                    if (not result.get('is_correct') and
-                            result.get('alternative_breakdown') and
-                            syllable_breakdown.strip().lower() == result['alternative_breakdown'].strip().lower()):
-                        
-                        logger.warning(f"AI incorrectly flagged a correct breakdown for '{word}'. Overriding to 'is_correct: True'.")
-                        result['is_correct'] = True
-                        result['suggestion'] = "Syllable structure looks correct."
-                    # ==========================================================
-
-                    # Ensure all required fields exist
-                    if 'is_correct' not in result:
-                        result['is_correct'] = True
-                    if 'confidence' not in result:
-                        result['confidence'] = 0.5
-                    if 'suggestion' not in result:
-                        result['suggestion'] = "Syllable structure looks reasonable."
-                    if 'alternative_breakdown' not in result:
-                        result['alternative_breakdown'] = None
+                result = structured_completion(
+                    [
+                        {"role": "system", "content": "You are an expert in English phonetics and syllable structure. Validate syllable breakdowns accurately."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    SyllableValidation,
+                    task=VALIDATION,
+                    client=self.client,
+                    max_tokens=200,
+                    temperature=0.3,  # Low temperature for consistency
+                    cache=True,
+                    cache_namespace='syllabification.validate_syllable_structure',
+                    coalesce=True,
+                    max_attempts=1
+                )
+                
+                # ==========================================================
+                # Sanity Check to correct the AI's mistake
+                # If the AI says it's incorrect, but its suggestion is identical 
+                # to the user's input, we override the AI's judgment.
+                if (not result.get('is_correct') and
+                        result.get('alternative_breakdown') and
+                        syllable_breakdown.strip().lower() == result['alternative_breakdown'].strip().lower()):
                     
-                    return result
+                    logger.warning(f"AI incorrectly flagged a correct breakdown for '{word}'. Overriding to 'is_correct: True'.")
+                    result['is_correct'] = True
+                    result['suggestion'] = "Syllable structure looks correct."
+                # ==========================================================
+
+                # Ensure all required fields exist
+                if 'is_correct' not in result:
+                    result['is_correct'] = True
+                if 'confidence' not in result:
+                    result['confidence'] = 0.5
+                if 'suggestion' not in result:
+                    result['suggestion'] = "Syllable structure looks reasonable."
+                if 'alternative_breakdown' not in result:
+                    result['alternative_breakdown'] = None
+                
+                return result
                 
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing AI validation JSON: {response_text}")
+            except StructuredOutputError as e:
+                logger.error(f"Error parsing AI validation JSON: {str(e)}")
+                ai_telemetry.record_fallback('syllabification.validate_syllable_structure')
             
             # Fallback if parsing fails
             return {
@@ -262,6 +271,7 @@ class AIContentGenerator:
             
         except Exception as e:
             logger.error(f"Error in AI syllable validation: {str(e)}")
+            ai_telemetry.record_fallback('syllabification.validate_syllable_structure')
             # Safe fallback
             return {
                 'is_correct': True,
@@ -303,17 +313,18 @@ class AIContentGenerator:
             Category:
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            category = chat_completion(
+                client=self.client,
+                task=VALIDATION,
                 messages=[
                     {"role": "system", "content": "You are a precise categorization expert. Always choose the most appropriate category from the given list."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=10,
-                temperature=0.1  # Low temperature for more consistent results
-            )
+                temperature=0.1,  # Low temperature for more consistent results
+                template='syllabification.suggest_category'
+            ).strip()
             
-            category = response.choices[0].message.content.strip()
             
             # ✅ THIS IS THE VALIDATION LIST - Must match exactly!
             valid_categories = [
@@ -336,6 +347,7 @@ class AIContentGenerator:
             
         except Exception as e:
             logger.error(f"Error suggesting category: {str(e)}")
+            ai_telemetry.record_fallback('syllabification.suggest_category')
             return None
         
     def generate_syllable_breakdown(self, word):
@@ -357,17 +369,18 @@ class AIContentGenerator:
             Word to break down: "{word}"
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            breakdown = chat_completion(
+                client=self.client,
+                task=VALIDATION,
                 messages=[
                     {"role": "system", "content": "You are an expert in English phonetics. Your task is to provide accurate syllable breakdowns in a specific hyphenated format."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=50,
-                temperature=0.2  # Low temperature for more predictable results
-            )
+                temperature=0.2,  # Low temperature for more predictable results
+                template='syllabification.generate_syllable_breakdown'
+            ).strip()
             
-            breakdown = response.choices[0].message.content.strip()
             # Clean up response to ensure it only contains allowed characters
             breakdown = ''.join(c for c in breakdown if c.isalpha() or c == '-')
             
@@ -375,6 +388,7 @@ class AIContentGenerator:
             
         except Exception as e:
             logger.error(f"Error generating syllable breakdown for '{word}': {str(e)}")
+            ai_telemetry.record_fallback('syllabification.generate_syllable_breakdown')
             return word # Fallback to the original word if AI fails
         
     def generate_learning_feedback(self, word, is_correct, syllable_count, difficulty='medium'):
@@ -471,8 +485,9 @@ class AIContentGenerator:
     CRITICAL: You MUST include two newline characters (\\n\\n) between each section.
     Total: 45-55 words. Short sentences. Never use "wrong" or "incorrect"."""
 
-            response = self.client.chat.completions.create(
-                model=self.model,
+            feedback = chat_completion(
+                client=self.client,
+                task=SHORT_MESSAGE,
                 messages=[
                     {
                         "role": "system", 
@@ -484,10 +499,11 @@ class AIContentGenerator:
                     }
                 ],
                 max_tokens=200,
-                temperature=0.7
-            )
+                temperature=0.7,
+                template='syllabification.generate_learning_feedback',
+                hedge=True  # Shown right after the student answers
+            ).strip()
             
-            feedback = response.choices[0].message.content.strip()
             feedback = feedback.strip('"\'')
             
             logger.info(f"Generated learning feedback for '{word}': {feedback[:100]}...")
@@ -496,6 +512,7 @@ class AIContentGenerator:
             
         except Exception as e:
             logger.error(f"Error generating learning feedback: {str(e)}")
+            ai_telemetry.record_fallback('syllabification.generate_learning_feedback')
             import traceback
             logger.error(traceback.format_exc())
             
@@ -608,9 +625,9 @@ class AIContentGenerator:
     Now generate for "{word}":
     Return ONLY the JSON object, no additional text."""
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
+            # Parse and validate JSON (fences and near-miss JSON are repaired locally)
+            phonetic_data = structured_completion(
+                [
                     {
                         "role": "system",
                         "content": "You are a phonetics expert. Return ONLY valid JSON. No markdown, no code blocks, no additional text. Just pure JSON."
@@ -620,21 +637,15 @@ class AIContentGenerator:
                         "content": prompt
                     }
                 ],
+                PhoneticGuide,
+                task=JSON_GENERATION,
+                client=self.client,
                 max_tokens=400,
-                temperature=0.5  # Lower temperature for more consistent output
+                temperature=0.5,  # Lower temperature for more consistent output
+                cache=True,
+                cache_namespace='syllabification.generate_phonetic_guide',
+                coalesce=True
             )
-
-            response_text = response.choices[0].message.content.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-            
-            # Parse JSON
-            phonetic_data = json.loads(response_text)
             
             # Validate structure
             required_keys = ['phonetic_breakdown', 'rhyming_words', 'sound_explanations']
@@ -654,9 +665,9 @@ class AIContentGenerator:
             
             return phonetic_data
             
-        except json.JSONDecodeError as e:
+        except StructuredOutputError as e:
             logger.error(f"JSON parsing error for phonetic guide: {str(e)}")
-            logger.error(f"Response was: {response_text}")
+            ai_telemetry.record_fallback('syllabification.generate_phonetic_guide')
             
             # Return basic fallback structure
             return {
@@ -672,6 +683,7 @@ class AIContentGenerator:
             
         except Exception as e:
             logger.error(f"Error generating phonetic guide: {str(e)}")
+            ai_telemetry.record_fallback('syllabification.generate_phonetic_guide')
             import traceback
             logger.error(traceback.format_exc())
             
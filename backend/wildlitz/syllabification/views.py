@@ -21,11 +21,12 @@ from api.views import log_user_activity as api_log_user_activity # Import the lo
 # Import Supabase client if needed for other functions in this file
 from django.conf import settings
 from supabase import create_client, Client
+from utils.deadline import bind_supabase
 
 logger = logging.getLogger(__name__)
 
 # Create Supabase client using settings
-supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+supabase = bind_supabase(create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY))
 
 # Initialize AI content generator
 ai_generator = AIContentGenerator()
@@ -0,0 +1,211 @@
+# backend/wildlitz/utils/ai_cache.py
+"""
+Persistent, content-addressed cache for AI completions.
+
+Entries are keyed by a hash of (model, messages, temperature, max_tokens) and
+stored in the ai_response_cache table, so they survive restarts and are shared
+by every worker. Entries expire after a TTL and the least recently used ones are
+evicted once the table grows past AI_CACHE_MAX_BYTES.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from api.models import AIResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Run the size check once every N writes instead of on every store
+EVICTION_CHECK_INTERVAL = 25
+
+_stats_lock = threading.Lock()
+_stats = {
+    'hits': 0,
+    'misses': 0,
+    'expired': 0,
+    'stores': 0,
+    'evictions': 0,
+    'errors': 0,
+}
+_namespace_stats = {}
+_writes_since_eviction = 0
+
+
+def make_cache_key(model, messages, temperature, max_tokens, **extra):
+    """
+    Build a stable content hash for a completion request
+
+    Args:
+        model (str): Model name
+        messages (list): Chat messages sent to the model
+        temperature (float): Sampling temperature
+        max_tokens (int): Completion token limit
+        **extra: Any other request options that change the output
+
+    Returns:
+        str: 64-character hex digest
+    """
+    payload = {
+        'model': model,
+        'messages': messages,
+        'temperature': temperature,
+        'max_tokens': max_tokens,
+    }
+    payload.update(extra)
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _record(event, namespace):
+    with _stats_lock:
+        _stats[event] += 1
+        if namespace:
+            bucket = _namespace_stats.setdefault(namespace, {'hits': 0, 'misses': 0})
+            if event == 'hits':
+                bucket['hits'] += 1
+            elif event in ('misses', 'expired'):
+                bucket['misses'] += 1
+
+
+def get_cached_response(cache_key, namespace=''):
+    """Return the cached completion text for a key, or None on a miss"""
+    if not getattr(settings, 'AI_CACHE_ENABLED', True):
+        return None
+
+    try:
+        now = timezone.now()
+        entry = AIResponseCache.objects.filter(cache_key=cache_key)\
+            .values('id', 'response', 'expires_at')\
+            .first()
+
+        if entry is None:
+            _record('misses', namespace)
+            return None
+
+        if entry['expires_at'] <= now:
+            AIResponseCache.objects.filter(id=entry['id']).delete()
+            _record('expired', namespace)
+            return None
+
+        AIResponseCache.objects.filter(id=entry['id']).update(
+            last_accessed=now,
+            hit_count=F('hit_count') + 1
+        )
+        _record('hits', namespace)
+        return entry['response']
+
+    except Exception as e:
+        # The cache must never break the AI call itself
+        logger.warning(f"AI cache lookup failed: {str(e)}")
+        _record('errors', namespace)
+        return None
+
+
+def store_response(cache_key, model, response_text, namespace='', ttl=None):
+    """Store a completion in the cache and evict old entries if needed"""
+    global _writes_since_eviction
+
+    if not getattr(settings, 'AI_CACHE_ENABLED', True) or not response_text:
+        return
+
+    try:
+        now = timezone.now()
+        ttl = ttl if ttl is not None else settings.AI_CACHE_TTL_SECONDS
+
+        AIResponseCache.objects.update_or_create(
+            cache_key=cache_key,
+            defaults={
+                'namespace': namespace,
+                'model': model,
+                'response': response_text,
+                'size_bytes': len(response_text.encode('utf-8')),
+                'last_accessed': now,
+                'expires_at': now + timedelta(seconds=ttl),
+            }
+        )
+        _record('stores', namespace)
+
+        with _stats_lock:
+            _writes_since_eviction += 1
+            should_evict = _writes_since_eviction >= EVICTION_CHECK_INTERVAL
+            if should_evict:
+                _writes_since_eviction = 0
+
+        if should_evict:
+            evict_entries()
+
+    except Exception as e:
+        logger.warning(f"AI cache store failed: {str(e)}")
+        _record('errors', namespace)
+
+
+def evict_entries():
+    """
+    Drop expired entries, then the least recently used ones until the
+    cache fits within AI_CACHE_MAX_BYTES
+
+    Returns:
+        int: Number of entries removed
+    """
+    removed, _ = AIResponseCache.objects.filter(expires_at__lte=timezone.now()).delete()
+
+    total_bytes = AIResponseCache.objects.aggregate(total=Sum('size_bytes'))['total'] or 0
+    excess = total_bytes - settings.AI_CACHE_MAX_BYTES
+
+    if excess > 0:
+        freed = 0
+        stale_ids = []
+        oldest_first = AIResponseCache.objects.order_by('last_accessed')\
+            .values_list('id', 'size_bytes')
+
+        for entry_id, size_bytes in oldest_first.iterator():
+            stale_ids.append(entry_id)
+            freed += size_bytes
+            if freed >= excess:
+                break
+
+        lru_removed, _ = AIResponseCache.objects.filter(id__in=stale_ids).delete()
+        removed += lru_removed
+        logger.info(f"🧹 AI cache evicted {lru_removed} LRU entries ({freed} bytes)")
+
+    if removed:
+        with _stats_lock:
+            _stats['evictions'] += removed
+
+    return removed
+
+
+def get_cache_stats():
+    """Return hit-rate metrics for this process plus the table size"""
+    with _stats_lock:
+        counters = dict(_stats)
+        namespaces = {
+            name: {
+                **bucket,
+                'hit_rate': round(bucket['hits'] / (bucket['hits'] + bucket['misses']), 4)
+                if bucket['hits'] + bucket['misses'] else 0.0
+            }
+            for name, bucket in _namespace_stats.items()
+        }
+
+    lookups = counters['hits'] + counters['misses'] + counters['expired']
+    counters['lookups'] = lookups
+    counters['hit_rate'] = round(counters['hits'] / lookups, 4) if lookups else 0.0
+    counters['namespaces'] = namespaces
+
+    try:
+        table = AIResponseCache.objects.aggregate(total=Sum('size_bytes'))
+        counters['entries'] = AIResponseCache.objects.count()
+        counters['size_bytes'] = table['total'] or 0
+    except Exception as e:
+        logger.warning(f"AI cache size lookup failed: {str(e)}")
+
+    counters['max_bytes'] = settings.AI_CACHE_MAX_BYTES
+    return counters
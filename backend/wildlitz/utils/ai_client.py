@@ -0,0 +1,398 @@
+# backend/wildlitz/utils/ai_client.py
+"""
+Shared entry point for OpenAI chat completions used by the game modules.
+"""
+
+import json
+import logging
+import time
+
+from openai import APIConnectionError, APIStatusError, APITimeoutError, OpenAI
+from django.conf import settings
+
+from utils import ai_cache, ai_fixtures, ai_routing, ai_scheduler, ai_telemetry, deadline
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.deadline import DeadlineExceeded
+from utils.hedging import AttemptAbandoned, hedger
+from utils.prompt_budget import CHARS_PER_TOKEN, check_prompt_budget, estimate_prompt_tokens
+from utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_default_client = None
+
+# Identical prompts already waiting on the model share a single call
+in_flight_completions = SingleFlight('ai_completions')
+
+# Shared by every call to the provider; while open, calls fail fast with
+# CircuitOpenError and the call sites serve their local fallbacks
+provider_breaker = CircuitBreaker(
+    'openai',
+    failure_threshold=getattr(settings, 'AI_BREAKER_FAILURE_THRESHOLD', 5),
+    reset_timeout=getattr(settings, 'AI_BREAKER_RESET_SECONDS', 30),
+    half_open_max_calls=getattr(settings, 'AI_BREAKER_HALF_OPEN_CALLS', 1),
+)
+
+
+def is_provider_failure(error):
+    """True for errors that mean the provider is unhealthy (timeouts, connection errors, 5xx, 429)"""
+    if isinstance(error, APIConnectionError):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code >= 500 or error.status_code == 429
+    return False
+
+
+def _record_provider_outcome(error=None):
+    if error is not None and is_provider_failure(error):
+        provider_breaker.record_failure()
+    else:
+        # The provider answered, even if it rejected this particular request
+        provider_breaker.record_success()
+
+
+def get_client():
+    """Return the process-wide OpenAI client, creating it on first use"""
+    global _default_client
+    if _default_client is None:
+        _default_client = OpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL or None)
+    return _default_client
+
+
+def _usage_tokens(usage):
+    """Token counts from a provider usage object as record_call keyword arguments"""
+    details = getattr(usage, 'prompt_tokens_details', None)
+    return {
+        'prompt_tokens': getattr(usage, 'prompt_tokens', 0) or 0,
+        'completion_tokens': getattr(usage, 'completion_tokens', 0) or 0,
+        'cached_prompt_tokens': getattr(details, 'cached_tokens', 0) or 0,
+    }
+
+
+def _estimated_tokens(messages, received):
+    """Token counts for a stream closed before the provider sent its usage chunk"""
+    return {
+        'prompt_tokens': estimate_prompt_tokens(messages),
+        'completion_tokens': sum(len(delta) for delta in received) // CHARS_PER_TOKEN,
+    }
+
+
+def _request_options(template, timeout):
+    """Per-request client options (timeout, template header for the local stub server)"""
+    options = {'timeout': timeout} if timeout else {}
+    if settings.OPENAI_BASE_URL:
+        options['extra_headers'] = {'X-AI-Template': template}
+    return options
+
+
+def chat_completion(messages, model=None, temperature=0.7, max_tokens=None,
+                    client=None, cache=False, cache_namespace='', cache_ttl=None,
+                    cache_if=None, coalesce=False, response_format=None,
+                    template=None, attempt=1, task=None, hedge=False, priority=None):
+    """
+    Run a chat completion and return the message text
+
+    Args:
+        messages (list): Chat messages for the model
+        model (str): Model name (pinned); leave empty and pass task to use the routing table
+        temperature (float): Sampling temperature
+        max_tokens (int): Completion token limit
+        client: OpenAI client (or the openai module) to call, defaults to the shared client
+        cache (bool): Serve and store the response through the persistent AI cache
+        cache_namespace (str): Call site label used in cache metrics
+        cache_ttl (int): Override for AI_CACHE_TTL_SECONDS
+        cache_if (callable): Only cache responses for which this returns True
+        coalesce (bool): Share one model call between identical concurrent requests
+        response_format (dict): Provider response format, e.g. {'type': 'json_object'}
+        template (str): Prompt template id for telemetry, defaults to cache_namespace
+        attempt (int): Retry attempt number for telemetry (1 = first try)
+        task (str): Task type from utils.ai_routing (SHORT_MESSAGE, JSON_GENERATION, ...)
+        hedge (bool): Send a second identical request if the first is slower than usual
+            (see utils/hedging.py); for short interactive calls only
+        priority (str): Scheduler class from utils.ai_scheduler (INTERACTIVE, STANDARD,
+            BACKGROUND); defaults to the enclosing priority_class() block, then the task
+
+    Returns:
+        str: Raw message content from the model
+    """
+    if not model and not task:
+        raise ValueError("chat_completion needs a model or a task")
+
+    # Routed calls share cache entries whichever tier answered
+    route_label = model or f'task:{task}'
+    template = template or cache_namespace or route_label
+    request_key = None
+    if cache or coalesce:
+        key_extra = {'response_format': response_format} if response_format else {}
+        request_key = ai_cache.make_cache_key(route_label, messages, temperature, max_tokens, **key_extra)
+
+    if cache:
+        lookup_started = time.monotonic()
+        cached = ai_cache.get_cached_response(request_key, cache_namespace)
+        if cached is not None:
+            logger.info(f"⚡ AI cache hit for {cache_namespace or route_label}")
+            ai_telemetry.record_call(template, route_label, time.monotonic() - lookup_started,
+                                     attempt=attempt, cache_hit=True)
+            return cached
+
+    check_prompt_budget(template, messages)
+    priority = ai_scheduler.resolve_priority(priority, task)
+
+    request_kwargs = {
+        'messages': messages,
+        'temperature': temperature,
+    }
+    if max_tokens is not None:
+        request_kwargs['max_tokens'] = max_tokens
+    if response_format:
+        request_kwargs['response_format'] = response_format
+
+    def _request(request_model, timeout=None, hedge_attempt=None):
+        timeout, cut_by_deadline = deadline.clamp_timeout(timeout, template)
+        provider_breaker.before_call()
+        started = time.monotonic()
+        # Hedged attempts stream, so the one that loses can be closed mid-completion
+        stream_kwargs = {'stream': True, 'stream_options': {'include_usage': True}} if hedge_attempt else {}
+        try:
+            response = (client or get_client()).chat.completions.create(
+                model=request_model, **request_kwargs, **stream_kwargs, **_request_options(template, timeout)
+            )
+        except Exception as e:
+            ai_telemetry.record_call(template, request_model, time.monotonic() - started,
+                                     attempt=attempt, error=True)
+            if cut_by_deadline and isinstance(e, APITimeoutError):
+                # Our own request budget ran out; the provider may be fine
+                provider_breaker.record_cancelled()
+                raise DeadlineExceeded(f"Request time budget spent waiting for {template}") from e
+            _record_provider_outcome(e)
+            raise
+        _record_provider_outcome()
+        if hedge_attempt is None:
+            usage = getattr(response, 'usage', None)
+            content = response.choices[0].message.content or ''
+        else:
+            received = []
+            try:
+                usage = _read_hedged_stream(response, hedge_attempt, received, template)
+            except AttemptAbandoned:
+                ai_telemetry.record_call(template, request_model, time.monotonic() - started,
+                                         attempt=attempt, **_estimated_tokens(messages, received))
+                raise
+            except Exception as e:
+                ai_telemetry.record_call(template, request_model, time.monotonic() - started,
+                                         attempt=attempt, error=True, **_estimated_tokens(messages, received))
+                if not isinstance(e, DeadlineExceeded):
+                    _record_provider_outcome(e)
+                raise
+            content = ''.join(received)
+        latency = time.monotonic() - started
+        ai_telemetry.record_call(template, request_model, latency, attempt=attempt, **_usage_tokens(usage))
+        if ai_fixtures.recording_enabled():
+            ai_fixtures.record_completion(messages, temperature, max_tokens, response_format, content,
+                                          request_model, template, latency, usage)
+        return content
+
+    def _hedged_request(request_model, timeout=None):
+        return hedger.call(f'{template}:{request_model}',
+                           lambda hedge_attempt: _request(request_model, timeout, hedge_attempt))
+
+    request = _hedged_request if hedge else _request
+
+    def _call_model():
+        # One scheduler slot covers the failover tiers and any hedge of this call;
+        # waiting for it happens before the tier timeouts start
+        with ai_scheduler.scheduler.slot(priority):
+            if model:
+                answered_by, content = model, request(model)
+            else:
+                answered_by, content = _call_routed(task, request)
+
+        if cache and (cache_if is None or cache_if(content)):
+            ai_cache.store_response(request_key, answered_by, content, cache_namespace, cache_ttl)
+
+        return content
+
+    if coalesce:
+        wait_timeout, _ = deadline.clamp_timeout(settings.REQUEST_TIMEOUT, template)
+        return in_flight_completions.do(request_key, _call_model, timeout=wait_timeout)
+
+    return _call_model()
+
+
+def _read_hedged_stream(stream, hedge_attempt, received, template):
+    """
+    Collect a hedged attempt's streamed reply into received
+
+    The stream's close() is the attempt's abort hook, so aborting stops the
+    completion on the provider side.
+
+    Returns:
+        The usage chunk, or None if the stream ended without one
+
+    Raises:
+        AttemptAbandoned: If the attempt was aborted before the reply was complete
+    """
+    close = getattr(stream, 'close', None)
+    if close:
+        hedge_attempt.on_abort(close)
+    usage = None
+    try:
+        for chunk in stream:
+            if hedge_attempt.aborted:
+                break
+            # The usage chunk comes last and has no choices
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                received.append(chunk.choices[0].delta.content)
+            if deadline.expired():
+                raise DeadlineExceeded(f"Request time budget spent while streaming {template}")
+    except Exception:
+        if not hedge_attempt.aborted:
+            raise
+    finally:
+        if close:
+            close()
+    if hedge_attempt.aborted:
+        raise AttemptAbandoned(f"Hedged {template} attempt aborted, the other attempt answered")
+    return usage
+
+
+def _call_routed(task, request):
+    """
+    Try the task's model tiers in order until one answers
+
+    Returns:
+        tuple: (model that answered, content)
+    """
+    last_error = None
+    for tier in ai_routing.plan(task):
+        started = time.monotonic()
+        try:
+            content = request(tier['model'], tier['timeout'])
+        except (CircuitOpenError, DeadlineExceeded):
+            # Every tier sits behind the same provider, so failing over is pointless;
+            # and once the request's budget is spent there is no time for another tier
+            raise
+        except Exception as e:
+            ai_routing.record_result(task, tier['model'], time.monotonic() - started, tier['slo'], ok=False)
+            logger.warning(f"⚠️ {tier['model']} failed for '{task}', failing over: {str(e)}")
+            last_error = e
+            continue
+        ai_routing.record_result(task, tier['model'], time.monotonic() - started, tier['slo'])
+        return tier['model'], content
+
+    raise last_error
+
+
+def stream_chat_completion(messages, model=None, temperature=0.7, max_tokens=None, client=None,
+                           response_format=None, template=None, attempt=1, task=None, priority=None):
+    """
+    Run a streamed chat completion and yield the text deltas as they arrive
+
+    Closing the generator early closes the underlying HTTP stream, which
+    stops the completion on the provider side. Routed streams fail over to the
+    next tier only while opening the stream, never after text was sent. The
+    stream is cut with DeadlineExceeded once the request's time budget is spent.
+    The stream holds a scheduler slot until it is closed.
+    """
+    if not model and not task:
+        raise ValueError("stream_chat_completion needs a model or a task")
+
+    template = template or model or f'task:{task}'
+    check_prompt_budget(template, messages)
+
+    with ai_scheduler.scheduler.slot(ai_scheduler.resolve_priority(priority, task)):
+        yield from _stream_completion(messages, model, temperature, max_tokens, client,
+                                      response_format, template, attempt, task)
+
+
+def _stream_completion(messages, model, temperature, max_tokens, client, response_format, template, attempt, task):
+    """stream_chat_completion body, run while holding a scheduler slot"""
+    request_kwargs = {
+        'messages': messages,
+        'temperature': temperature,
+        'stream': True,
+        'stream_options': {'include_usage': True},
+    }
+    if max_tokens is not None:
+        request_kwargs['max_tokens'] = max_tokens
+    if response_format:
+        request_kwargs['response_format'] = response_format
+
+    tiers = [{'model': model, 'timeout': None}] if model else ai_routing.plan(task)
+    stream = None
+    last_error = None
+    for tier in tiers:
+        timeout, cut_by_deadline = deadline.clamp_timeout(tier['timeout'], template)
+        provider_breaker.before_call()
+        started = time.monotonic()
+        try:
+            stream = (client or get_client()).chat.completions.create(
+                model=tier['model'], **request_kwargs, **_request_options(template, timeout)
+            )
+            stream_model = tier['model']
+            _record_provider_outcome()
+            break
+        except Exception as e:
+            ai_telemetry.record_call(template, tier['model'], time.monotonic() - started,
+                                     attempt=attempt, error=True)
+            if cut_by_deadline and isinstance(e, APITimeoutError):
+                provider_breaker.record_cancelled()
+                raise DeadlineExceeded(f"Request time budget spent opening {template} stream") from e
+            _record_provider_outcome(e)
+            if task:
+                ai_routing.record_result(task, tier['model'], time.monotonic() - started, tier['slo'], ok=False)
+                logger.warning(f"⚠️ {tier['model']} stream failed for '{task}', failing over: {str(e)}")
+            last_error = e
+    if stream is None:
+        raise last_error
+
+    usage = None
+    failed = False
+    received = []
+    try:
+        for chunk in stream:
+            # The usage chunk comes last and has no choices
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                received.append(delta)
+                yield delta
+            if deadline.expired():
+                raise DeadlineExceeded(f"Request time budget spent while streaming {template}")
+    except DeadlineExceeded:
+        failed = True
+        raise
+    except Exception as e:
+        failed = True
+        _record_provider_outcome(e)
+        raise
+    finally:
+        close = getattr(stream, 'close', None)
+        if close:
+            close()
+        latency = time.monotonic() - started
+        # Streams closed early never receive the usage chunk; their tokens are estimated
+        tokens = _usage_tokens(usage) if usage else _estimated_tokens(messages, received)
+        ai_telemetry.record_call(template, stream_model, latency, attempt=attempt, error=failed, **tokens)
+        if not failed and ai_fixtures.recording_enabled():
+            ai_fixtures.record_completion(messages, temperature, max_tokens, response_format, ''.join(received),
+                                          stream_model, template, latency, usage)
+
+
+def contains_json(text):
+    """Cache guard: True when the text holds a parseable JSON object or array"""
+    for open_char, close_char in (('{', '}'), ('[', ']')):
+        start_idx = text.find(open_char)
+        end_idx = text.rfind(close_char) + 1
+        if start_idx >= 0 and end_idx > start_idx:
+            try:
+                json.loads(text[start_idx:end_idx])
+                return True
+            except ValueError:
+                continue
+    return False
@@ -0,0 +1,105 @@
+# backend/wildlitz/utils/ai_fixtures.py
+"""
+Recorded model completions for offline replay.
+
+With AI_RECORD_DIR set, every completion that goes through utils.ai_client
+is appended to <AI_RECORD_DIR>/<prompt hash>.json. The hash covers the
+messages and sampling options but not the model, so a recording made on
+one routing tier replays for any tier. The ai_stub_server command serves
+these files back through an OpenAI-compatible API.
+"""
+
+import json
+import logging
+import os
+import threading
+
+from django.conf import settings
+
+from utils.ai_cache import make_cache_key
+
+logger = logging.getLogger(__name__)
+
+_write_lock = threading.Lock()
+
+
+def fixture_key(messages, temperature, max_tokens, response_format=None):
+    """Prompt hash shared by the recorder and the stub server"""
+    extra = {'response_format': response_format} if response_format else {}
+    return make_cache_key('fixture', messages, temperature, max_tokens, **extra)
+
+
+def recording_enabled():
+    return bool(getattr(settings, 'AI_RECORD_DIR', ''))
+
+
+def record_completion(messages, temperature, max_tokens, response_format, content,
+                      model, template, latency, usage=None):
+    """
+    Append a completion to its fixture file (no-op unless AI_RECORD_DIR is set)
+
+    Recording problems are logged and never break the request.
+    """
+    record_dir = getattr(settings, 'AI_RECORD_DIR', '')
+    if not record_dir:
+        return
+
+    key = fixture_key(messages, temperature, max_tokens, response_format)
+    path = os.path.join(record_dir, f'{key}.json')
+    completion = {
+        'model': model,
+        'content': content,
+        'latency_ms': round(latency * 1000, 1),
+        'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+        'completion_tokens': getattr(usage, 'completion_tokens', None),
+    }
+
+    try:
+        with _write_lock:
+            os.makedirs(record_dir, exist_ok=True)
+            fixture = load_fixture_file(path) or {
+                'key': key,
+                'template': template,
+                'messages': messages,
+                'temperature': temperature,
+                'max_tokens': max_tokens,
+                'response_format': response_format,
+                'completions': [],
+            }
+            fixture['completions'].append(completion)
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(fixture, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not record AI fixture {key[:12]}: {str(e)}")
+
+
+def load_fixture_file(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_fixtures(fixture_dir):
+    """
+    Load every recorded fixture in a directory
+
+    Returns:
+        dict: prompt hash -> fixture
+    """
+    fixtures = {}
+    if not fixture_dir or not os.path.isdir(fixture_dir):
+        return fixtures
+    for name in os.listdir(fixture_dir):
+        if not name.endswith('.json'):
+            continue
+        try:
+            fixture = load_fixture_file(os.path.join(fixture_dir, name))
+        except ValueError:
+            logger.warning(f"⚠️ Skipping unreadable AI fixture {name}")
+            continue
+        if fixture and fixture.get('completions'):
+            fixtures[fixture['key']] = fixture
+    return fixtures
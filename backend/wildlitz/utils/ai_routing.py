@@ -0,0 +1,143 @@
+# backend/wildlitz/utils/ai_routing.py
+"""
+Task-based model routing.
+
+Call sites name the kind of work they need (a short speech-bubble message,
+a JSON payload, a validation verdict, a long story) instead of a model.
+Each task maps to an ordered list of model tiers, cheapest first, each with
+a latency SLO:
+
+- A call that runs past its tier's hard timeout (SLO x AI_ROUTE_TIMEOUT_FACTOR)
+  or fails is retried on the next tier straight away.
+- A tier that breaches its SLO (or fails) AI_ROUTE_BREACH_LIMIT times in a row
+  is demoted behind the other tiers for AI_ROUTE_COOLDOWN_SECONDS, so
+  interactive requests stop paying for a slow tier.
+
+The table can be overridden with AI_MODEL_ROUTES in settings.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SHORT_MESSAGE = 'short_message'
+JSON_GENERATION = 'json_generation'
+VALIDATION = 'validation'
+LONG_STORY = 'long_story'
+
+# task -> ordered tiers; slo is the target latency in seconds for a full response
+DEFAULT_ROUTES = {
+    SHORT_MESSAGE: [
+        {'model': 'gpt-4o-mini', 'slo': 2.0},
+        {'model': 'gpt-3.5-turbo', 'slo': 3.0},
+    ],
+    VALIDATION: [
+        {'model': 'gpt-4o-mini', 'slo': 3.0},
+        {'model': 'gpt-4o', 'slo': 6.0},
+    ],
+    JSON_GENERATION: [
+        {'model': 'gpt-4o-mini', 'slo': 10.0},
+        {'model': 'gpt-3.5-turbo', 'slo': 15.0},
+    ],
+    # Stories, episodes and large phonics word batches
+    LONG_STORY: [
+        {'model': 'gpt-3.5-turbo', 'slo': 20.0},
+        {'model': 'gpt-4o-mini', 'slo': 30.0},
+    ],
+}
+
+_lock = threading.Lock()
+_health = {}  # (task, model) -> {'breaches': int, 'demoted_until': float, 'calls': int, 'latency_total': float}
+
+
+def get_routes():
+    """Routing table in effect (settings override merged over the defaults)"""
+    routes = dict(DEFAULT_ROUTES)
+    routes.update(getattr(settings, 'AI_MODEL_ROUTES', None) or {})
+    return routes
+
+
+def _tier_health(task, model):
+    return _health.setdefault((task, model), {
+        'breaches': 0,
+        'demoted_until': 0.0,
+        'calls': 0,
+        'latency_total': 0.0,
+    })
+
+
+def plan(task):
+    """
+    Tiers to try for a task, in order
+
+    Healthy tiers keep their configured order; demoted tiers move to the end so
+    they are still available as a last resort.
+
+    Returns:
+        list: [{'model': str, 'slo': float, 'timeout': float or None}, ...]
+            The last tier has no timeout of its own (the client default applies).
+    """
+    tiers = get_routes().get(task)
+    if not tiers:
+        raise KeyError(f"Unknown AI task type: {task}")
+
+    now = time.monotonic()
+    with _lock:
+        healthy = [tier for tier in tiers if _tier_health(task, tier['model'])['demoted_until'] <= now]
+        demoted = [tier for tier in tiers if tier not in healthy]
+
+    factor = getattr(settings, 'AI_ROUTE_TIMEOUT_FACTOR', 2.0)
+    ordered = healthy + demoted
+    return [
+        {
+            'model': tier['model'],
+            'slo': tier['slo'],
+            'timeout': tier['slo'] * factor if i < len(ordered) - 1 else None,
+        }
+        for i, tier in enumerate(ordered)
+    ]
+
+
+def record_result(task, model, latency, slo, ok=True):
+    """Feed a call outcome back into the tier health used by plan()"""
+    breach_limit = getattr(settings, 'AI_ROUTE_BREACH_LIMIT', 3)
+    cooldown = getattr(settings, 'AI_ROUTE_COOLDOWN_SECONDS', 60)
+
+    with _lock:
+        health = _tier_health(task, model)
+        health['calls'] += 1
+        health['latency_total'] += latency
+
+        if ok and latency <= slo:
+            health['breaches'] = 0
+            return
+
+        health['breaches'] += 1
+        if health['breaches'] >= breach_limit and health['demoted_until'] <= time.monotonic():
+            health['demoted_until'] = time.monotonic() + cooldown
+            health['breaches'] = 0
+            logger.warning(f"🐢 {model} demoted for '{task}' for {cooldown}s after repeated SLO breaches")
+
+
+def get_routing_stats():
+    """Current tier health for the metrics endpoint"""
+    now = time.monotonic()
+    stats = {}
+    with _lock:
+        for task, tiers in get_routes().items():
+            stats[task] = []
+            for tier in tiers:
+                health = _tier_health(task, tier['model'])
+                stats[task].append({
+                    'model': tier['model'],
+                    'slo_seconds': tier['slo'],
+                    'calls': health['calls'],
+                    'avg_latency_ms': round(health['latency_total'] / health['calls'] * 1000, 1) if health['calls'] else 0.0,
+                    'consecutive_breaches': health['breaches'],
+                    'demoted_for_seconds': round(max(0.0, health['demoted_until'] - now), 1),
+                })
+    return stats
@@ -0,0 +1,229 @@
+# backend/wildlitz/utils/ai_scheduler.py
+"""
+Priority-aware admission in front of model calls.
+
+Every call to the provider takes one of AI_MAX_CONCURRENT_CALLS slots
+(the process's share of the provider rate limit). Callers that find no
+free slot wait in a queue for their priority class:
+
+interactive  a student is waiting on the answer (feedback, explain_word)
+standard     game content generated on request (word batches, stories)
+background   bulk and prefetch work (custom word enrichment, example
+             words, requests sent with X-AI-Priority: background)
+
+Freed slots go to the waiting classes by smooth weighted round robin
+(AI_PRIORITY_WEIGHTS), so background work still progresses under load but
+never ahead of its share. AI_INTERACTIVE_RESERVED_SLOTS slots are only ever
+given to interactive calls, so a student never waits behind a backfill job.
+
+The class comes from the call (priority=...), else the priority_class()
+block it runs in (set per endpoint by AIPriorityMiddleware), else the
+routing task.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from utils import deadline
+from utils.ai_routing import JSON_GENERATION, LONG_STORY, SHORT_MESSAGE, VALIDATION
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 'interactive'
+STANDARD = 'standard'
+BACKGROUND = 'background'
+
+PRIORITY_CLASSES = (INTERACTIVE, STANDARD, BACKGROUND)
+
+DEFAULT_WEIGHTS = {INTERACTIVE: 6, STANDARD: 3, BACKGROUND: 1}
+
+TASK_PRIORITIES = {
+    SHORT_MESSAGE: INTERACTIVE,
+    VALIDATION: INTERACTIVE,
+    JSON_GENERATION: STANDARD,
+    LONG_STORY: STANDARD,
+}
+
+_local = threading.local()
+
+
+class QueueTimeout(TimeoutError):
+    """Raised when a call waited longer than AI_SCHEDULER_MAX_WAIT_SECONDS for a slot"""
+
+
+@contextmanager
+def priority_class(priority):
+    """Run the model calls made inside the block at the given priority class"""
+    if priority not in PRIORITY_CLASSES:
+        raise ValueError(f"Unknown AI priority class '{priority}'")
+    previous = getattr(_local, 'priority', None)
+    _local.priority = priority
+    try:
+        yield priority
+    finally:
+        _local.priority = previous
+
+
+def current_priority():
+    return getattr(_local, 'priority', None)
+
+
+def resolve_priority(priority=None, task=None):
+    """Priority class for a call: explicit, else the enclosing block, else by task"""
+    return priority or current_priority() or TASK_PRIORITIES.get(task, STANDARD)
+
+
+class _Ticket:
+    __slots__ = ('priority', 'granted', 'event', 'queued_at')
+
+    def __init__(self, priority):
+        self.priority = priority
+        self.granted = False
+        self.event = threading.Event()
+        self.queued_at = time.monotonic()
+
+
+class PriorityScheduler:
+    """Concurrency slots handed out by weighted fair queueing across priority classes"""
+
+    def __init__(self, max_concurrent=8, interactive_reserved=2, weights=None, max_wait=30):
+        """
+        Args:
+            max_concurrent (int): Model calls allowed in flight at once
+            interactive_reserved (int): Slots only interactive calls may take
+            weights (dict): Priority class -> share of freed slots while classes compete
+            max_wait (float): Longest a call waits for a slot
+        """
+        self.max_concurrent = max_concurrent
+        self.interactive_reserved = min(interactive_reserved, max_concurrent - 1)
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.max_wait = max_wait
+
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._queues = {name: deque() for name in PRIORITY_CLASSES}
+        self._credits = {name: 0 for name in PRIORITY_CLASSES}
+        self._stats = {
+            name: {'granted': 0, 'queued': 0, 'timeouts': 0, 'wait_total': 0.0, 'wait_max': 0.0}
+            for name in PRIORITY_CLASSES
+        }
+
+    def _may_take_slot(self, priority):
+        # Caller holds the lock
+        free = self.max_concurrent - self._in_use
+        if priority == INTERACTIVE:
+            return free > 0
+        return free > self.interactive_reserved
+
+    def _next_class(self):
+        """Smooth weighted round robin over the classes that may take a slot now"""
+        eligible = [name for name in PRIORITY_CLASSES if self._queues[name] and self._may_take_slot(name)]
+        if not eligible:
+            return None
+        total = sum(self.weights[name] for name in eligible)
+        for name in eligible:
+            self._credits[name] += self.weights[name]
+        chosen = max(eligible, key=lambda name: self._credits[name])
+        self._credits[chosen] -= total
+        return chosen
+
+    def _grant(self, ticket):
+        # Caller holds the lock
+        waited = time.monotonic() - ticket.queued_at
+        stats = self._stats[ticket.priority]
+        stats['granted'] += 1
+        stats['wait_total'] += waited
+        stats['wait_max'] = max(stats['wait_max'], waited)
+        ticket.granted = True
+        self._in_use += 1
+        ticket.event.set()
+
+    def _dispatch(self):
+        # Caller holds the lock
+        while True:
+            name = self._next_class()
+            if name is None:
+                return
+            self._grant(self._queues[name].popleft())
+
+    def acquire(self, priority):
+        """
+        Wait for a slot
+
+        Raises:
+            DeadlineExceeded: If the request's time budget ran out while waiting
+            QueueTimeout: If the wait exceeded max_wait
+        """
+        ticket = _Ticket(priority)
+        with self._lock:
+            # Nothing queued ahead in a class that may run: take the slot straight away
+            if not any(self._queues.values()) and self._may_take_slot(priority):
+                self._grant(ticket)
+                return
+            self._queues[priority].append(ticket)
+            self._stats[priority]['queued'] += 1
+            self._dispatch()
+
+        left = deadline.remaining()
+        wait_for = self.max_wait if left is None else min(self.max_wait, left)
+        if ticket.event.wait(wait_for):
+            return
+
+        with self._lock:
+            if ticket.granted:
+                return
+            self._queues[priority].remove(ticket)
+            self._stats[priority]['timeouts'] += 1
+        logger.warning(f"⏳ {priority} AI call gave up after waiting {wait_for:.1f}s for a slot")
+        if left is not None and left <= self.max_wait:
+            raise deadline.DeadlineExceeded("Request time budget spent waiting for an AI slot")
+        raise QueueTimeout(f"No AI slot for a {priority} call within {self.max_wait}s")
+
+    def release(self):
+        with self._lock:
+            self._in_use -= 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, priority):
+        """Hold one slot for the duration of the block"""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self):
+        """Slot usage and per-class queueing for the metrics report"""
+        with self._lock:
+            classes = {}
+            for name in PRIORITY_CLASSES:
+                stats = self._stats[name]
+                classes[name] = {
+                    'waiting': len(self._queues[name]),
+                    'granted': stats['granted'],
+                    'queued': stats['queued'],
+                    'timeouts': stats['timeouts'],
+                    'avg_wait_ms': round(stats['wait_total'] / stats['granted'] * 1000, 1) if stats['granted'] else 0.0,
+                    'max_wait_ms': round(stats['wait_max'] * 1000, 1),
+                }
+            return {
+                'max_concurrent': self.max_concurrent,
+                'interactive_reserved': self.interactive_reserved,
+                'in_use': self._in_use,
+                'weights': self.weights,
+                'classes': classes,
+            }
+
+
+scheduler = PriorityScheduler(
+    max_concurrent=getattr(settings, 'AI_MAX_CONCURRENT_CALLS', 8),
+    interactive_reserved=getattr(settings, 'AI_INTERACTIVE_RESERVED_SLOTS', 2),
+    weights=getattr(settings, 'AI_PRIORITY_WEIGHTS', None),
+    max_wait=getattr(settings, 'AI_SCHEDULER_MAX_WAIT_SECONDS', 30),
+)
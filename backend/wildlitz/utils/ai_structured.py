@@ -0,0 +1,254 @@
+# backend/wildlitz/utils/ai_structured.py
+"""
+Structured (JSON) output from the model.
+
+Requests use JSON mode where the expected top-level value is an object, the
+reply goes through a tolerant local repair pass (markdown fences, surrounding
+prose, trailing or missing commas, truncated output) and is then validated
+against a pydantic schema. The model is only asked again when the output
+cannot be repaired into something that passes the schema.
+"""
+
+import json
+import logging
+import re
+from functools import lru_cache
+
+from pydantic import TypeAdapter, ValidationError
+
+from utils import deadline
+from utils.ai_client import chat_completion
+
+logger = logging.getLogger(__name__)
+
+JSON_OBJECT_FORMAT = {'type': 'json_object'}
+
+_FENCE_RE = re.compile(r'```(?:json|JSON)?\s*')
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_MISSING_COMMA_RE = re.compile(r'([}\]"])(\s*\n\s*)(?=[{\["])')
+_CLOSERS = {'{': '}', '[': ']'}
+
+
+class StructuredOutputError(ValueError):
+    """Model output could not be parsed or validated, even after repair"""
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema):
+    # TypeAdapters are compiled once per schema and reused for every response
+    return TypeAdapter(schema)
+
+
+def _outside_strings(text, transform):
+    """Apply a regex transform only to the parts of text that are not JSON strings"""
+    parts = re.split(r'("(?:[^"\\]|\\.)*")', text)
+    return ''.join(part if i % 2 else transform(part) for i, part in enumerate(parts))
+
+
+def _extract_value(text):
+    """
+    Cut the first top-level JSON value out of text
+
+    If the value is truncated, it is cut back to the last complete element and
+    the open containers are closed.
+    """
+    start = min((i for i in (text.find('{'), text.find('[')) if i >= 0), default=-1)
+    if start < 0:
+        return None
+
+    stack = []
+    in_string = False
+    escape = False
+    last_safe = None  # (end index, open containers) after the last complete element
+
+    for i in range(start, len(text)):
+        char = text[i]
+
+        if in_string:
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in '{[':
+            stack.append(char)
+        elif char in '}]':
+            if stack:
+                stack.pop()
+            if not stack:
+                return text[start:i + 1]
+            last_safe = (i + 1, list(stack))
+        elif char == ',' and stack:
+            last_safe = (i, list(stack))
+
+    # Truncated output: keep everything up to the last complete element
+    if last_safe is None:
+        return None
+    end, open_containers = last_safe
+    closing = ''.join(_CLOSERS[c] for c in reversed(open_containers))
+    return text[start:end] + closing
+
+
+def repair_json(text):
+    """
+    Best-effort local repair of near-miss JSON from the model
+
+    Returns:
+        str or None: Repaired JSON text, or None if no JSON value was found
+    """
+    if not text:
+        return None
+
+    candidate = _FENCE_RE.sub('', text).replace('```', '')
+    candidate = _extract_value(candidate)
+    if candidate is None:
+        return None
+
+    candidate = _outside_strings(candidate, lambda part: _TRAILING_COMMA_RE.sub(r'\1', part))
+    candidate = _MISSING_COMMA_RE.sub(r'\1,\2', candidate)
+    candidate = _outside_strings(
+        candidate,
+        lambda part: re.sub(r'\bTrue\b', 'true', re.sub(r'\bFalse\b', 'false', re.sub(r'\bNone\b', 'null', part)))
+    )
+    return candidate
+
+
+def load_json(text):
+    """Parse model output as JSON, repairing it locally if needed"""
+    if text is None:
+        raise StructuredOutputError("Empty model response")
+
+    try:
+        return json.loads(text.strip())
+    except ValueError:
+        pass
+
+    repaired = repair_json(text)
+    if repaired is None:
+        raise StructuredOutputError("No JSON value found in model response")
+
+    try:
+        data = json.loads(repaired)
+    except ValueError as e:
+        raise StructuredOutputError(f"Irreparable JSON: {str(e)}")
+
+    logger.info("🔧 Repaired malformed JSON from model locally")
+    return data
+
+
+def parse_structured(text, schema):
+    """
+    Parse and validate model output against a pydantic schema
+
+    Returns:
+        Plain python data (dicts/lists) containing only the fields the model sent
+    """
+    data = load_json(text)
+    adapter = _adapter(schema)
+    try:
+        validated = adapter.validate_python(data)
+    except ValidationError as e:
+        raise StructuredOutputError(f"Schema validation failed: {e.error_count()} error(s): {e.errors()[0].get('msg', '')}")
+    return adapter.dump_python(validated, exclude_unset=True)
+
+
+def parse_structured_items(text, item_schema):
+    """
+    Parse a JSON array and validate each element on its own
+
+    Elements that fail validation are dropped instead of rejecting the whole
+    response. An object wrapping a single array (e.g. {"words": [...]}) is unwrapped.
+    """
+    data = load_json(text)
+
+    if isinstance(data, dict):
+        arrays = [value for value in data.values() if isinstance(value, list)]
+        if len(arrays) == 1:
+            data = arrays[0]
+
+    if not isinstance(data, list):
+        raise StructuredOutputError("Expected a JSON array")
+
+    items = []
+    rejected = 0
+    for element in data:
+        item = validate_item(element, item_schema)
+        if item is None:
+            rejected += 1
+        else:
+            items.append(item)
+
+    if rejected:
+        logger.warning(f"⚠️ Dropped {rejected} element(s) that failed schema validation")
+    return items
+
+
+def validate_item(element, item_schema):
+    """
+    Validate one array element, e.g. as it closes in a streamed response
+
+    Args:
+        element: Parsed element, or its raw JSON text
+
+    Returns:
+        dict: The element with only the fields the model sent, or None if it is invalid
+    """
+    if isinstance(element, str):
+        try:
+            element = load_json(element)
+        except StructuredOutputError:
+            return None
+
+    adapter = _adapter(item_schema)
+    try:
+        return adapter.dump_python(adapter.validate_python(element), exclude_unset=True)
+    except ValidationError:
+        return None
+
+
+def is_valid_structured(text, schema):
+    """Cache guard: True when the text parses into the schema"""
+    try:
+        parse_structured(text, schema)
+        return True
+    except StructuredOutputError:
+        return False
+
+
+def structured_completion(messages, schema, json_mode=True, max_attempts=2, **kwargs):
+    """
+    Run a chat completion and return its output validated against schema
+
+    Args:
+        messages (list): Chat messages (must mention JSON when json_mode is on)
+        schema: Pydantic model or type describing the expected JSON
+        json_mode (bool): Ask the provider for a JSON object response
+        max_attempts (int): Total model calls when output is irreparable
+        **kwargs: Passed through to chat_completion (model or task, temperature, cache, ...)
+
+    Raises:
+        StructuredOutputError: If no attempt produced valid output
+    """
+    if json_mode:
+        kwargs['response_format'] = JSON_OBJECT_FORMAT
+    if kwargs.get('cache') and 'cache_if' not in kwargs:
+        kwargs['cache_if'] = lambda text: is_valid_structured(text, schema)
+
+    last_error = None
+    for attempt in range(max_attempts):
+        text = chat_completion(messages, attempt=attempt + 1, **kwargs)
+        try:
+            return parse_structured(text, schema)
+        except StructuredOutputError as e:
+            last_error = e
+            logger.warning(f"⚠️ Irreparable model output (attempt {attempt + 1}/{max_attempts}): {str(e)}")
+            if deadline.expired():
+                # No time left for another call; let the caller fall back
+                break
+
+    raise last_error
@@ -0,0 +1,335 @@
+# backend/wildlitz/utils/ai_stub.py
+"""
+Local OpenAI-compatible stub for load testing.
+
+Serves POST /v1/chat/completions (streaming and non-streaming). Requests
+whose prompt hash has a recorded fixture (utils/ai_fixtures.py) get a
+recorded completion back; other requests get a synthesized completion that
+is valid for the call site's schema, picked by the X-AI-Template header that
+utils.ai_client sends when OPENAI_BASE_URL is set. Latency and error
+injection are configurable and seeded, so runs are reproducible.
+
+Started with 'python manage.py ai_stub_server'.
+"""
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+import typing
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.ai_fixtures import fixture_key, load_fixtures
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_WORDS = ['cat', 'sun', 'map', 'frog', 'ship', 'lamp', 'duck', 'tree', 'cake', 'boat']
+
+# Values for well-known field names so synthesized output passes the views' own checks
+SAMPLE_FIELD_VALUES = {
+    'word': 'cat',
+    'syllableBreakdown': 'cat',
+    'targetLetter': 'a',
+    'pattern': 'a',
+    'patternPosition': 'middle',
+    'phonicsRule': "The letter 'a' makes its short sound, as in cat.",
+    'definition': 'A small furry animal that says meow.',
+    'example': 'The cat sat on the mat.',
+    'part_of_speech': 'noun',
+    'syllables': 'cat',
+    'phonetic_breakdown': 'k-a-t',
+    'sound': 'a',
+    'explanation': "Short 'a' sound, as in the middle of apple.",
+    'suggestion': 'The structure is correct.',
+    'alternative_breakdown': None,
+    'is_correct': True,
+    'confidence': 0.9,
+    'text': (
+        'Maya and her dog Sam walked to the pond.\n'
+        'They saw a frog sitting on a big green leaf.\n'
+        'The frog jumped into the water with a splash!'
+    ),
+}
+
+DEFAULT_TEXT_REPLY = "Great job! Listen carefully and try the next word."
+
+
+def _stub_outputs():
+    """Template id -> type of the JSON the call site expects"""
+    from phonics.schemas import PhonicsWord
+    from sentence_formation.schemas import NextEpisodeOutput, StoryOutput, WordExplanation
+    from syllabification.schemas import PhoneticGuide, SyllableValidation
+
+    return {
+        'sentence_formation.story': StoryOutput,
+        'sentence_formation.next_episode': NextEpisodeOutput,
+        'sentence_formation.explain_word': WordExplanation,
+        'sentence_formation.generate_answer_choices': typing.List[str],
+        'sentence_formation.generate_crossword_clues': typing.Dict[str, str],
+        'syllabification.validate_syllable_structure': SyllableValidation,
+        'syllabification.generate_phonetic_guide': PhoneticGuide,
+        'phonics.generate_single_batch': typing.List[PhonicsWord],
+        'phonics.generate_example_words': typing.List[str],
+    }
+
+
+def sample_value(annotation, name='', count=5, index=0):
+    """Build a value of the given type, filling model fields with sample data"""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Union:
+        options = [arg for arg in args if arg is not type(None)]
+        return sample_value(options[0], name, count) if options else None
+    if origin in (list, typing.List):
+        item_type = args[0] if args else str
+        if item_type is str:
+            return SAMPLE_WORDS[:max(count, 6)]
+        return [sample_value(item_type, name, count, i) for i in range(count)]
+    if origin in (dict, typing.Dict):
+        return {word: f'A short clue for {word}' for word in SAMPLE_WORDS[:count]}
+
+    if hasattr(annotation, 'model_fields'):
+        value = {
+            field_name: (
+                SAMPLE_FIELD_VALUES[field_name] if field_name in SAMPLE_FIELD_VALUES
+                else sample_value(field.annotation, field_name, count)
+            )
+            for field_name, field in annotation.model_fields.items()
+        }
+        if 'word' in value:
+            # Distinct words so de-duplication downstream keeps them all
+            value['word'] = SAMPLE_WORDS[index % len(SAMPLE_WORDS)]
+            if 'syllableBreakdown' in value:
+                value['syllableBreakdown'] = value['word']
+        return value
+
+    if annotation is bool:
+        return True
+    if annotation is int:
+        return 1
+    if annotation is float:
+        return 0.9
+    return SAMPLE_FIELD_VALUES.get(name, f'Sample {name or "text"}')
+
+
+def synthesize_content(template, body):
+    """Schema-valid completion text for a request that has no recording"""
+    outputs = _stub_outputs()
+    messages_text = ' '.join(str(m.get('content', '')) for m in body.get('messages', []))
+
+    if template in outputs:
+        match = re.search(r'EXACTLY (\d+)', messages_text)
+        count = min(int(match.group(1)), 40) if match else 5
+        return json.dumps(sample_value(outputs[template], count=count))
+    if (body.get('response_format') or {}).get('type') == 'json_object':
+        return '{}'
+    return DEFAULT_TEXT_REPLY
+
+
+def estimate_tokens(text):
+    return max(1, len(text) // 4)
+
+
+class StubConfig:
+    """Latency and failure behaviour of the stub"""
+
+    def __init__(self, fixture_dir='', latency='lognormal', latency_ms=800.0, latency_sigma=0.5,
+                 error_rate=0.0, rate_limit_rate=0.0, hang_rate=0.0, hang_seconds=120.0,
+                 stream_chunk_ms=15.0, on_miss='synthesize', seed=None):
+        self.fixtures = load_fixtures(fixture_dir)
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.stream_chunk_ms = stream_chunk_ms
+        self.on_miss = on_miss
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {'requests': 0, 'replayed': 0, 'synthesized': 0, 'errors': 0, 'rate_limited': 0, 'hung': 0}
+
+    def roll(self):
+        with self._random_lock:
+            return self._random.random()
+
+    def choose(self, items):
+        with self._random_lock:
+            return self._random.choice(items)
+
+    def sample_latency(self, recorded_ms=None):
+        """Seconds to wait before answering"""
+        with self._random_lock:
+            if self.latency == 'recorded' and recorded_ms is not None:
+                return recorded_ms / 1000
+            if self.latency == 'fixed':
+                return self.latency_ms / 1000
+            if self.latency == 'uniform':
+                return self._random.uniform(0, 2 * self.latency_ms) / 1000
+            # lognormal: latency_ms is the median, sigma controls the tail
+            return self._random.lognormvariate(0, self.latency_sigma) * self.latency_ms / 1000
+
+    def count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+
+def make_handler(config):
+    """Request handler class bound to a StubConfig"""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        server_version = 'WildLitzAIStub/1.0'
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+        def do_GET(self):
+            if self.path.rstrip('/').endswith('/stats'):
+                self._send_json(200, config.stats)
+            else:
+                self._send_json(404, {'error': {'message': 'Not found', 'type': 'invalid_request_error'}})
+
+        def do_POST(self):
+            if not self.path.rstrip('/').endswith('/chat/completions'):
+                self._send_json(404, {'error': {'message': 'Not found', 'type': 'invalid_request_error'}})
+                return
+
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                self._send_json(400, {'error': {'message': 'Invalid JSON body', 'type': 'invalid_request_error'}})
+                return
+
+            config.count('requests')
+
+            roll = config.roll()
+            if roll < config.hang_rate:
+                config.count('hung')
+                time.sleep(config.hang_seconds)
+                return
+            roll -= config.hang_rate
+            if roll < config.rate_limit_rate:
+                config.count('rate_limited')
+                self._send_json(429, {'error': {'message': 'Rate limit reached (stub)', 'type': 'rate_limit_error'}})
+                return
+            roll -= config.rate_limit_rate
+            if roll < config.error_rate:
+                config.count('errors')
+                time.sleep(config.sample_latency())
+                self._send_json(500, {'error': {'message': 'Injected server error (stub)', 'type': 'server_error'}})
+                return
+
+            key = fixture_key(body.get('messages', []), body.get('temperature'),
+                              body.get('max_tokens'), body.get('response_format'))
+            fixture = config.fixtures.get(key)
+            recorded_ms = None
+            if fixture:
+                completion = config.choose(fixture['completions'])
+                content = completion['content']
+                recorded_ms = completion.get('latency_ms')
+                config.count('replayed')
+            elif config.on_miss == 'error':
+                self._send_json(404, {'error': {'message': f'No fixture for prompt {key[:12]}', 'type': 'invalid_request_error'}})
+                return
+            else:
+                content = synthesize_content(self.headers.get('X-AI-Template', ''), body)
+                config.count('synthesized')
+
+            prompt_tokens = estimate_tokens(json.dumps(body.get('messages', [])))
+            completion_tokens = estimate_tokens(content)
+            model = body.get('model', 'stub')
+            delay = config.sample_latency(recorded_ms)
+
+            if body.get('stream'):
+                include_usage = (body.get('stream_options') or {}).get('include_usage', False)
+                self._send_stream(model, content, delay, prompt_tokens, completion_tokens, include_usage)
+                return
+
+            time.sleep(delay)
+            self._send_json(200, {
+                'id': f'chatcmpl-stub-{uuid.uuid4().hex[:12]}',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': content},
+                    'finish_reason': 'stop',
+                    'logprobs': None,
+                }],
+                'usage': {
+                    'prompt_tokens': prompt_tokens,
+                    'completion_tokens': completion_tokens,
+                    'total_tokens': prompt_tokens + completion_tokens,
+                },
+            })
+
+        def _send_json(self, status_code, payload):
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(status_code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_stream(self, model, content, first_token_delay, prompt_tokens, completion_tokens, include_usage):
+            completion_id = f'chatcmpl-stub-{uuid.uuid4().hex[:12]}'
+            created = int(time.time())
+
+            def chunk(delta, finish_reason=None, usage=None):
+                payload = {
+                    'id': completion_id,
+                    'object': 'chat.completion.chunk',
+                    'created': created,
+                    'model': model,
+                    'choices': [] if usage else [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}],
+                }
+                if usage:
+                    payload['usage'] = usage
+                self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode('utf-8'))
+                self.wfile.flush()
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+
+            try:
+                time.sleep(first_token_delay)
+                chunk({'role': 'assistant', 'content': ''})
+                # Roughly one token per chunk
+                for start in range(0, len(content), 4):
+                    chunk({'content': content[start:start + 4]})
+                    time.sleep(config.stream_chunk_ms / 1000)
+                chunk({}, finish_reason='stop')
+                if include_usage:
+                    chunk(None, usage={
+                        'prompt_tokens': prompt_tokens,
+                        'completion_tokens': completion_tokens,
+                        'total_tokens': prompt_tokens + completion_tokens,
+                    })
+                self.wfile.write(b"data: [DONE]\n\n")
+            except (BrokenPipeError, ConnectionResetError):
+                # Client closed the stream early (e.g. story JSON already complete)
+                pass
+            self.close_connection = True
+
+    return StubHandler
+
+
+def run_stub_server(config, host='127.0.0.1', port=8765):
+    """Serve until interrupted"""
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
@@ -0,0 +1,283 @@
+# backend/wildlitz/utils/ai_telemetry.py
+"""
+In-memory telemetry for model calls.
+
+Every call that goes through utils.ai_client is recorded with the endpoint
+that made it, the prompt template id, model, token usage, latency, retry
+attempt and estimated cost. Fallback paths report themselves through
+record_fallback(). The endpoint is taken from the request context opened by
+AITelemetryMiddleware; calls made outside a request are filed under '-'.
+
+Numbers are per process and reset on restart.
+"""
+
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+# USD per 1M tokens (prompt, completion)
+MODEL_PRICING = {
+    'gpt-3.5-turbo': (0.50, 1.50),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4': (30.00, 60.00),
+}
+
+# Prompt tokens served from the provider's prompt cache are billed at this fraction
+CACHED_PROMPT_PRICE_FACTOR = 0.5
+
+NO_ENDPOINT = '-'
+LATENCY_SAMPLES = 500
+
+_lock = threading.Lock()
+_local = threading.local()
+_started_at = time.time()
+
+
+def _new_call_stats():
+    return {
+        'calls': 0,
+        'errors': 0,
+        'cache_hits': 0,
+        'retries': 0,
+        'prompt_tokens': 0,
+        'cached_prompt_tokens': 0,
+        'completion_tokens': 0,
+        'cost_usd': 0.0,
+        'latency_total': 0.0,
+        'latency_max': 0.0,
+        'latencies': deque(maxlen=LATENCY_SAMPLES),
+    }
+
+
+def _new_endpoint_stats():
+    return {
+        'requests': 0,
+        'model_calls': 0,
+        'retries': 0,
+        'fallbacks': 0,
+        'requests_with_fallback': 0,
+        'duration_total': 0.0,
+    }
+
+
+_calls = defaultdict(_new_call_stats)          # (endpoint, template, model) -> stats
+_endpoints = defaultdict(_new_endpoint_stats)  # endpoint -> stats
+_fallbacks = defaultdict(int)                  # (endpoint, fallback name) -> count
+
+
+def estimate_cost(model, prompt_tokens, completion_tokens, cached_prompt_tokens=0):
+    """Estimated USD cost of a call, 0.0 for models without a known price"""
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        # Dated snapshots such as gpt-4o-mini-2024-07-18 share the base model price
+        for name in sorted(MODEL_PRICING, key=len, reverse=True):
+            if model.startswith(name):
+                pricing = MODEL_PRICING[name]
+                break
+    if pricing is None:
+        return 0.0
+    billed_prompt_tokens = prompt_tokens - cached_prompt_tokens * (1 - CACHED_PROMPT_PRICE_FACTOR)
+    return (billed_prompt_tokens * pricing[0] + completion_tokens * pricing[1]) / 1_000_000
+
+
+def current_endpoint():
+    """Endpoint of the request being handled on this thread"""
+    context = getattr(_local, 'context', None)
+    return context['endpoint'] if context else NO_ENDPOINT
+
+
+def current_context():
+    """Request context of this thread, to hand to work done on other threads"""
+    return getattr(_local, 'context', None)
+
+
+@contextmanager
+def use_context(context):
+    """Attribute calls made on another thread (e.g. a hedged request) to an existing request context"""
+    previous = getattr(_local, 'context', None)
+    _local.context = context
+    try:
+        yield context
+    finally:
+        _local.context = previous
+
+
+@contextmanager
+def track_request(endpoint):
+    """Attribute model calls and fallbacks made inside the block to endpoint"""
+    previous = getattr(_local, 'context', None)
+    context = {'endpoint': endpoint, 'attempt': 1, 'calls': 0, 'retries': 0, 'fallbacks': 0}
+    _local.context = context
+    started = time.monotonic()
+    try:
+        yield context
+    finally:
+        _local.context = previous
+        duration = time.monotonic() - started
+        # Requests that never touched the model are not interesting here
+        if context['calls'] or context['fallbacks']:
+            with _lock:
+                stats = _endpoints[endpoint]
+                stats['requests'] += 1
+                stats['model_calls'] += context['calls']
+                stats['retries'] += context['retries']
+                stats['fallbacks'] += context['fallbacks']
+                stats['duration_total'] += duration
+                if context['fallbacks']:
+                    stats['requests_with_fallback'] += 1
+
+
+def mark_attempt(attempt):
+    """
+    Tag the following model calls of this request with a retry attempt number
+
+    Used by retry loops that sit several functions above the actual model call.
+    """
+    context = getattr(_local, 'context', None)
+    if context is not None:
+        context['attempt'] = attempt
+
+
+def record_call(template, model, latency, prompt_tokens=0, completion_tokens=0,
+                attempt=1, cache_hit=False, error=False, cached_prompt_tokens=0):
+    """
+    Record one model call (or cache hit standing in for one)
+
+    Args:
+        template (str): Prompt template id, e.g. 'phonics.generate_single_batch'
+        model (str): Model name
+        latency (float): Seconds spent waiting for the response
+        prompt_tokens (int): Prompt tokens reported by the provider
+        completion_tokens (int): Completion tokens reported by the provider
+        attempt (int): 1 for the first try, higher for retries
+        cache_hit (bool): Served from the AI cache without calling the model
+        error (bool): The call raised
+        cached_prompt_tokens (int): Prompt tokens the provider served from its prompt cache
+    """
+    context = getattr(_local, 'context', None)
+    endpoint = context['endpoint'] if context else NO_ENDPOINT
+    if context is not None:
+        attempt = max(attempt, context['attempt'])
+    is_retry = attempt > 1
+    cost = estimate_cost(model, prompt_tokens, completion_tokens, cached_prompt_tokens)
+
+    with _lock:
+        stats = _calls[(endpoint, template, model)]
+        stats['calls'] += 1
+        stats['errors'] += int(error)
+        stats['cache_hits'] += int(cache_hit)
+        stats['retries'] += int(is_retry)
+        stats['prompt_tokens'] += prompt_tokens
+        stats['cached_prompt_tokens'] += cached_prompt_tokens
+        stats['completion_tokens'] += completion_tokens
+        stats['cost_usd'] += cost
+        stats['latency_total'] += latency
+        stats['latency_max'] = max(stats['latency_max'], latency)
+        stats['latencies'].append(latency)
+
+    if context is not None and not cache_hit:
+        context['calls'] += 1
+        context['retries'] += int(is_retry)
+
+
+def record_fallback(name):
+    """Record that a non-AI fallback path produced the response"""
+    context = getattr(_local, 'context', None)
+    endpoint = context['endpoint'] if context else NO_ENDPOINT
+    if context is not None:
+        context['fallbacks'] += 1
+    with _lock:
+        _fallbacks[(endpoint, name)] += 1
+
+
+def _percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def get_report():
+    """
+    Aggregated telemetry for the metrics endpoint and the ai_report command
+
+    Returns:
+        dict: totals, per-endpoint, per-call-site and fallback breakdowns
+    """
+    with _lock:
+        calls = {key: dict(stats, latencies=list(stats['latencies'])) for key, stats in _calls.items()}
+        endpoints = {key: dict(stats) for key, stats in _endpoints.items()}
+        fallbacks = dict(_fallbacks)
+
+    call_rows = []
+    totals = {
+        'calls': 0, 'errors': 0, 'cache_hits': 0, 'retries': 0,
+        'prompt_tokens': 0, 'cached_prompt_tokens': 0, 'completion_tokens': 0, 'cost_usd': 0.0,
+        'fallbacks': sum(fallbacks.values()),
+    }
+    for (endpoint, template, model), stats in sorted(calls.items()):
+        calls_made = stats['calls'] - stats['cache_hits']
+        call_rows.append({
+            'endpoint': endpoint,
+            'template': template,
+            'model': model,
+            'calls': stats['calls'],
+            'errors': stats['errors'],
+            'cache_hits': stats['cache_hits'],
+            'retries': stats['retries'],
+            'prompt_tokens': stats['prompt_tokens'],
+            'cached_prompt_tokens': stats['cached_prompt_tokens'],
+            'completion_tokens': stats['completion_tokens'],
+            'cost_usd': round(stats['cost_usd'], 6),
+            'avg_latency_ms': round(stats['latency_total'] / stats['calls'] * 1000, 1) if stats['calls'] else 0.0,
+            'p95_latency_ms': round(_percentile(stats['latencies'], 0.95) * 1000, 1),
+            'max_latency_ms': round(stats['latency_max'] * 1000, 1),
+            'avg_prompt_tokens': round(stats['prompt_tokens'] / calls_made, 1) if calls_made else 0.0,
+            'avg_completion_tokens': round(stats['completion_tokens'] / calls_made, 1) if calls_made else 0.0,
+            'prompt_cache_rate': round(stats['cached_prompt_tokens'] / stats['prompt_tokens'], 4)
+            if stats['prompt_tokens'] else 0.0,
+        })
+        for key in ('calls', 'errors', 'cache_hits', 'retries', 'prompt_tokens', 'cached_prompt_tokens',
+                    'completion_tokens', 'cost_usd'):
+            totals[key] += stats[key]
+    totals['cost_usd'] = round(totals['cost_usd'], 6)
+
+    endpoint_rows = []
+    for endpoint, stats in sorted(endpoints.items()):
+        requests = stats['requests']
+        endpoint_rows.append({
+            'endpoint': endpoint,
+            'requests': requests,
+            'model_calls': stats['model_calls'],
+            'calls_per_request': round(stats['model_calls'] / requests, 2) if requests else 0.0,
+            'retries': stats['retries'],
+            'fallbacks': stats['fallbacks'],
+            'fallback_rate': round(stats['requests_with_fallback'] / requests, 4) if requests else 0.0,
+            'avg_duration_ms': round(stats['duration_total'] / requests * 1000, 1) if requests else 0.0,
+        })
+
+    fallback_rows = [
+        {'endpoint': endpoint, 'fallback': name, 'count': count}
+        for (endpoint, name), count in sorted(fallbacks.items())
+    ]
+
+    return {
+        'since': _started_at,
+        'uptime_seconds': round(time.time() - _started_at, 1),
+        'totals': totals,
+        'endpoints': endpoint_rows,
+        'calls': call_rows,
+        'fallbacks': fallback_rows,
+    }
+
+
+def reset():
+    """Clear all collected telemetry"""
+    global _started_at
+    with _lock:
+        _calls.clear()
+        _endpoints.clear()
+        _fallbacks.clear()
+        _started_at = time.time()
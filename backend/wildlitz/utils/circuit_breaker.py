@@ -0,0 +1,119 @@
+# backend/wildlitz/utils/circuit_breaker.py
+"""
+Circuit breaker for calls to an external service.
+
+closed     calls go through; consecutive failures are counted
+open       calls are rejected immediately with CircuitOpenError until
+           reset_timeout has passed, so callers go straight to their fallback
+half-open  a limited number of probe calls go through; a success closes the
+           circuit again, a failure re-opens it
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the service while the circuit is open"""
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker"""
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30, half_open_max_calls=1):
+        """
+        Args:
+            name (str): Label used in logs and stats
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds to stay open before probing
+            half_open_max_calls (int): Probe calls allowed in flight while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._short_circuited = 0
+        self._times_opened = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        # Caller holds the lock
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info(f"🟡 Circuit '{self.name}' half-open, probing")
+        return self._state
+
+    def before_call(self):
+        """
+        Reserve permission for one call
+
+        Raises:
+            CircuitOpenError: If the circuit is open or the half-open probes are taken
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return
+            self._short_circuited += 1
+        raise CircuitOpenError(f"Circuit '{self.name}' is open")
+
+    def record_success(self):
+        with self._lock:
+            if self._state == HALF_OPEN:
+                logger.info(f"🟢 Circuit '{self.name}' closed again")
+            self._state = CLOSED
+            self._failures = 0
+            self._probes_in_flight = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._times_opened += 1
+                    logger.warning(
+                        f"🔴 Circuit '{self.name}' opened after {self._failures} consecutive failure(s), "
+                        f"serving fallbacks for {self.reset_timeout}s"
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probes_in_flight = 0
+
+    def record_cancelled(self):
+        """The caller gave up on the call (e.g. its own deadline); says nothing about the service"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes_in_flight:
+                self._probes_in_flight -= 1
+
+    def stats(self):
+        with self._lock:
+            state = self._current_state()
+            return {
+                'state': state,
+                'consecutive_failures': self._failures,
+                'times_opened': self._times_opened,
+                'short_circuited': self._short_circuited,
+                'retry_in_seconds': round(max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at)), 1)
+                if state == OPEN else 0.0,
+            }
@@ -0,0 +1,138 @@
+# backend/wildlitz/utils/deadline.py
+"""
+Request-scoped time budgets.
+
+RequestDeadlineMiddleware opens a deadline for every request from a
+per-endpoint budget (REQUEST_TIME_BUDGETS, default REQUEST_TIME_BUDGET_SECONDS).
+Downstream calls read what is left of it:
+
+- utils.ai_client caps each model call's timeout at the remaining budget and
+  raises DeadlineExceeded instead of calling once it is spent
+- Supabase clients passed through bind_supabase() cap their HTTP timeouts
+  the same way
+- retry loops check expired() and return their best result so far (topped up
+  with fallbacks) instead of starting another attempt
+
+Code running outside a request has no deadline: remaining() returns None.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class DeadlineExceeded(Exception):
+    """Raised instead of starting a call once the request's time budget is spent"""
+
+
+@contextmanager
+def request_deadline(seconds=None, at=None):
+    """
+    Run the block under a deadline
+
+    A nested deadline can only shorten the one already in effect.
+
+    Args:
+        seconds (float): Budget from now
+        at (float): Absolute time.monotonic() deadline, e.g. to carry a request's
+            deadline into its streaming response
+
+    Yields:
+        float: Absolute deadline in effect
+    """
+    previous = getattr(_local, 'deadline', None)
+    deadline = at if at is not None else time.monotonic() + seconds
+    if previous is not None:
+        deadline = min(deadline, previous)
+    _local.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _local.deadline = previous
+
+
+def current_deadline():
+    """Absolute deadline of this thread's request, or None"""
+    return getattr(_local, 'deadline', None)
+
+
+def remaining():
+    """Seconds left in the request's budget (never negative), or None without a deadline"""
+    deadline = getattr(_local, 'deadline', None)
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def expired():
+    """True once the request's budget is spent"""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check(label='call'):
+    """
+    Raises:
+        DeadlineExceeded: If the request's budget is spent
+    """
+    if expired():
+        raise DeadlineExceeded(f"Request time budget spent before {label}")
+
+
+def clamp_timeout(timeout, label='call'):
+    """
+    Cap a call timeout at the remaining budget
+
+    Args:
+        timeout (float): Timeout the call would use on its own (None = no limit)
+        label (str): Name of the call for the error message
+
+    Returns:
+        tuple: (timeout to use, True if the deadline is what limits it)
+
+    Raises:
+        DeadlineExceeded: If the request's budget is already spent
+    """
+    left = remaining()
+    if left is None:
+        return timeout, False
+    if left <= 0:
+        raise DeadlineExceeded(f"Request time budget spent before {label}")
+    if timeout is None or left < timeout:
+        return left, True
+    return timeout, False
+
+
+def _limit_http_request(request):
+    """httpx request hook: cap the request's timeouts at the remaining budget"""
+    left = remaining()
+    if left is None:
+        return
+    if left <= 0:
+        raise DeadlineExceeded(f"Request time budget spent before {request.method} {request.url.path}")
+    timeouts = request.extensions.get('timeout') or dict.fromkeys(('connect', 'read', 'write', 'pool'))
+    request.extensions['timeout'] = {
+        name: left if value is None else min(value, left)
+        for name, value in timeouts.items()
+    }
+
+
+def bind_supabase(client):
+    """
+    Make a Supabase client's table and RPC queries respect the request deadline
+
+    Returns:
+        The same client
+    """
+    try:
+        hooks = client.postgrest.session.event_hooks
+        hooks['request'] = [*hooks['request'], _limit_http_request]
+        client.postgrest.session.event_hooks = hooks
+    except AttributeError as e:
+        logger.warning(f"⚠️ Could not attach request deadline to Supabase client: {str(e)}")
+    return client
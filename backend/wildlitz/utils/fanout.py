@@ -0,0 +1,159 @@
+# backend/wildlitz/utils/fanout.py
+"""
+Running independent model calls of one request at the same time.
+
+Calls run on short-lived threads that carry the request's telemetry context,
+deadline and AI priority class, so they are attributed, bounded and
+scheduled exactly as if the request thread had made them.
+
+gather_until() hands each result to the caller as soon as it arrives and
+stops waiting once the caller has enough. Calls that have not started are
+cancelled; calls already running see cancelled() turn true and are expected
+to stop early (a streamed completion closes its stream). A non-streamed
+completion cannot be stopped and runs to the end; its result is discarded.
+
+If no call of a wave could run because the circuit is open or the time
+budget is spent, gather_until raises that error instead of reporting an
+empty wave, so retry loops stop.
+
+Each thread closes its database connections when it ends: Django's
+request_finished cleanup never runs on these threads, and with
+CONN_MAX_AGE a connection opened there (AI cache lookups, word bank
+writes) would otherwise stay open until the thread is collected.
+"""
+
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from django.db import connections
+
+from utils import ai_scheduler, ai_telemetry, deadline
+from utils.circuit_breaker import CircuitOpenError
+from utils.deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean no call of a wave could have succeeded
+STOP_ERRORS = (CircuitOpenError, DeadlineExceeded)
+
+_local = threading.local()
+
+
+def cancelled():
+    """True once the gather_until() running this call (or an enclosing one) no longer needs its result"""
+    return any(event.is_set() for event in getattr(_local, 'cancel_events', ()))
+
+
+def in_request_context(fn, cancel_event=None):
+    """
+    Wrap fn so it runs with the calling thread's telemetry context, deadline,
+    priority and cancellation
+
+    Args:
+        cancel_event (threading.Event): Makes cancelled() true inside fn once set
+    """
+    telemetry_context = ai_telemetry.current_context()
+    request_deadline = deadline.current_deadline()
+    priority = ai_scheduler.current_priority()
+    cancel_events = getattr(_local, 'cancel_events', ())
+    if cancel_event is not None:
+        cancel_events += (cancel_event,)
+
+    def run():
+        outer_events = getattr(_local, 'cancel_events', ())
+        _local.cancel_events = cancel_events
+        try:
+            with ai_telemetry.use_context(telemetry_context):
+                if priority is not None:
+                    with ai_scheduler.priority_class(priority):
+                        return _run_with_deadline(fn, request_deadline)
+                return _run_with_deadline(fn, request_deadline)
+        finally:
+            _local.cancel_events = outer_events
+    return run
+
+
+def _run_with_deadline(fn, request_deadline):
+    if request_deadline is None:
+        return fn()
+    with deadline.request_deadline(at=request_deadline):
+        return fn()
+
+
+def start(fn, name='ai-fanout'):
+    """Run fn on its own daemon thread and return a Future for its result"""
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            connections.close_all()
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+def gather_until(calls, on_result, until=None):
+    """
+    Run calls concurrently and feed their results back as they complete
+
+    on_result runs on the calling thread, one result at a time, so it can
+    update shared state without locks.
+
+    Args:
+        calls (list): Zero-argument callables; long ones should check cancelled()
+        on_result (callable): on_result(index, result) for each call that returned
+        until (callable): Stop waiting as soon as until() is true
+
+    Returns:
+        int: Number of calls whose results were handed to on_result
+
+    Raises:
+        CircuitOpenError, DeadlineExceeded: If no call returned and one failed with it
+    """
+    if len(calls) == 1:
+        # Nothing to overlap: run on this thread
+        try:
+            result = calls[0]()
+        except STOP_ERRORS:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ Concurrent call 1/1 failed: {str(e)}")
+            return 0
+        on_result(0, result)
+        return 1
+
+    cancel_event = threading.Event()
+    futures = {start(in_request_context(call, cancel_event)): index for index, call in enumerate(calls)}
+    pending = set(futures)
+    handled = 0
+    stop_error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in sorted(done, key=futures.get):
+            index = futures[future]
+            error = future.exception()
+            if error is not None:
+                logger.warning(f"⚠️ Concurrent call {index + 1}/{len(calls)} failed: {str(error)}")
+                if isinstance(error, STOP_ERRORS):
+                    stop_error = error
+                continue
+            on_result(index, future.result())
+            handled += 1
+
+        if pending and until is not None and until():
+            cancel_event.set()
+            for future in pending:
+                future.cancel()
+            logger.info(f"⚡ Enough results after {handled}/{len(calls)} calls, cancelling {len(pending)}")
+            break
+
+    if handled == 0 and stop_error is not None:
+        raise stop_error
+    return handled
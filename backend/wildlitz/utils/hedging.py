@@ -0,0 +1,203 @@
+# backend/wildlitz/utils/hedging.py
+"""
+Hedged requests for short, interactive model calls.
+
+The first request is sent straight away. If it has not answered within the
+call site's rolling p90 latency, an identical second request is sent and
+whichever answers first is used. The other is aborted through its Attempt:
+the request streams its completion and registers the stream's close() as
+its abort hook, so the losing completion stops on the provider side instead
+of running to the end. Hedges are capped at AI_HEDGE_MAX_RATE of recent
+calls so a slow provider does not double the load, and are skipped when the
+request's time budget could not cover one.
+
+Attempts run on short-lived threads (utils.fanout) that carry the caller's
+telemetry context and request deadline.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import partial
+
+from django.conf import settings
+
+from utils import deadline
+from utils.fanout import in_request_context, start
+
+logger = logging.getLogger(__name__)
+
+LATENCY_SAMPLES = 200
+MIN_SAMPLES = 20  # no hedging until the p90 is meaningful
+RATE_WINDOW = 200
+
+
+class AttemptAbandoned(Exception):
+    """Raised by a hedged attempt that stopped because the other attempt answered"""
+
+
+class Attempt:
+    """Abort hook for one hedged attempt"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._aborted = False
+        self._closers = []
+
+    @property
+    def aborted(self):
+        return self._aborted
+
+    def on_abort(self, closer):
+        """Run closer (e.g. the stream's close) when the attempt is aborted, right away if it already is"""
+        with self._lock:
+            if not self._aborted:
+                self._closers.append(closer)
+                return
+        closer()
+
+    def abort(self):
+        with self._lock:
+            self._aborted = True
+            closers, self._closers = self._closers, []
+        for closer in closers:
+            try:
+                closer()
+            except Exception as e:
+                logger.debug(f"Closing an abandoned hedge attempt failed: {str(e)}")
+
+
+class Hedger:
+    """Per-key rolling latency and hedge-rate bookkeeping"""
+
+    def __init__(self, max_rate=0.1, min_delay=0.3):
+        """
+        Args:
+            max_rate (float): Max share of recent calls that may send a hedge
+            min_delay (float): Never hedge sooner than this many seconds
+        """
+        self.max_rate = max_rate
+        self.min_delay = min_delay
+        self._lock = threading.Lock()
+        self._latencies = {}  # key -> deque of primary latencies
+        self._recent = deque(maxlen=RATE_WINDOW)  # True for calls that sent a hedge
+        self._stats = {'calls': 0, 'hedged': 0, 'hedge_wins': 0, 'rate_capped': 0, 'aborted': 0}
+
+    def _record_latency(self, key, latency):
+        with self._lock:
+            self._latencies.setdefault(key, deque(maxlen=LATENCY_SAMPLES)).append(latency)
+
+    def hedge_delay(self, key):
+        """Seconds to wait before hedging, or None while there are too few samples"""
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        p90 = samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+        return max(p90, self.min_delay)
+
+    def _reserve_hedge(self):
+        with self._lock:
+            if sum(self._recent) >= self.max_rate * len(self._recent):
+                self._stats['rate_capped'] += 1
+                return False
+            self._stats['hedged'] += 1
+            return True
+
+    def call(self, key, fn):
+        """
+        Run fn(), hedging it with a second fn() if it is slower than the key's p90
+
+        Args:
+            key (str): Latency bucket, e.g. template and model
+            fn (callable): fn(attempt) makes the request and must be safe to run twice.
+                attempt is None when the call cannot be hedged; otherwise fn registers
+                how to stop the request with attempt.on_abort() and raises
+                AttemptAbandoned once aborted
+
+        Returns:
+            The first successful result. If both attempts fail, the first attempt's error is raised.
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+
+        delay = self.hedge_delay(key)
+        left = deadline.remaining()
+        if delay is None or (left is not None and left <= delay):
+            # Not enough history (or time) to hedge; still learn the latency
+            started = time.monotonic()
+            result = fn(None)
+            self._record_latency(key, time.monotonic() - started)
+            with self._lock:
+                self._recent.append(False)
+            return result
+
+        attempts = {}
+        started = time.monotonic()
+
+        def record_primary(future):
+            # Recorded even if the hedge wins (as the time until it was aborted), so
+            # the p90 is not biased towards fast answers
+            if not future.cancelled() and (future.exception() is None
+                                           or isinstance(future.exception(), AttemptAbandoned)):
+                self._record_latency(key, time.monotonic() - started)
+
+        def launch():
+            attempt = Attempt()
+            future = start(in_request_context(partial(fn, attempt)), name='ai-hedge')
+            attempts[future] = attempt
+            return future
+
+        primary = launch()
+        primary.add_done_callback(record_primary)
+
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._reserve_hedge():
+            with self._lock:
+                self._recent.append(False)
+            return primary.result()
+
+        with self._lock:
+            self._recent.append(True)
+        logger.info(f"🪁 Hedging '{key}' after {delay:.2f}s")
+        hedge = launch()
+
+        pending = {primary, hedge}
+        first_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                        attempts[loser].abort()
+                        with self._lock:
+                            self._stats['aborted'] += 1
+                    if future is hedge:
+                        with self._lock:
+                            self._stats['hedge_wins'] += 1
+                    return future.result()
+                if future is primary or first_error is None:
+                    first_error = future.exception()
+        raise first_error
+
+    def stats(self):
+        """Counters and current hedge delay per key for the metrics report"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['hedge_rate'] = round(sum(self._recent) / len(self._recent), 4) if self._recent else 0.0
+            stats['hedge_after_ms'] = {}
+            keys = list(self._latencies)
+        for key in keys:
+            delay = self.hedge_delay(key)
+            if delay is not None:
+                stats['hedge_after_ms'][key] = round(delay * 1000, 1)
+        return stats
+
+
+hedger = Hedger(
+    max_rate=getattr(settings, 'AI_HEDGE_MAX_RATE', 0.1),
+    min_delay=getattr(settings, 'AI_HEDGE_MIN_DELAY_SECONDS', 0.3),
+)
@@ -0,0 +1,191 @@
+# backend/wildlitz/utils/json_stream.py
+"""
+Incremental JSON scanning for streamed model output.
+
+The scanner is fed raw completion chunks as they arrive and reports string
+values the moment they close, tagged with their path inside the document
+(e.g. ('story', 'episodes', 0, 'title')). Watched string fields can also be
+reported line by line while they are still being written, which lets story
+paragraphs reach the client long before the whole JSON object is complete.
+Elements of watched arrays are reported as raw JSON text as soon as each one
+closes, so a caller can validate them one by one and stop the stream early.
+"""
+
+_ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+}
+
+
+class StreamingJSONScanner:
+    """
+    Push-based scanner that tracks the current JSON path across chunks
+
+    Anything before the first '{' or '[' (such as a markdown fence) is skipped.
+    """
+
+    def __init__(self, paragraph_paths=None, element_paths=None):
+        """
+        Args:
+            paragraph_paths (callable): Predicate on a path; matching string values
+                are also reported one completed line at a time
+            element_paths (callable): Predicate on the path of an array; its object
+                and array elements are reported as raw JSON text when they close
+        """
+        self.paragraph_paths = paragraph_paths or (lambda path: False)
+        self.element_paths = element_paths or (lambda path: False)
+        self.raw = []
+        self._offset = 0          # chars consumed so far across all chunks
+        self._started = False
+        self._finished = False
+        self._stack = []          # [container_type, current_key_or_index, expecting_key, start_offset]
+        self._in_string = False
+        self._string_is_key = False
+        self._string_chars = []
+        self._escape = None       # None, '' (after backslash) or partial \\u digits
+        self._emitted_upto = 0    # chars of the current string already reported as lines
+        self._line_index = 0
+
+    @property
+    def finished(self):
+        """True once the top-level value has been closed"""
+        return self._finished
+
+    def text(self):
+        """Everything received so far"""
+        return ''.join(self.raw)
+
+    def _path(self):
+        return tuple(frame[1] for frame in self._stack)
+
+    def feed(self, chunk):
+        """
+        Consume a chunk of completion text
+
+        Returns:
+            list: Events as tuples:
+                ('line', path, index, text) for each completed line of a watched string
+                ('string', path, value) for every string value that closed
+                ('element', array_path, index, json_text) for every element of a
+                watched array that closed
+        """
+        events = []
+        self.raw.append(chunk)
+
+        for offset, char in enumerate(chunk, self._offset):
+            if self._finished:
+                break
+
+            if not self._started:
+                if char in '{[':
+                    self._started = True
+                    self._open(char, offset)
+                continue
+
+            if self._in_string:
+                self._consume_string_char(char, events)
+                continue
+
+            if char == '"':
+                frame = self._stack[-1]
+                self._in_string = True
+                self._string_is_key = frame[0] == 'object' and frame[2]
+                self._string_chars = []
+                self._emitted_upto = 0
+                self._line_index = 0
+            elif char in '{[':
+                self._open(char, offset)
+            elif char in '}]':
+                start = self._stack.pop()[3]
+                if not self._stack:
+                    self._finished = True
+                elif self._stack[-1][0] == 'array':
+                    self._check_element(start, offset, events)
+            elif char == ':':
+                self._stack[-1][2] = False
+            elif char == ',':
+                frame = self._stack[-1]
+                if frame[0] == 'object':
+                    frame[2] = True
+                else:
+                    frame[1] += 1
+
+        self._offset += len(chunk)
+        return events
+
+    def _open(self, char, offset):
+        if char == '{':
+            self._stack.append(['object', None, True, offset])
+        else:
+            self._stack.append(['array', 0, False, offset])
+
+    def _check_element(self, start, end, events):
+        array_path = tuple(frame[1] for frame in self._stack[:-1])
+        if not self.element_paths(array_path):
+            return
+        text = self.text()
+        events.append(('element', array_path, self._stack[-1][1], text[start:end + 1]))
+
+    def _consume_string_char(self, char, events):
+        if self._escape is not None:
+            if self._escape == '' and char != 'u':
+                self._string_chars.append(_ESCAPES.get(char, char))
+                self._escape = None
+            else:
+                self._escape += char
+                # 'u' followed by four hex digits
+                if len(self._escape) == 5:
+                    try:
+                        self._string_chars.append(chr(int(self._escape[1:], 16)))
+                    except ValueError:
+                        pass
+                    self._escape = None
+            self._check_lines(events)
+            return
+
+        if char == '\\':
+            self._escape = ''
+            return
+
+        if char == '"':
+            self._close_string(events)
+            return
+
+        self._string_chars.append(char)
+        if char == '\n':
+            self._check_lines(events)
+
+    def _check_lines(self, events):
+        if self._string_is_key or not self._string_chars or self._string_chars[-1] != '\n':
+            return
+        path = self._path()
+        if not self.paragraph_paths(path):
+            return
+        value = ''.join(self._string_chars)
+        line = value[self._emitted_upto:].strip()
+        self._emitted_upto = len(value)
+        if line:
+            events.append(('line', path, self._line_index, line))
+            self._line_index += 1
+
+    def _close_string(self, events):
+        value = ''.join(self._string_chars)
+        self._in_string = False
+        frame = self._stack[-1]
+
+        if self._string_is_key:
+            frame[1] = value
+            return
+
+        path = self._path()
+        if self.paragraph_paths(path):
+            line = value[self._emitted_upto:].strip()
+            if line:
+                events.append(('line', path, self._line_index, line))
+        events.append(('string', path, value))
@@ -0,0 +1,114 @@
+# backend/wildlitz/utils/middleware.py
+"""
+Request middleware shared by the game modules.
+"""
+
+from django.conf import settings
+from django.urls import Resolver404, resolve
+
+from utils import ai_scheduler, ai_telemetry, deadline
+
+
+def resolve_endpoint(request):
+    """Resolved URL name of the request (falling back to the view function name)"""
+    try:
+        match = resolve(request.path_info)
+    except Resolver404:
+        return ai_telemetry.NO_ENDPOINT
+    return match.url_name or getattr(match.func, '__name__', ai_telemetry.NO_ENDPOINT)
+
+
+class AITelemetryMiddleware:
+    """
+    Attributes model calls and fallbacks to the endpoint that triggered them
+
+    The endpoint is the resolved URL name (falling back to the view function
+    name). Streaming responses get the context again while their body is
+    generated, since that is when their model calls happen.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        endpoint = resolve_endpoint(request)
+
+        with ai_telemetry.track_request(endpoint):
+            response = self.get_response(request)
+
+        if getattr(response, 'streaming', False):
+            response.streaming_content = self._tracked_stream(response.streaming_content, endpoint)
+
+        return response
+
+    @staticmethod
+    def _tracked_stream(content, endpoint):
+        with ai_telemetry.track_request(endpoint):
+            yield from content
+
+
+class RequestDeadlineMiddleware:
+    """
+    Gives every request a time budget that downstream model and Supabase calls read
+
+    The budget comes from REQUEST_TIME_BUDGETS (by URL name), defaulting to
+    REQUEST_TIME_BUDGET_SECONDS. Streaming responses keep the same absolute
+    deadline while their body is generated.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        endpoint = resolve_endpoint(request)
+        budget = settings.REQUEST_TIME_BUDGETS.get(endpoint, settings.REQUEST_TIME_BUDGET_SECONDS)
+
+        with deadline.request_deadline(budget) as request_deadline:
+            response = self.get_response(request)
+
+        if getattr(response, 'streaming', False):
+            response.streaming_content = self._bounded_stream(response.streaming_content, request_deadline)
+
+        return response
+
+    @staticmethod
+    def _bounded_stream(content, request_deadline):
+        with deadline.request_deadline(at=request_deadline):
+            yield from content
+
+
+class AIPriorityMiddleware:
+    """
+    Runs the model calls of a request at its endpoint's priority class
+
+    The class comes from AI_ENDPOINT_PRIORITIES (by URL name); endpoints not
+    listed use the class of each call's routing task. A client can send
+    X-AI-Priority: background for prefetches - the header can only lower a
+    request's priority, never raise it.
+    """
+
+    HEADER = 'HTTP_X_AI_PRIORITY'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        priority = settings.AI_ENDPOINT_PRIORITIES.get(resolve_endpoint(request))
+        if request.META.get(self.HEADER, '').strip().lower() == ai_scheduler.BACKGROUND:
+            priority = ai_scheduler.BACKGROUND
+
+        if priority is None:
+            return self.get_response(request)
+
+        with ai_scheduler.priority_class(priority):
+            response = self.get_response(request)
+
+        if getattr(response, 'streaming', False):
+            response.streaming_content = self._prioritized_stream(response.streaming_content, priority)
+
+        return response
+
+    @staticmethod
+    def _prioritized_stream(content, priority):
+        with ai_scheduler.priority_class(priority):
+            yield from content
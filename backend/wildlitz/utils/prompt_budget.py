@@ -0,0 +1,90 @@
+# backend/wildlitz/utils/prompt_budget.py
+"""
+Per-template prompt token budgets.
+
+Long prompt templates are built as a static instruction prefix followed by a
+short per-request suffix, so the provider's prompt cache can reuse the prefix.
+A budget catches a template that grows (or starts interpolating large
+request data into its prefix) before it shows up on the bill: prompts over
+budget are logged and counted in the AI telemetry report.
+
+Token counts are estimated from the message length (about 4 characters per
+token), which is close enough for a budget without a tokenizer dependency.
+The table can be overridden with AI_PROMPT_BUDGETS in settings.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4  # role and separators the provider adds per message
+
+# template id -> max estimated prompt tokens
+DEFAULT_BUDGETS = {
+    'phonics.generate_single_batch': 3500,
+    'sentence_formation.story': 2500,
+    'sentence_formation.next_episode': 2000,
+}
+
+_lock = threading.Lock()
+_overruns = {}  # template -> {'count': int, 'max_tokens': int}
+
+
+def get_budgets():
+    """Budget table in effect (settings override merged over the defaults)"""
+    budgets = dict(DEFAULT_BUDGETS)
+    budgets.update(getattr(settings, 'AI_PROMPT_BUDGETS', None) or {})
+    return budgets
+
+
+def estimate_prompt_tokens(messages):
+    """Approximate prompt token count of a list of chat messages"""
+    return sum(
+        len(str(message.get('content') or '')) // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    )
+
+
+def check_prompt_budget(template, messages):
+    """
+    Compare a prompt against its template's budget
+
+    Over-budget prompts are still sent; the overrun is logged and counted.
+
+    Returns:
+        bool: False if the prompt is over budget
+    """
+    budget = get_budgets().get(template)
+    if not budget:
+        return True
+
+    tokens = estimate_prompt_tokens(messages)
+    if tokens <= budget:
+        return True
+
+    with _lock:
+        overrun = _overruns.setdefault(template, {'count': 0, 'max_tokens': 0})
+        overrun['count'] += 1
+        overrun['max_tokens'] = max(overrun['max_tokens'], tokens)
+    logger.warning(f"⚠️ Prompt for '{template}' is ~{tokens} tokens, over its {budget} token budget")
+    return False
+
+
+def get_budget_stats():
+    """Budgets with their overrun counts for the metrics report"""
+    budgets = get_budgets()
+    with _lock:
+        overruns = {template: dict(overrun) for template, overrun in _overruns.items()}
+    return [
+        {
+            'template': template,
+            'budget_tokens': budget,
+            'overruns': overruns.get(template, {}).get('count', 0),
+            'max_overrun_tokens': overruns.get(template, {}).get('max_tokens', 0),
+        }
+        for template, budget in sorted(budgets.items())
+    ]
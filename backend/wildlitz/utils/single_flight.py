@@ -0,0 +1,84 @@
+# backend/wildlitz/utils/single_flight.py
+"""
+Single-flight coalescing of identical in-flight work.
+
+While a call for a given key is running, later callers with the same key wait
+for that result instead of starting their own. Coalescing is per process; once
+the leader finishes, cross-worker duplicates are absorbed by the AI cache.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlightCall:
+    """Result slot shared by the leader and every waiting caller"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its result"""
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {'leaders': 0, 'coalesced': 0, 'wait_timeouts': 0}
+
+    def do(self, key, fn, timeout=None):
+        """
+        Run fn() once for concurrent callers sharing the same key
+
+        Args:
+            key (str): Identity of the work, e.g. a prompt hash
+            fn (callable): Work to run if no identical call is in flight
+            timeout (float): Max seconds a waiting caller blocks on the leader
+
+        Returns:
+            The leader's result. The leader's exception is re-raised for every caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self._stats['leaders'] += 1
+            else:
+                call.waiters += 1
+                self._stats['coalesced'] += 1
+
+        if not is_leader:
+            logger.info(f"🔗 {self.name}: joined in-flight call {key[:12]}")
+            if not call.done.wait(timeout):
+                with self._lock:
+                    self._stats['wait_timeouts'] += 1
+                raise TimeoutError(f"{self.name}: timed out waiting for in-flight call")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+            if call.waiters:
+                logger.info(f"🔗 {self.name}: shared result of {key[:12]} with {call.waiters} waiting request(s)")
+
+    def stats(self):
+        """Return leader/coalesced counters and the current in-flight count"""
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._calls)}
@@ -1,7 +1,9 @@
 from supabase import create_client, Client
 from django.conf import settings
 
+from utils.deadline import bind_supabase
+
 supabase_url = settings.SUPABASE_URL
 supabase_key = settings.SUPABASE_KEY
 
-supabase: Client = create_client(supabase_url, supabase_key)
\ No newline at end of file
+supabase: Client = bind_supabase(create_client(supabase_url, supabase_key))
\ No newline at end of file
@@ -7,6 +7,7 @@ Updated for production readiness.
 import os
 from pathlib import Path
 import environ
+from corsheaders.defaults import default_headers
 
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -30,6 +31,7 @@ DEBUG = env('DEBUG')
 
 # Get OpenAI API key from .env file
 OPENAI_API_KEY = env('OPENAI_API_KEY')
+OPENAI_BASE_URL = env('OPENAI_BASE_URL', default='')  # e.g. http://127.0.0.1:8765/v1 for the ai_stub_server
 
 # Supabase configuration
 SUPABASE_URL = env('SUPABASE_URL', default='')
@@ -69,6 +71,8 @@ else:
     CORS_ALLOW_CREDENTIALS = True
     CORS_ALLOW_ALL_ORIGINS = False
 
+CORS_ALLOW_HEADERS = (*default_headers, 'x-ai-priority')
+
 CORS_ALLOW_METHODS = [
     "DELETE",
     "GET",
@@ -94,6 +98,9 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'utils.middleware.AITelemetryMiddleware',
+    'utils.middleware.RequestDeadlineMiddleware',
+    'utils.middleware.AIPriorityMiddleware',
 ]
 
 ROOT_URLCONF = 'wildlitz.urls'
@@ -275,5 +282,74 @@ if not DEBUG:
 # Request timeout
 REQUEST_TIMEOUT = 30
 
+# Per-request time budget shared by all model and Supabase calls of a request (see utils/deadline.py)
+REQUEST_TIME_BUDGET_SECONDS = env.int('REQUEST_TIME_BUDGET_SECONDS', default=REQUEST_TIMEOUT)
+REQUEST_TIME_BUDGETS = {  # URL name -> seconds, for endpoints that chain several model calls
+    'generate_vanishing_words': 50,
+    'generate_story': 45,
+    'generate_next_episode': 45,
+    'generate_story_stream': 90,
+    'generate_next_episode_stream': 90,
+}
+
+# AI response cache (opt-in per call site, see utils/ai_cache.py)
+AI_CACHE_ENABLED = env.bool('AI_CACHE_ENABLED', default=True)
+AI_CACHE_TTL_SECONDS = env.int('AI_CACHE_TTL_SECONDS', default=60 * 60 * 24 * 7)  # 7 days
+AI_CACHE_MAX_BYTES = env.int('AI_CACHE_MAX_BYTES', default=50 * 1024 * 1024)  # 50 MB
+
+# Model routing tiers (see utils/ai_routing.py for the task -> model table)
+AI_ROUTE_TIMEOUT_FACTOR = env.float('AI_ROUTE_TIMEOUT_FACTOR', default=2.0)  # hard timeout = SLO x factor
+AI_ROUTE_BREACH_LIMIT = env.int('AI_ROUTE_BREACH_LIMIT', default=3)  # consecutive SLO breaches before demotion
+AI_ROUTE_COOLDOWN_SECONDS = env.int('AI_ROUTE_COOLDOWN_SECONDS', default=60)
+
+# Circuit breaker around the model provider (see utils/circuit_breaker.py)
+AI_BREAKER_FAILURE_THRESHOLD = env.int('AI_BREAKER_FAILURE_THRESHOLD', default=5)  # consecutive failures/timeouts
+AI_BREAKER_RESET_SECONDS = env.int('AI_BREAKER_RESET_SECONDS', default=30)  # open time before probing
+AI_BREAKER_HALF_OPEN_CALLS = env.int('AI_BREAKER_HALF_OPEN_CALLS', default=1)  # concurrent probes
+
+# Hedged requests for short interactive calls (see utils/hedging.py)
+AI_HEDGE_MAX_RATE = env.float('AI_HEDGE_MAX_RATE', default=0.1)  # max share of calls that send a second request
+AI_HEDGE_MIN_DELAY_SECONDS = env.float('AI_HEDGE_MIN_DELAY_SECONDS', default=0.3)
+
+# Priority scheduling of model calls (see utils/ai_scheduler.py)
+AI_MAX_CONCURRENT_CALLS = env.int('AI_MAX_CONCURRENT_CALLS', default=8)  # model calls in flight per process
+AI_INTERACTIVE_RESERVED_SLOTS = env.int('AI_INTERACTIVE_RESERVED_SLOTS', default=2)  # slots only interactive calls take
+AI_SCHEDULER_MAX_WAIT_SECONDS = env.int('AI_SCHEDULER_MAX_WAIT_SECONDS', default=30)
+AI_PRIORITY_WEIGHTS = {'interactive': 6, 'standard': 3, 'background': 1}  # share of freed slots under contention
+AI_ENDPOINT_PRIORITIES = {  # URL name -> priority class; other endpoints go by routing task
+    'check_syllable_answer': 'interactive',
+    'explain_word': 'interactive',
+    'generate_answer_choices': 'interactive',
+    'get_word_batch': 'standard',
+    'create_custom_word': 'background',
+    'generate_example_words': 'background',
+}
+
+# Bank of validated AI phonics words served instead of calling the model (see phonics/word_bank.py)
+PHONICS_WORD_BANK_ENABLED = env.bool('PHONICS_WORD_BANK_ENABLED', default=True)
+PHONICS_WORD_BANK_MIN_WORDS = env.int('PHONICS_WORD_BANK_MIN_WORDS', default=40)  # usable words before a configuration is served
+PHONICS_WORD_BANK_MIN_ATTEMPTS = env.int('PHONICS_WORD_BANK_MIN_ATTEMPTS', default=5)  # attempts before recognition counts
+PHONICS_WORD_BANK_MIN_RECOGNITION = env.float('PHONICS_WORD_BANK_MIN_RECOGNITION', default=0.2)  # stop serving below this
+
+# Pre-validated vanishing-game word pools per configuration (see phonics/word_pools.py)
+PHONICS_WORD_POOL_ENABLED = env.bool('PHONICS_WORD_POOL_ENABLED', default=True)
+PHONICS_WORD_POOL_TARGET = env.int('PHONICS_WORD_POOL_TARGET', default=40)  # words a refill tops a pool up to
+PHONICS_WORD_POOL_LOW_WATER = env.int('PHONICS_WORD_POOL_LOW_WATER', default=15)  # refill below this many words
+PHONICS_WORD_POOL_REFILL_SECONDS = env.int('PHONICS_WORD_POOL_REFILL_SECONDS', default=120)  # time budget per refill
+PHONICS_WORD_POOL_PREWARM = env.list('PHONICS_WORD_POOL_PREWARM', default=[])  # e.g. simple_words/short_vowels/easy
+
+# Per-user phonics dashboard snapshots, dropped when the user saves a game (see phonics/analytics_cache.py)
+PHONICS_ANALYTICS_SNAPSHOT_SECONDS = env.int('PHONICS_ANALYTICS_SNAPSHOT_SECONDS', default=300)
+
+# In-memory safari_animals catalog for Sound Safari (see phonemics/animal_index.py)
+SAFARI_ANIMAL_INDEX_CHECK_SECONDS = env.int('SAFARI_ANIMAL_INDEX_CHECK_SECONDS', default=60)  # catalog change check
+SAFARI_ANIMAL_INDEX_MAX_AGE_SECONDS = env.int('SAFARI_ANIMAL_INDEX_MAX_AGE_SECONDS', default=3600)  # full reload
+
+# Prompt token budgets per template override utils/prompt_budget.py, e.g. {'sentence_formation.story': 3000}
+AI_PROMPT_BUDGETS = {}
+
+# Record every model completion as a replay fixture (see utils/ai_fixtures.py), off when empty
+AI_RECORD_DIR = env('AI_RECORD_DIR', default='')
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
\ No newline at end of file
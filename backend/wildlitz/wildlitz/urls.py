@@ -18,6 +18,8 @@ from api.views import (
     get_my_progress_summary,      # 🔥 ADD
     get_my_accuracy_over_time,    # 🔥 ADD
     get_my_most_missed_words,     # 🔥 ADD
+    get_ai_cache_stats,
+    get_ai_metrics,
 )
 
 urlpatterns = [
@@ -41,6 +43,10 @@ urlpatterns = [
     path('api/get-my-accuracy-over-time/', get_my_accuracy_over_time, name='get_my_accuracy_over_time'),
     path('api/get-my-most-missed-words/', get_my_most_missed_words, name='get_my_most_missed_words'),
     
+    # AI service metrics
+    path('api/ai/cache-stats/', get_ai_cache_stats, name='ai_cache_stats'),
+    path('api/ai/metrics/', get_ai_metrics, name='ai_metrics'),
+    
     # Your existing app URLs
     path('api/syllabification/', include('syllabification.urls')),
     path('api/phonics/', include('phonics.urls')),  # Add phonics URLs